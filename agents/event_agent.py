@@ -37,7 +37,7 @@ class EventAgent:
         logger.info(f"EventAgent.search_and_format | query={query[:80]}...")
         try:
             tool_output = await self.search_events(query)
-            response = self.llm_structured.invoke(
+            response = await self.llm_structured.ainvoke(
                 [
                     {
                         "role": "system",
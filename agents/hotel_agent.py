@@ -37,7 +37,7 @@ class HotelAgent:
         logger.info(f"HotelAgent.search_and_format | query={query[:80]}...")
         try:
             tool_output = await self.search_hotels(query)
-            response = self.llm_structured.invoke(
+            response = await self.llm_structured.ainvoke(
                 [
                     {
                         "role": "system",
@@ -44,6 +44,7 @@ class ItineraryAgent:
                 "summary": "Unable to generate summary due to error",
                 "total_estimated_cost": 0,
                 "key_recommendations": [],
+                "error": str(e),
             }
 
     def _extract_key_recommendations(self, data: Itinerary) -> list:
@@ -1,19 +1,97 @@
 import asyncio
-from typing import Any
+from functools import partial
+from typing import Any, Awaitable, Callable
 from langgraph.graph import StateGraph, START, END
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from agents import HotelAgent, TransportAgent, WeatherAgent, EventAgent, RestaurantAgent, AttractionAgent
 from agents.replanner_agent import ReplanAgent
 from agents.itinerary_agent import ItineraryAgent
-from config import MAX_AGENT_RETRIES
+from config import (
+    MAX_AGENT_RETRIES,
+    DOMAIN_CACHE_TTLS,
+    DOMAIN_CACHE_MAX_ENTRIES,
+    DOMAIN_CACHE_DB_PATH,
+    BUDGET_BUCKET_SIZE,
+    DOMAIN_BULKHEADS,
+)
 from utils.logger import get_logger
+from utils.cache import DomainCache
+from utils.bulkhead import build_bulkheads
 from models import (
     Itinerary,
     AgentResponse,
     PlannerState,
+    TripRequest,
 )
 
 logger = get_logger("PlannerAgent")
 
+DOMAINS = ["hotel", "transport", "restaurant", "weather", "event", "attraction"]
+
+# which domain nodes read each TripRequest field when building their query
+TRIP_FIELD_DOMAINS = {
+    "destination": DOMAINS,
+    "start_date": ["hotel", "transport", "weather", "event"],
+    "end_date": ["hotel", "weather", "event"],
+    "preferences": ["restaurant", "event", "attraction"],
+    "budget": ["hotel"],
+}
+
+domain_cache = DomainCache(
+    ttls=DOMAIN_CACHE_TTLS,
+    max_entries=DOMAIN_CACHE_MAX_ENTRIES,
+    db_path=DOMAIN_CACHE_DB_PATH or None,
+)
+domain_bulkheads = build_bulkheads(DOMAIN_BULKHEADS)
+
+
+def domain_cache_key(domain: str, trip: TripRequest) -> str:
+    """
+    Canonical cache key built only from the trip fields the domain's query reads.
+    """
+    parts = []
+    for field, domains in TRIP_FIELD_DOMAINS.items():
+        if domain not in domains:
+            continue
+        value = getattr(trip, field)
+        if field == "destination":
+            value = value.strip().lower()
+        elif field == "preferences":
+            value = ",".join(sorted({p.strip().lower() for p in value}))
+        elif field == "budget":
+            value = int(value // BUDGET_BUCKET_SIZE) if value is not None else "any"
+        parts.append(f"{field}={value}")
+    return "|".join(parts)
+
+
+async def search_domain(
+    domain: str,
+    state: PlannerState,
+    search: Callable[[], Awaitable[Any]],
+) -> Any:
+    """
+    Serves a domain lookup from the result cache unless the replanner asked for a
+    retry of that domain. Identical lookups already in flight (e.g. from other trips
+    in a batch) are shared instead of repeated. Only successful results are cached.
+    Lookups that reach the provider run inside the domain's bulkhead.
+    """
+    key = domain_cache_key(domain, state["trip"])
+
+    async def search_and_store() -> Any:
+        response = await domain_bulkheads[domain].run(search)
+        data = response.model_dump() if hasattr(response, "model_dump") else response
+        if isinstance(data, dict) and data.get("success"):
+            domain_cache.set(domain, key, data)
+        return data
+
+    if domain in state.get("retries", []):
+        return await search_and_store()
+
+    cached = domain_cache.get(domain, key)
+    if cached is not None:
+        return cached
+    return await domain_cache.coalesce(domain, key, search_and_store)
+
 
 def coordinator_node(state: PlannerState) -> dict[str, Any]:
     logger.info("coordinator_node entered")
@@ -24,33 +102,39 @@ def coordinator_node(state: PlannerState) -> dict[str, Any]:
     return {}
 
 
-def re_planner_node(state: PlannerState) -> dict[str, Any]:
+def re_planner_node(
+    state: PlannerState,
+    domains: tuple[str, ...] = tuple(DOMAINS),
+    max_retries: int = MAX_AGENT_RETRIES,
+) -> dict[str, Any]:
     retry_count = state.get("retry_count", 0)
     logger.info(
-        f"re_planner_node entered | retry_count={retry_count}/{MAX_AGENT_RETRIES}"
+        f"re_planner_node entered | retry_count={retry_count}/{max_retries}"
     )
 
-    if retry_count >= MAX_AGENT_RETRIES:
+    if retry_count >= max_retries:
         logger.warning(
-            f"Max retries ({MAX_AGENT_RETRIES}) reached — forcing completion"
+            f"Max retries ({max_retries}) reached — forcing completion"
         )
         return {
             "retries": [],
-            "notes": f"Max retries ({MAX_AGENT_RETRIES}) reached. Proceeding with best available data.",
+            "notes": f"Max retries ({max_retries}) reached. Proceeding with best available data.",
             "done": True,
             "retry_count": retry_count,
         }
 
     replan_agent = ReplanAgent()
     decision = replan_agent.analyze_planner_state(state)
+    # domains left out of this graph have no node to re-run
+    retries = [d for d in decision.retries if d in domains]
     logger.info(
-        f"re_planner_node decision | done={decision.done} | retries={decision.retries} | notes={decision.notes[:100]}..."
+        f"re_planner_node decision | done={decision.done} | retries={retries} | notes={decision.notes[:100]}..."
     )
 
-    new_retry_count = retry_count + (1 if decision.retries else 0)
+    new_retry_count = retry_count + (1 if retries else 0)
 
     return {
-        "retries": decision.retries,
+        "retries": retries,
         "notes": decision.notes,
         "done": decision.done,
         "retry_count": new_retry_count,
@@ -65,23 +149,16 @@ async def hotel_node(state: PlannerState) -> dict[str, Any]:
 
     logger.info("hotel_node started")
     try:
-        hotel_agent = HotelAgent()
         query = (
             f"Find hotels in {state['trip'].destination} from {state['trip'].start_date} "
             f"to {state['trip'].end_date} within budget {state['trip'].budget}"
         )
-        response = await hotel_agent.search_and_format(query)
+        data = await search_domain(
+            "hotel", state, lambda: HotelAgent().search_and_format(query)
+        )
         logger.info("hotel_node completed successfully")
         return {
-            "hotel_result": AgentResponse(
-                agent_name="hotel",
-                success=True,
-                data=(
-                    response.model_dump()
-                    if hasattr(response, "model_dump")
-                    else response
-                ),
-            )
+            "hotel_result": AgentResponse(agent_name="hotel", success=True, data=data)
         }
     except Exception as e:
         logger.error(f"hotel_node failed | error={e}")
@@ -100,23 +177,16 @@ async def transport_node(state: PlannerState) -> dict[str, Any]:
 
     logger.info("transport_node started")
     try:
-        transport_agent = TransportAgent()
         query = (
             f"Find transport options to reach {state['trip'].destination} "
             f"from the starting point on {state['trip'].start_date}"
         )
-        response = await transport_agent.search_and_format(query)
+        data = await search_domain(
+            "transport", state, lambda: TransportAgent().search_and_format(query)
+        )
         logger.info("transport_node completed successfully")
         return {
-            "transport_result": AgentResponse(
-                agent_name="transport",
-                success=True,
-                data=(
-                    response.model_dump()
-                    if hasattr(response, "model_dump")
-                    else response
-                ),
-            )
+            "transport_result": AgentResponse(agent_name="transport", success=True, data=data)
         }
     except Exception as e:
         logger.error(f"transport_node failed | error={e}")
@@ -135,23 +205,15 @@ async def restaurant_node(state: PlannerState) -> dict[str, Any]:
 
     logger.info("restaurant_node started")
     try:
-        restaurant_agent = RestaurantAgent()
-        query = (
-            f"Find restaurants in {state['trip'].destination} suitable for {state['trip'].preferences} "
-            f"during {state['trip'].start_date} to {state['trip'].end_date}"
+        preferences = ", ".join(state["trip"].preferences) if state["trip"].preferences else "any cuisine"
+        # restaurant searches take no dates, so the query (and cache key) leaves them out
+        query = f"Find restaurants in {state['trip'].destination} for preferences: {preferences}"
+        data = await search_domain(
+            "restaurant", state, lambda: RestaurantAgent().search_and_format(query)
         )
-        response = await restaurant_agent.search_and_format(query)
         logger.info("restaurant_node completed successfully")
         return {
-            "restaurant_result": AgentResponse(
-                agent_name="restaurant",
-                success=True,
-                data=(
-                    response.model_dump()
-                    if hasattr(response, "model_dump")
-                    else response
-                ),
-            )
+            "restaurant_result": AgentResponse(agent_name="restaurant", success=True, data=data)
         }
     except Exception as e:
         logger.error(f"restaurant_node failed | error={e}")
@@ -170,23 +232,16 @@ async def weather_node(state: PlannerState) -> dict[str, Any]:
 
     logger.info("weather_node started")
     try:
-        weather_agent = WeatherAgent()
         query = (
             f"Provide weather forecast for {state['trip'].destination} "
             f"from {state['trip'].start_date} to {state['trip'].end_date}"
         )
-        response = await weather_agent.search_and_format(query)
+        data = await search_domain(
+            "weather", state, lambda: WeatherAgent().search_and_format(query)
+        )
         logger.info("weather_node completed successfully")
         return {
-            "weather_result": AgentResponse(
-                agent_name="weather",
-                success=True,
-                data=(
-                    response.model_dump()
-                    if hasattr(response, "model_dump")
-                    else response
-                ),
-            )
+            "weather_result": AgentResponse(agent_name="weather", success=True, data=data)
         }
     except Exception as e:
         logger.error(f"weather_node failed | error={e}")
@@ -205,23 +260,18 @@ async def event_node(state: PlannerState) -> dict[str, Any]:
 
     logger.info("event_node started")
     try:
-        event_agent = EventAgent()
         query = (
             f"Find events happening in {state['trip'].destination} "
             f"during {state['trip'].start_date} to {state['trip'].end_date}"
         )
-        response = await event_agent.search_and_format(query)
+        if state["trip"].preferences:
+            query += f" for preferences: {', '.join(state['trip'].preferences)}"
+        data = await search_domain(
+            "event", state, lambda: EventAgent().search_and_format(query)
+        )
         logger.info("event_node completed successfully")
         return {
-            "event_result": AgentResponse(
-                agent_name="event",
-                success=True,
-                data=(
-                    response.model_dump()
-                    if hasattr(response, "model_dump")
-                    else response
-                ),
-            )
+            "event_result": AgentResponse(agent_name="event", success=True, data=data)
         }
     except Exception as e:
         logger.error(f"event_node failed | error={e}")
@@ -240,24 +290,17 @@ async def attraction_node(state: PlannerState) -> dict[str, Any]:
 
     logger.info("attraction_node started")
     try:
-        attraction_agent = AttractionAgent()
         preferences = ", ".join(state["trip"].preferences) if state["trip"].preferences else "general sightseeing"
         query = (
             f"Find popular tourist attractions in {state['trip'].destination} "
             f"for preferences: {preferences}"
         )
-        response = await attraction_agent.search_and_format(query)
+        data = await search_domain(
+            "attraction", state, lambda: AttractionAgent().search_and_format(query)
+        )
         logger.info("attraction_node completed successfully")
         return {
-            "attraction_result": AgentResponse(
-                agent_name="attraction",
-                success=True,
-                data=(
-                    response.model_dump()
-                    if hasattr(response, "model_dump")
-                    else response
-                ),
-            )
+            "attraction_result": AgentResponse(agent_name="attraction", success=True, data=data)
         }
     except Exception as e:
         logger.error(f"attraction_node failed | error={e}")
@@ -347,12 +390,14 @@ async def itinerary_node(state: PlannerState) -> dict[str, Any]:
         }
 
 
-def route_after_replanner(state: PlannerState) -> str:
+def route_after_replanner(
+    state: PlannerState, max_retries: int = MAX_AGENT_RETRIES
+) -> str:
     retries = state.get("retries", [])
     done = state.get("done", False)
     retry_count = state.get("retry_count", 0)
 
-    if done or retry_count >= MAX_AGENT_RETRIES:
+    if done or retry_count >= max_retries:
         logger.info(
             f"route_after_replanner -> aggregator | done={done} | retry_count={retry_count}"
         )
@@ -366,48 +411,113 @@ def route_after_replanner(state: PlannerState) -> str:
     return "aggregator"
 
 
-logger.info("Building travel planner graph...")
-
-graph = StateGraph(PlannerState)
-
-graph.add_node("coordinator", coordinator_node)
-graph.add_node("transport", transport_node)
-graph.add_node("hotels", hotel_node)
-graph.add_node("restaurants", restaurant_node)
-graph.add_node("weather", weather_node)
-graph.add_node("events", event_node)
-graph.add_node("attractions", attraction_node)
-graph.add_node("aggregator", aggregator_node)
-graph.add_node("replanner", re_planner_node)
-graph.add_node("itinerary", itinerary_node)
-
-graph.add_edge(START, "coordinator")
-
-graph.add_edge("coordinator", "transport")
-graph.add_edge("coordinator", "hotels")
-graph.add_edge("coordinator", "restaurants")
-graph.add_edge("coordinator", "weather")
-graph.add_edge("coordinator", "events")
-graph.add_edge("coordinator", "attractions")
-
-graph.add_edge("transport", "replanner")
-graph.add_edge("hotels", "replanner")
-graph.add_edge("restaurants", "replanner")
-graph.add_edge("weather", "replanner")
-graph.add_edge("events", "replanner")
-graph.add_edge("attractions", "replanner")
-
-graph.add_conditional_edges(
-    "replanner",
-    route_after_replanner,
-    {
-        "aggregator": "aggregator",
-        "coordinator": "coordinator",
-    },
-)
-
-graph.add_edge("aggregator", "itinerary")
-graph.add_edge("itinerary", END)
+def changed_trip_fields(old_trip: TripRequest, new_trip: TripRequest) -> list[str]:
+    changed = []
+    for field in TRIP_FIELD_DOMAINS:
+        old_value = getattr(old_trip, field)
+        new_value = getattr(new_trip, field)
+        if field == "preferences":
+            old_value = sorted(p.strip().lower() for p in old_value)
+            new_value = sorted(p.strip().lower() for p in new_value)
+        elif field == "destination":
+            old_value = old_value.strip().lower()
+            new_value = new_value.strip().lower()
+        if old_value != new_value:
+            changed.append(field)
+    return changed
+
+
+def affected_domains(old_trip: TripRequest, new_trip: TripRequest) -> list[str]:
+    changed = changed_trip_fields(old_trip, new_trip)
+    affected = {d for field in changed for d in TRIP_FIELD_DOMAINS[field]}
+    logger.info(f"affected_domains | changed={changed} | affected={sorted(affected)}")
+    return [d for d in DOMAINS if d in affected]
+
+
+def itinerary_failed(final_itinerary: Any) -> bool:
+    if not final_itinerary or isinstance(final_itinerary, str):
+        return True
+    return bool(final_itinerary.get("error"))
+
+
+# domain -> (graph node name, node function)
+DOMAIN_NODES = {
+    "hotel": ("hotels", hotel_node),
+    "transport": ("transport", transport_node),
+    "restaurant": ("restaurants", restaurant_node),
+    "weather": ("weather", weather_node),
+    "event": ("events", event_node),
+    "attraction": ("attractions", attraction_node),
+}
+
+# named topologies a caller can pick per plan
+PLANNER_TIERS = {
+    "full": DOMAINS,
+    "quick": ["hotel", "transport", "restaurant", "weather"],
+}
+
+_planners: dict[tuple, Any] = {}
+
+
+def build_planner_graph(
+    domains: tuple[str, ...], max_retries: int = MAX_AGENT_RETRIES
+) -> StateGraph:
+    logger.info(
+        f"Building travel planner graph | domains={list(domains)} | max_retries={max_retries}"
+    )
+    graph = StateGraph(PlannerState)
+
+    graph.add_node("coordinator", coordinator_node)
+    for domain in domains:
+        node_name, node = DOMAIN_NODES[domain]
+        graph.add_node(node_name, node)
+    graph.add_node("aggregator", aggregator_node)
+    graph.add_node(
+        "replanner",
+        partial(re_planner_node, domains=domains, max_retries=max_retries),
+    )
+    graph.add_node("itinerary", itinerary_node)
+
+    graph.add_edge(START, "coordinator")
+    for domain in domains:
+        node_name, _ = DOMAIN_NODES[domain]
+        graph.add_edge("coordinator", node_name)
+        graph.add_edge(node_name, "replanner")
+
+    graph.add_conditional_edges(
+        "replanner",
+        partial(route_after_replanner, max_retries=max_retries),
+        {
+            "aggregator": "aggregator",
+            "coordinator": "coordinator",
+        },
+    )
 
-travel_planner = graph.compile()
-logger.info("Travel planner graph compiled successfully")
+    graph.add_edge("aggregator", "itinerary")
+    graph.add_edge("itinerary", END)
+    return graph
+
+
+def get_travel_planner(
+    tier: str = "full",
+    checkpointer: BaseCheckpointSaver | None = None,
+    max_retries: int = MAX_AGENT_RETRIES,
+):
+    """
+    Returns the compiled planner for a tier, compiling it on first use. Compiled
+    graphs are cached per (domains, retry policy); the checkpointer is bound to a
+    shallow copy on each call, so the cache never holds on to (or mixes up) a
+    closed checkpointer.
+    """
+    if tier not in PLANNER_TIERS:
+        raise ValueError(
+            f"Unknown planner tier '{tier}'. Expected one of: {list(PLANNER_TIERS)}"
+        )
+    domains = tuple(d for d in DOMAINS if d in PLANNER_TIERS[tier])
+    key = (domains, max_retries)
+    if key not in _planners:
+        _planners[key] = build_planner_graph(domains, max_retries).compile()
+        logger.info(f"Travel planner graph compiled successfully | tier={tier}")
+    if checkpointer is None:
+        return _planners[key]
+    return _planners[key].copy(update={"checkpointer": checkpointer})
@@ -37,7 +37,7 @@ class WeatherAgent:
         logger.info(f"WeatherAgent.search_and_format | query={query[:80]}...")
         try:
             tool_output = await self.get_weather(query)
-            response = self.llm_structured.invoke(
+            response = await self.llm_structured.ainvoke(
                 [
                     {
                         "role": "system",
@@ -0,0 +1,65 @@
+"""
+Compares loading a generated catalog from JSON with memory-mapping its .odc file:
+time to a usable CatalogIndex and peak RSS of a fresh process, for each format.
+
+Run: uv run -m data.generator --cities 2000 --binary --out cache/catalogs/large
+     uv run -m benchmarks.catalog_load_bench --dir cache/catalogs/large [--name hotels]
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+
+def load(path: str) -> None:
+    from data.catalog_store import MappedCatalog
+    from utils.catalog import CatalogIndex, place_keys
+
+    start = time.perf_counter()
+    if path.endswith(".odc"):
+        records = MappedCatalog(path)
+    else:
+        with open(path) as f:
+            records = json.load(f)
+    loaded = time.perf_counter()
+    CatalogIndex(
+        records,
+        id_field="hotel_id" if "hotel" in os.path.basename(path) else "id",
+        places={"address": place_keys, "location": place_keys, "city": place_keys},
+    )
+    indexed = time.perf_counter()
+    print(json.dumps({
+        "load_ms": round((loaded - start) * 1000, 1),
+        "index_ms": round((indexed - loaded) * 1000, 1),
+        "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // 1024,
+    }))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--dir", default="cache/catalogs/synthetic")
+    parser.add_argument("--name", default="hotels")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        load(args.child)
+        return
+
+    for extension in ("json", "odc"):
+        path = os.path.join(args.dir, f"{args.name}.{extension}")
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.catalog_load_bench", "--child", path],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip().splitlines()[-1]
+        print(f"{extension:4} size={os.path.getsize(path) // 1024} KiB {output}")
+
+
+if __name__ == "__main__":
+    main()
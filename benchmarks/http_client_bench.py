@@ -0,0 +1,83 @@
+"""
+Compares a fresh httpx.AsyncClient per request (the old async_get behaviour) with
+the pooled keep-alive client from utils.http_client, against a local HTTP stand-in.
+
+Run: uv run -m benchmarks.http_client_bench [--requests 500] [--concurrency 10]
+"""
+
+import argparse
+import asyncio
+import threading
+import time
+import httpx
+import uvicorn
+from fastapi import FastAPI
+from utils.http_client import get_client, close_client
+from utils.metrics import summarize
+
+stand_in = FastAPI()
+
+
+@stand_in.get("/v1/hotels")
+async def hotels(city: str = "delhi"):
+    return {"city": city, "hotels": [{"id": i, "name": f"Hotel {i}"} for i in range(20)]}
+
+
+def start_stand_in(port: int) -> uvicorn.Server:
+    server = uvicorn.Server(
+        uvicorn.Config(stand_in, host="127.0.0.1", port=port, log_level="warning")
+    )
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+
+async def fresh_client_get(url: str) -> None:
+    async with httpx.AsyncClient() as client:
+        response = await client.get(url, params={"city": "delhi"})
+        response.json()
+
+
+async def pooled_client_get(url: str) -> None:
+    response = await get_client().get(url, params={"city": "delhi"})
+    response.json()
+
+
+async def measure(get, url: str, requests: int, concurrency: int) -> dict:
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            start = time.perf_counter()
+            await get(url)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    elapsed = time.perf_counter() - start
+    return {"rps": round(requests / elapsed, 1), "latency_ms": summarize(latencies)}
+
+
+async def main(requests: int, concurrency: int, port: int) -> None:
+    url = f"http://127.0.0.1:{port}/v1/hotels"
+    await pooled_client_get(url)  # warm the stand-in
+    for name, get in (("fresh client", fresh_client_get), ("pooled client", pooled_client_get)):
+        result = await measure(get, url, requests, concurrency)
+        print(f"{name:<14} | rps={result['rps']:<8} | latency_ms={result['latency_ms']}")
+    await close_client()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    server = start_stand_in(args.port)
+    try:
+        asyncio.run(main(args.requests, args.concurrency, args.port))
+    finally:
+        server.should_exit = True
@@ -0,0 +1,133 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+from config import MCP_SESSIONS_PER_SERVER
+from interfaces.mcp_client_interface import MCPClient
+from clients.attraction_mcp_client import AttractionMCPClient
+from clients.event_mcp_client import EventMCPClient
+from clients.hotel_mcp_client import HotelMCPClient
+from clients.restaurant_mcp_client import RestaurantMCPClient
+from clients.transport_mcp_client import TransportMCPClient
+from clients.weather_mcp_client import WeatherMCPClient
+from utils.logger import get_logger
+
+logger = get_logger("MCPSessionPool")
+
+# server module -> client class, for every domain the planner calls
+MCP_SERVER_CLIENTS: dict[str, type[MCPClient]] = {
+    "servers.hotel_mcp_server": HotelMCPClient,
+    "servers.transport_mcp_server": TransportMCPClient,
+    "servers.restaurant_mcp_server": RestaurantMCPClient,
+    "servers.weather_mcp_server": WeatherMCPClient,
+    "servers.event_mcp_server": EventMCPClient,
+    "servers.attraction_mcp_server": AttractionMCPClient,
+}
+
+_pools: dict[str, "MCPSessionPool"] = {}
+
+
+class MCPSessionPool:
+    """
+    Long-lived sessions to one MCP server module, each over its own server process.
+    Sessions are opened once and shared by every query, so a server's pooled HTTP
+    client, caches, breakers and hedging samples outlive a single tool call. A
+    query goes to the session with the fewest calls in flight.
+    """
+
+    def __init__(self, client_class: type[MCPClient], server_path: str, size: int):
+        self.client_class = client_class
+        self.server_path = server_path
+        self.size = size
+        self.in_flight: dict[MCPClient, int] = {}
+        self._stop = asyncio.Event()
+        self._holders: list[asyncio.Task] = []
+
+    async def _hold(self, ready: asyncio.Future) -> None:
+        # a stdio session must be closed by the task that opened it, so each one
+        # lives in its own task until the pool closes
+        client = self.client_class()
+        try:
+            await client.connect(self.server_path)
+        except asyncio.CancelledError:
+            ready.cancel()
+            raise
+        except Exception as e:
+            await client.cleanup()
+            ready.set_exception(e)
+            return
+        client.pool = self
+        self.in_flight[client] = 0
+        ready.set_result(client)
+        try:
+            await self._stop.wait()
+        finally:
+            self.in_flight.pop(client, None)
+            await client.cleanup()
+
+    async def open(self) -> None:
+        loop = asyncio.get_running_loop()
+        readies = [loop.create_future() for _ in range(self.size)]
+        self._holders = [asyncio.create_task(self._hold(ready)) for ready in readies]
+        results = await asyncio.gather(*readies, return_exceptions=True)
+        failed = [r for r in results if isinstance(r, BaseException)]
+        for error in failed:
+            logger.error(f"Session failed to open | server={self.server_path} | error={error}")
+        logger.info(
+            f"MCPSessionPool ready | server={self.server_path} | sessions={len(self.in_flight)}/{self.size}"
+        )
+
+    async def close(self) -> None:
+        self._stop.set()
+        await asyncio.gather(*self._holders, return_exceptions=True)
+        logger.info(f"MCPSessionPool closed | server={self.server_path}")
+
+    def pick(self, exclude: MCPClient | None = None) -> MCPClient | None:
+        candidates = [client for client in self.in_flight if client is not exclude]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda client: self.in_flight[client])
+
+    async def process_query(self, query: str) -> str:
+        client = self.pick()
+        if client is None:
+            raise RuntimeError(f"No open MCP session for {self.server_path}")
+        self.in_flight[client] += 1
+        try:
+            return await client.process_query(query)
+        finally:
+            if client in self.in_flight:
+                self.in_flight[client] -= 1
+
+
+def get_session_pool(server_path: str) -> MCPSessionPool | None:
+    """
+    The open pool for a server module, or None when tools should spawn a
+    one-off server process (CLI use, tests, or MCP_SESSIONS_PER_SERVER=0).
+    """
+    pool = _pools.get(server_path)
+    return pool if pool is not None and pool.in_flight else None
+
+
+@asynccontextmanager
+async def mcp_sessions_lifespan(
+    _app=None, size: int = MCP_SESSIONS_PER_SERVER
+) -> AsyncIterator[None]:
+    """
+    Lifespan hook that opens a session pool per MCP server on startup and closes
+    the sessions (and their server processes) on shutdown.
+    """
+    if size <= 0:
+        yield
+        return
+    pools = [
+        MCPSessionPool(client_class, server_path, size)
+        for server_path, client_class in MCP_SERVER_CLIENTS.items()
+    ]
+    await asyncio.gather(*(pool.open() for pool in pools))
+    _pools.update({pool.server_path: pool for pool in pools})
+    try:
+        yield
+    finally:
+        for pool in pools:
+            _pools.pop(pool.server_path, None)
+        await asyncio.gather(*(pool.close() for pool in pools))
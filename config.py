@@ -1,3 +1,4 @@
+import json
 import os
 from langchain_groq import ChatGroq
 from dotenv import load_dotenv
@@ -19,22 +20,174 @@ EVENTS_API_KEY = os.getenv("EVENTS_API_KEY", "")
 ATTRACTION_API_KEY = os.getenv("ATTRACTION_API_KEY", "")
 TRANSPORT_API_KEY = os.getenv("TRANSPORT_API_KEY", "")
 
-BOOKING_API_BASE = "https://booking-com.p.rapidapi.com/v1"
-YELP_API_BASE = "https://api.yelp.com/v3"
-OPENWEATHER_API_BASE = "https://api.openweathermap.org/data/2.5"
-EVENTS_API_BASE = "https://events-api.example.com/v1"
-ATTRACTION_API_BASE = "https://attractions-api.example.com/v1"
-TRANSPORT_API_BASE = "https://transport-api.example.com/v1"
+# overridable so the live code paths can target the local provider emulator
+BOOKING_API_BASE = os.getenv("BOOKING_API_BASE", "https://booking-com.p.rapidapi.com/v1")
+YELP_API_BASE = os.getenv("YELP_API_BASE", "https://api.yelp.com/v3")
+OPENWEATHER_API_BASE = os.getenv("OPENWEATHER_API_BASE", "https://api.openweathermap.org/data/2.5")
+EVENTS_API_BASE = os.getenv("EVENTS_API_BASE", "https://events-api.example.com/v1")
+ATTRACTION_API_BASE = os.getenv("ATTRACTION_API_BASE", "https://attractions-api.example.com/v1")
+TRANSPORT_API_BASE = os.getenv("TRANSPORT_API_BASE", "https://transport-api.example.com/v1")
 
-TRANSPORT_MOCK_BOOL = os.getenv("TRANSPORT_MOCK", "True")
-WEATHER_MOCK_BOOL = os.getenv("WEATHER_MOCK", "True")
-RESTAURANT_MOCK_BOOL = os.getenv("RESTAURANT_MOCK", "True")
-EVENT_MOCK_BOOL = os.getenv("EVENT_MOCK", "True")
-ATTRACTION_MOCK_BOOL = os.getenv("ATTRACTION_MOCK", "True")
-HOTEL_MOCK_BOOL = os.getenv("HOTEL_MOCK", "True")
+TRANSPORT_MOCK_BOOL = os.getenv("TRANSPORT_MOCK", "True").lower() == "true"
+WEATHER_MOCK_BOOL = os.getenv("WEATHER_MOCK", "True").lower() == "true"
+RESTAURANT_MOCK_BOOL = os.getenv("RESTAURANT_MOCK", "True").lower() == "true"
+EVENT_MOCK_BOOL = os.getenv("EVENT_MOCK", "True").lower() == "true"
+ATTRACTION_MOCK_BOOL = os.getenv("ATTRACTION_MOCK", "True").lower() == "true"
+HOTEL_MOCK_BOOL = os.getenv("HOTEL_MOCK", "True").lower() == "true"
+
+# hotel location -> dest_id cache, shared by hotel server processes
+HOTEL_DEST_CACHE_PATH = os.getenv("HOTEL_DEST_CACHE_PATH", "cache/hotel_destinations.sqlite")
+HOTEL_DEST_CACHE_TTL = int(os.getenv("HOTEL_DEST_CACHE_TTL", str(30 * 86400)))
+HOTEL_DEST_NEGATIVE_TTL = int(os.getenv("HOTEL_DEST_NEGATIVE_TTL", "86400"))
+HOTEL_DEST_SEED_PATH = os.getenv("HOTEL_DEST_SEED_PATH", "")
+
+# hotel search pagination: pages beyond the first are fetched concurrently until
+# HOTEL_RESULTS_TARGET in-budget hotels are found or HOTEL_MAX_PAGES is reached
+HOTEL_MAX_PAGES = int(os.getenv("HOTEL_MAX_PAGES", "4"))
+HOTEL_PAGE_CONCURRENCY = int(os.getenv("HOTEL_PAGE_CONCURRENCY", "3"))
+HOTEL_RESULTS_TARGET = int(os.getenv("HOTEL_RESULTS_TARGET", "10"))
+
+# coordinate searches in the mock servers: grid cell size of the spatial index and
+# the radius searched around the given point
+GEO_CELL_DEG = float(os.getenv("GEO_CELL_DEG", "0.1"))
+GEO_SEARCH_RADIUS_KM = float(os.getenv("GEO_SEARCH_RADIUS_KM", "25"))
+
+# multi-leg transport connections: layover window between legs and legs per trip
+TRANSPORT_MIN_LAYOVER_MINUTES = int(os.getenv("TRANSPORT_MIN_LAYOVER_MINUTES", "60"))
+TRANSPORT_MAX_LAYOVER_HOURS = int(os.getenv("TRANSPORT_MAX_LAYOVER_HOURS", "36"))
+TRANSPORT_MAX_LEGS = int(os.getenv("TRANSPORT_MAX_LEGS", "3"))
+TRANSPORT_MAX_CONNECTIONS = int(os.getenv("TRANSPORT_MAX_CONNECTIONS", "5"))
+
+# preference matching in the mock attraction/restaurant/event servers: results
+# returned when a search is ranked by trip preferences
+PREFERENCE_MATCH_LIMIT = int(os.getenv("PREFERENCE_MATCH_LIMIT", "10"))
+
+# recurring events without an end date are expanded this many days ahead
+EVENT_RECURRENCE_HORIZON_DAYS = int(os.getenv("EVENT_RECURRENCE_HORIZON_DAYS", "730"))
+
+# ids looked up by one get_*_details_many call (duplicates dropped first)
+DETAILS_MANY_LIMIT = int(os.getenv("DETAILS_MANY_LIMIT", "20"))
+
+# server-side ranking of search results (utils/ranking.py): component weights,
+# results kept, and the distance at which the distance component halves
+RANK_WEIGHTS = {
+    "rating": float(os.getenv("RANK_WEIGHT_RATING", "0.4")),
+    "price": float(os.getenv("RANK_WEIGHT_PRICE", "0.3")),
+    "distance": float(os.getenv("RANK_WEIGHT_DISTANCE", "0.2")),
+    "preference": float(os.getenv("RANK_WEIGHT_PREFERENCE", "0.4")),
+}
+RANK_TOP_K = int(os.getenv("RANK_TOP_K", "10"))
+RANK_DISTANCE_SCALE_KM = float(os.getenv("RANK_DISTANCE_SCALE_KM", "5"))
+
+# directory of generated catalogs (data/generator.py) used by the mock servers
+# instead of the bundled data/ modules; empty keeps the bundled data
+CATALOG_DIR = os.getenv("CATALOG_DIR", "")
+
+# local provider emulator (emulator/provider_emulator.py)
+EMULATOR_HOST = os.getenv("EMULATOR_HOST", "127.0.0.1")
+EMULATOR_PORT = int(os.getenv("EMULATOR_PORT", "9100"))
+EMULATOR_LATENCY_MS = float(os.getenv("EMULATOR_LATENCY_MS", "50"))
+EMULATOR_JITTER_MS = float(os.getenv("EMULATOR_JITTER_MS", "50"))
+EMULATOR_ERROR_RATE = float(os.getenv("EMULATOR_ERROR_RATE", "0"))
+EMULATOR_PAYLOAD_SCALE = int(os.getenv("EMULATOR_PAYLOAD_SCALE", "1"))
+EMULATOR_MAX_AGE = int(os.getenv("EMULATOR_MAX_AGE", "0"))
 
 MAX_AGENT_RETRIES = int(os.getenv("MAX_AGENT_RETRIES", "3"))
 
+CHECKPOINT_DB_PATH = os.getenv("CHECKPOINT_DB_PATH", "checkpoints/planner.sqlite")
+
+# per-domain result cache TTLs in seconds (0 disables caching for that domain)
+DOMAIN_CACHE_TTLS = {
+    "hotel": int(os.getenv("HOTEL_CACHE_TTL", "3600")),
+    "transport": int(os.getenv("TRANSPORT_CACHE_TTL", "1800")),
+    "restaurant": int(os.getenv("RESTAURANT_CACHE_TTL", "86400")),
+    "weather": int(os.getenv("WEATHER_CACHE_TTL", "900")),
+    "event": int(os.getenv("EVENT_CACHE_TTL", "21600")),
+    "attraction": int(os.getenv("ATTRACTION_CACHE_TTL", "604800")),
+}
+DOMAIN_CACHE_MAX_ENTRIES = int(os.getenv("DOMAIN_CACHE_MAX_ENTRIES", "1024"))
+DOMAIN_CACHE_DB_PATH = os.getenv("DOMAIN_CACHE_DB_PATH", "")
+BUDGET_BUCKET_SIZE = float(os.getenv("BUDGET_BUCKET_SIZE", "250"))
+
+# per-domain bulkheads: (concurrent lookups, waiting lookups, lookup timeout s, provider HTTP timeout s)
+_DOMAIN_LIMIT_DEFAULTS = {
+    "hotel": (4, 16, 60, 15),
+    "transport": (4, 16, 60, 15),
+    "restaurant": (4, 16, 45, 10),
+    "weather": (8, 32, 30, 5),
+    "event": (4, 16, 45, 10),
+    "attraction": (4, 16, 45, 10),
+}
+DOMAIN_BULKHEADS = {
+    domain: {
+        "max_concurrent": int(os.getenv(f"{domain.upper()}_MAX_CONCURRENCY", str(concurrent))),
+        "max_waiting": int(os.getenv(f"{domain.upper()}_QUEUE_SIZE", str(waiting))),
+        "timeout": float(os.getenv(f"{domain.upper()}_TIMEOUT", str(timeout))),
+    }
+    for domain, (concurrent, waiting, timeout, _) in _DOMAIN_LIMIT_DEFAULTS.items()
+}
+DOMAIN_HTTP_TIMEOUTS = {
+    domain: float(os.getenv(f"{domain.upper()}_HTTP_TIMEOUT", str(http_timeout)))
+    for domain, (_, _, _, http_timeout) in _DOMAIN_LIMIT_DEFAULTS.items()
+}
+
+# pooled provider HTTP client (one per process, keep-alive connections reused across calls)
+HTTP2_ENABLED = os.getenv("HTTP2_ENABLED", "false").lower() == "true"
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+HTTP_POOL_TIMEOUT = float(os.getenv("HTTP_POOL_TIMEOUT", "5"))
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+HTTP_MAX_KEEPALIVE = int(os.getenv("HTTP_MAX_KEEPALIVE", "20"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+HTTP_MAX_CONNECTIONS_PER_HOST = int(os.getenv("HTTP_MAX_CONNECTIONS_PER_HOST", "10"))
+
+# provider call retries (transport errors, 5xx and 429 only) and per-host circuit breakers
+HTTP_MAX_ATTEMPTS = int(os.getenv("HTTP_MAX_ATTEMPTS", "3"))
+HTTP_BACKOFF_BASE = float(os.getenv("HTTP_BACKOFF_BASE", "0.5"))
+HTTP_BACKOFF_MAX = float(os.getenv("HTTP_BACKOFF_MAX", "10"))
+HTTP_RETRY_BUDGET = float(os.getenv("HTTP_RETRY_BUDGET", "20"))
+HTTP_BREAKER_THRESHOLD = int(os.getenv("HTTP_BREAKER_THRESHOLD", "5"))
+HTTP_BREAKER_RESET = float(os.getenv("HTTP_BREAKER_RESET", "30"))
+# open breakers are shared across the server processes through this file
+HTTP_BREAKER_DB_PATH = os.getenv("HTTP_BREAKER_DB_PATH", "cache/circuit_breakers.sqlite")
+
+# provider response cache in async_get (per-endpoint TTL overrides win over Cache-Control)
+HTTP_CACHE_ENABLED = os.getenv("HTTP_CACHE_ENABLED", "false").lower() == "true"
+HTTP_CACHE_MAX_ENTRIES = int(os.getenv("HTTP_CACHE_MAX_ENTRIES", "512"))
+HTTP_CACHE_DB_PATH = os.getenv("HTTP_CACHE_DB_PATH", "cache/http_responses.sqlite")
+HTTP_CACHE_STALE_TTL = int(os.getenv("HTTP_CACHE_STALE_TTL", "86400"))
+HTTP_CACHE_TTL_OVERRIDES = json.loads(
+    os.getenv(
+        "HTTP_CACHE_TTL_OVERRIDES",
+        '{"/stays/search": 86400, "/hotels/details": 21600}',
+    )
+)
+# seconds between purges of expired rows from the SQLite cache tiers of a process
+CACHE_MAINTENANCE_INTERVAL = float(os.getenv("CACHE_MAINTENANCE_INTERVAL", "3600"))
+
+# long-lived sessions (one server process each) per MCP server, opened with the API;
+# 0 spawns a server process per tool call instead
+MCP_SESSIONS_PER_SERVER = int(os.getenv("MCP_SESSIONS_PER_SERVER", "2"))
+
+# request hedging for MCP tool calls and provider HTTP GETs (off unless enabled)
+HEDGE_MCP_CALLS = os.getenv("HEDGE_MCP_CALLS", "false").lower() == "true"
+HEDGE_HTTP_CALLS = os.getenv("HEDGE_HTTP_CALLS", "false").lower() == "true"
+HEDGE_PERCENTILE = float(os.getenv("HEDGE_PERCENTILE", "95"))
+HEDGE_MAX_RATE = float(os.getenv("HEDGE_MAX_RATE", "0.1"))
+HEDGE_MIN_SAMPLES = int(os.getenv("HEDGE_MIN_SAMPLES", "20"))
+HEDGE_INITIAL_DELAY = float(os.getenv("HEDGE_INITIAL_DELAY", "2"))
+
+PLAN_WORKERS = int(os.getenv("PLAN_WORKERS", "4"))
+PLAN_QUEUE_SIZE = int(os.getenv("PLAN_QUEUE_SIZE", "100"))
+PLAN_JOB_HISTORY = int(os.getenv("PLAN_JOB_HISTORY", "1000"))
+
+BATCH_MAX_TRIPS = int(os.getenv("BATCH_MAX_TRIPS", "500"))
+BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", "8"))
+
+# admission control across every planner graph run in the process
+MAX_CONCURRENT_PLANS = int(os.getenv("MAX_CONCURRENT_PLANS", "8"))
+ADMISSION_QUEUE_SIZE = int(os.getenv("ADMISSION_QUEUE_SIZE", "16"))
+ADMISSION_TIMEOUT = float(os.getenv("ADMISSION_TIMEOUT", "30"))
+
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 LOG_DIR = "logs"
 
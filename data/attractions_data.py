@@ -1,6 +1,8 @@
 ATTRACTIONS_DATA = [
     {
         "id": "plc_001",
+        "latitude": 18.9685,
+        "longitude": 72.7977,
         "name": "Gateway of India",
         "type": "Monument",
         "location": "Apollo Bandar, Colaba, Mumbai",
@@ -13,6 +15,8 @@ ATTRACTIONS_DATA = [
     },
     {
         "id": "plc_002",
+        "latitude": 18.9986,
+        "longitude": 72.8273,
         "name": "Elephanta Caves",
         "type": "UNESCO Heritage Site",
         "location": "Elephanta Island, Mumbai",
@@ -25,6 +29,8 @@ ATTRACTIONS_DATA = [
     },
     {
         "id": "plc_003",
+        "latitude": 18.9871,
+        "longitude": 72.8471,
         "name": "Marine Drive",
         "type": "Promenade",
         "location": "Netaji Subhash Chandra Bose Road, Mumbai",
@@ -37,6 +43,8 @@ ATTRACTIONS_DATA = [
     },
     {
         "id": "plc_004",
+        "latitude": 28.6288,
+        "longitude": 77.1884,
         "name": "Red Fort",
         "type": "Monument",
         "location": "Netaji Subhash Marg, Chandni Chowk, Delhi",
@@ -49,6 +57,8 @@ ATTRACTIONS_DATA = [
     },
     {
         "id": "plc_005",
+        "latitude": 28.6204,
+        "longitude": 77.2315,
         "name": "Qutub Minar",
         "type": "Monument",
         "location": "Mehrauli, Delhi",
@@ -61,6 +71,8 @@ ATTRACTIONS_DATA = [
     },
     {
         "id": "plc_006",
+        "latitude": 28.5987,
+        "longitude": 77.1877,
         "name": "India Gate",
         "type": "Monument",
         "location": "Rajpath, Delhi",
@@ -73,6 +85,8 @@ ATTRACTIONS_DATA = [
     },
     {
         "id": "plc_007",
+        "latitude": 26.9252,
+        "longitude": 75.7742,
         "name": "Hawa Mahal",
         "type": "Palace",
         "location": "Hawa Mahal Road, Badi Choupad, Jaipur",
@@ -85,6 +99,8 @@ ATTRACTIONS_DATA = [
     },
     {
         "id": "plc_008",
+        "latitude": 26.8892,
+        "longitude": 75.8173,
         "name": "Amber Fort",
         "type": "Fort",
         "location": "Devisinghpura, Amer, Jaipur",
@@ -97,6 +113,8 @@ ATTRACTIONS_DATA = [
     },
     {
         "id": "plc_009",
+        "latitude": 26.8909,
+        "longitude": 75.7667,
         "name": "City Palace",
         "type": "Palace",
         "location": "Tulsi Marg, Gangori Bazaar, Jaipur",
@@ -109,6 +127,8 @@ ATTRACTIONS_DATA = [
     },
     {
         "id": "plc_010",
+        "latitude": 15.5047,
+        "longitude": 73.7978,
         "name": "Basilica of Bom Jesus",
         "type": "Church",
         "location": "Old Goa, Goa",
@@ -121,6 +141,8 @@ ATTRACTIONS_DATA = [
     },
     {
         "id": "plc_011",
+        "latitude": 15.4903,
+        "longitude": 73.8477,
         "name": "Fort Aguada",
         "type": "Fort",
         "location": "Sinquerim, Candolim, Goa",
@@ -133,6 +155,8 @@ ATTRACTIONS_DATA = [
     },
     {
         "id": "plc_012",
+        "latitude": 15.5164,
+        "longitude": 73.8312,
         "name": "Calangute Beach",
         "type": "Beach",
         "location": "Calangute, North Goa",
@@ -145,6 +169,8 @@ ATTRACTIONS_DATA = [
     },
     {
         "id": "plc_013",
+        "latitude": 13.0011,
+        "longitude": 77.5813,
         "name": "Lalbagh Botanical Garden",
         "type": "Park",
         "location": "Mavalli, Bengaluru",
@@ -157,6 +183,8 @@ ATTRACTIONS_DATA = [
     },
     {
         "id": "plc_014",
+        "latitude": 12.9541,
+        "longitude": 77.6098,
         "name": "Bangalore Palace",
         "type": "Palace",
         "location": "Vasanth Nagar, Bengaluru",
@@ -169,6 +197,8 @@ ATTRACTIONS_DATA = [
     },
     {
         "id": "plc_015",
+        "latitude": 22.5468,
+        "longitude": 88.3508,
         "name": "Victoria Memorial",
         "type": "Museum",
         "location": "Queens Way, Kolkata",
@@ -181,6 +211,8 @@ ATTRACTIONS_DATA = [
     },
     {
         "id": "plc_016",
+        "latitude": 22.5953,
+        "longitude": 88.3391,
         "name": "Howrah Bridge",
         "type": "Landmark",
         "location": "Howrah, Kolkata",
@@ -193,6 +225,8 @@ ATTRACTIONS_DATA = [
     },
     {
         "id": "plc_017",
+        "latitude": 27.1721,
+        "longitude": 78.0143,
         "name": "Taj Mahal",
         "type": "Monument",
         "location": "Dharmapuri, Forest Colony, Agra",
@@ -205,6 +239,8 @@ ATTRACTIONS_DATA = [
     },
     {
         "id": "plc_018",
+        "latitude": 27.1712,
+        "longitude": 78.0037,
         "name": "Agra Fort",
         "type": "Fort",
         "location": "Agra Fort, Rakabganj, Agra",
@@ -217,6 +253,8 @@ ATTRACTIONS_DATA = [
     },
     {
         "id": "plc_019",
+        "latitude": 34.0895,
+        "longitude": 74.8188,
         "name": "Dal Lake",
         "type": "Lake",
         "location": "Srinagar, Jammu & Kashmir",
@@ -229,6 +267,8 @@ ATTRACTIONS_DATA = [
     },
     {
         "id": "plc_020",
+        "latitude": 9.899,
+        "longitude": 78.1176,
         "name": "Meenakshi Amman Temple",
         "type": "Temple",
         "location": "Madurai, Tamil Nadu",
@@ -241,6 +281,8 @@ ATTRACTIONS_DATA = [
     },
     {
         "id": "plc_021",
+        "latitude": 17.3686,
+        "longitude": 78.5162,
         "name": "Charminar",
         "type": "Monument",
         "location": "Charminar Road, Hyderabad",
@@ -253,6 +295,8 @@ ATTRACTIONS_DATA = [
     },
     {
         "id": "plc_022",
+        "latitude": 17.395,
+        "longitude": 78.4979,
         "name": "Golconda Fort",
         "type": "Fort",
         "location": "Ibrahim Bagh, Hyderabad",
@@ -265,6 +309,8 @@ ATTRACTIONS_DATA = [
     },
     {
         "id": "plc_023",
+        "latitude": 10.0695,
+        "longitude": 77.0801,
         "name": "Munnar Tea Gardens",
         "type": "Nature",
         "location": "Munnar, Kerala",
@@ -277,6 +323,8 @@ ATTRACTIONS_DATA = [
     },
     {
         "id": "plc_024",
+        "latitude": 9.4869,
+        "longitude": 76.3467,
         "name": "Alleppey Backwaters",
         "type": "Nature",
         "location": "Alappuzha, Kerala",
@@ -289,6 +337,8 @@ ATTRACTIONS_DATA = [
     },
     {
         "id": "plc_025",
+        "latitude": 12.2884,
+        "longitude": 76.6423,
         "name": "Mysore Palace",
         "type": "Palace",
         "location": "Sayyaji Rao Road, Mysuru",
@@ -0,0 +1,221 @@
+"""
+Compact on-disk catalog format (.odc) that servers memory-map instead of parsing.
+
+Layout: 8-byte magic, uint64 header length, JSON header, then 8-byte aligned
+sections — one fixed-width column per field (float64 numbers, int32 references
+into the string table for strings and JSON-encoded lists) and a string table of
+uint64 offsets plus one UTF-8 blob. Dict-valued fields are flattened one level
+("location.city"). Repeated strings are stored once.
+
+The file is mapped read-only, so server processes share the OS page cache; a
+record is only decoded into a dict when a search returns its row.
+"""
+
+import json
+import math
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import Any, Iterable
+import numpy as np
+from utils.catalog import get_path
+
+MAGIC = b"ODCAT1\0\0"
+NONE_REF = -1
+
+
+def _align(n: int) -> int:
+    return (n + 7) & ~7
+
+
+def _kind(values: list[Any]) -> str:
+    present = [v for v in values if v is not None]
+    if present and all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in present):
+        return "int" if all(isinstance(v, int) for v in present) else "float"
+    if all(isinstance(v, str) for v in present):
+        return "str"
+    return "json"
+
+
+def _flatten_fields(records: list[dict[str, Any]]) -> list[tuple[str, str | None]]:
+    """
+    (column name, parent field) pairs in first-seen order; dict-valued fields become
+    one column per key.
+    """
+    order = list(dict.fromkeys(key for r in records for key in r))
+    columns = []
+    for field in order:
+        values = [r.get(field) for r in records]
+        if all(v is None or isinstance(v, dict) for v in values) and any(values):
+            keys = dict.fromkeys(k for v in values if v for k in v)
+            columns.extend((f"{field}.{key}", field) for key in keys)
+        else:
+            columns.append((field, None))
+    return columns
+
+
+def write_catalog(records: Iterable[dict[str, Any]], path: str) -> int:
+    """
+    Writes records to path in the .odc format and returns the row count.
+    """
+    records = list(records)
+    strings: dict[str, int] = {}
+
+    def ref(text: str | None) -> int:
+        if text is None:
+            return NONE_REF
+        return strings.setdefault(text, len(strings))
+
+    columns, arrays = [], []
+    for name, parent in _flatten_fields(records):
+        if parent:
+            key = name[len(parent) + 1 :]
+            values = [(r.get(parent) or {}).get(key) for r in records]
+        else:
+            values = [r.get(name) for r in records]
+        kind = _kind(values)
+        if kind in ("int", "float"):
+            array = np.array([math.nan if v is None else v for v in values], dtype=np.float64)
+        elif kind == "str":
+            array = np.array([ref(v) for v in values], dtype=np.int32)
+        else:
+            array = np.array(
+                [NONE_REF if v is None else ref(json.dumps(v, separators=(",", ":"))) for v in values],
+                dtype=np.int32,
+            )
+        columns.append({"name": name, "parent": parent, "kind": kind})
+        arrays.append(array)
+
+    encoded = [text.encode() for text in strings]
+    string_offsets = np.zeros(len(encoded) + 1, dtype=np.uint64)
+    np.cumsum([len(b) for b in encoded], out=string_offsets[1:])
+    blob = b"".join(encoded)
+
+    # offsets depend on the header length, so reserve header space until the layout fits
+    header: dict[str, Any] = {"rows": len(records), "columns": columns}
+    sections = [*arrays, string_offsets]
+    reserved = 0
+    while True:
+        position = _align(len(MAGIC) + 8 + reserved)
+        for column, array in zip(columns, arrays):
+            column["offset"] = position
+            position = _align(position + array.nbytes)
+        header["string_offsets"] = position
+        header["strings"] = len(encoded)
+        position = _align(position + string_offsets.nbytes)
+        header["blob"] = position
+        header["blob_size"] = len(blob)
+        size = len(json.dumps(header).encode())
+        if size <= reserved:
+            break
+        reserved = size + 64
+    header_bytes = json.dumps(header).encode().ljust(reserved)
+
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        f.write(np.uint64(len(header_bytes)).tobytes())
+        f.write(header_bytes)
+        for section in [*sections, blob]:
+            f.write(b"\0" * (_align(f.tell()) - f.tell()))
+            f.write(section if isinstance(section, bytes) else section.tobytes())
+    return len(records)
+
+
+class MappedCatalog(Sequence):
+    """
+    Read-only, memory-mapped view of an .odc file that behaves like a list of dicts.
+    Indexing decodes one row; field_values() reads whole columns without building
+    records, decoding each distinct string once.
+    """
+
+    def __init__(self, path: str, string_cache_size: int = 65536):
+        self.path = path
+        self._map = np.memmap(path, dtype=np.uint8, mode="r")
+        if bytes(self._map[: len(MAGIC)]) != MAGIC:
+            raise ValueError(f"{path} is not a catalog file")
+        header_size = int(self._map[len(MAGIC) : len(MAGIC) + 8].view(np.uint64)[0])
+        start = len(MAGIC) + 8
+        header = json.loads(bytes(self._map[start : start + header_size]))
+
+        self.rows = header["rows"]
+        self.columns = header["columns"]
+        self._arrays = {
+            c["name"]: self._view(c["offset"], np.float64 if c["kind"] in ("int", "float") else np.int32, self.rows)
+            for c in self.columns
+        }
+        self._string_offsets = self._view(header["string_offsets"], np.uint64, header["strings"] + 1)
+        # slicing the memmap itself builds an ndarray per string; a memoryview does not
+        self._blob = memoryview(self._map)[header["blob"] : header["blob"] + header["blob_size"]]
+        self._string = lru_cache(maxsize=string_cache_size)(self._decode_string)
+
+    def _view(self, offset: int, dtype: Any, count: int) -> np.ndarray:
+        size = np.dtype(dtype).itemsize * count
+        return self._map[offset : offset + size].view(dtype)
+
+    def _decode_string(self, ref: int) -> str:
+        start, stop = int(self._string_offsets[ref]), int(self._string_offsets[ref + 1])
+        return str(self._blob[start:stop], "utf-8")
+
+    def _value(self, column: dict[str, Any], row: int) -> Any:
+        return self._decode(column["kind"], self._arrays[column["name"]][row], self._string)
+
+    def _decode(self, kind: str, raw: Any, string: Any) -> Any:
+        if kind in ("int", "float"):
+            if math.isnan(raw):
+                return None
+            return int(raw) if kind == "int" else float(raw)
+        if raw == NONE_REF:
+            return None
+        text = string(int(raw))
+        return text if kind == "str" else json.loads(text)
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[row] for row in range(*index.indices(self.rows))]
+        row = int(index)
+        if row < 0:
+            row += self.rows
+        if not 0 <= row < self.rows:
+            raise IndexError(index)
+        record: dict[str, Any] = {}
+        for column in self.columns:
+            value = self._value(column, row)
+            if column["parent"]:
+                if value is not None:
+                    key = column["name"][len(column["parent"]) + 1 :]
+                    record.setdefault(column["parent"], {})[key] = value
+            elif value is not None:
+                record[column["name"]] = value
+        return record
+
+    def field_values(self, path: str) -> np.ndarray | list[Any]:
+        """
+        All rows' values at a dotted path ("min_total_price", "location.city",
+        "categories.0.title"). Numeric columns come back as the mapped float64 array.
+        """
+        names = {c["name"]: c for c in self.columns}
+        parts = path.split(".")
+        for size in range(len(parts), 0, -1):
+            column = names.get(".".join(parts[:size]))
+            if column:
+                rest = parts[size:]
+                break
+        else:
+            return [None] * self.rows
+
+        array = self._arrays[column["name"]]
+        if column["kind"] in ("int", "float") and not rest:
+            return array
+        # decode each distinct string once, outside the row cache
+        refs, inverse = np.unique(array, return_inverse=True)
+        present = refs[refs != NONE_REF]
+        starts = self._string_offsets[present].tolist()
+        stops = self._string_offsets[present + 1].tolist()
+        texts = [str(self._blob[a:b], "utf-8") for a, b in zip(starts, stops)]
+        if column["kind"] == "json":
+            texts = [json.loads(text) for text in texts]
+        decoded = [None] * (len(refs) - len(present)) + [get_path(v, rest) if rest else v for v in texts]
+        return [decoded[i] for i in inverse.tolist()]
+
@@ -0,0 +1,31 @@
+import json
+import os
+from typing import Any
+from config import CATALOG_DIR
+from data.catalog_store import MappedCatalog
+from utils.logger import get_logger
+
+logger = get_logger("Catalogs")
+
+
+def load_catalog(name: str, default: Any) -> Any:
+    """
+    Returns the catalog from CATALOG_DIR when it is set, otherwise the bundled
+    default. A binary <name>.odc is memory-mapped in preference to <name>.json
+    (both as written by data.generator).
+    """
+    if not CATALOG_DIR:
+        return default
+    binary_path = os.path.join(CATALOG_DIR, f"{name}.odc")
+    if os.path.exists(binary_path):
+        records = MappedCatalog(binary_path)
+        logger.info(f"Catalog mapped | name={name} | records={len(records)} | path={binary_path}")
+        return records
+    path = os.path.join(CATALOG_DIR, f"{name}.json")
+    if not os.path.exists(path):
+        logger.warning(f"Catalog file missing, using bundled data | path={path}")
+        return default
+    with open(path) as f:
+        records = json.load(f)
+    logger.info(f"Catalog loaded | name={name} | records={len(records)} | path={path}")
+    return records
@@ -16,6 +16,7 @@ EVENTS_DATA = [
         "type": "Festival",
         "location": "Diggi Palace, Jaipur",
         "date": "2026-01-25",
+        "end_date": "2026-01-29",
         "time": "10:00",
         "price": 0.00,
         "currency": "INR",
@@ -27,6 +28,7 @@ EVENTS_DATA = [
         "type": "Exhibition",
         "location": "NSIC Grounds, Delhi",
         "date": "2026-02-02",
+        "end_date": "2026-02-05",
         "time": "11:00",
         "price": 1200.00,
         "currency": "INR",
@@ -38,6 +40,7 @@ EVENTS_DATA = [
         "type": "Music Festival",
         "location": "Vagator Beach, Goa",
         "date": "2025-12-29",
+        "end_date": "2025-12-31",
         "time": "16:00",
         "price": 6000.00,
         "currency": "INR",
@@ -49,6 +52,7 @@ EVENTS_DATA = [
         "type": "Conference",
         "location": "Bangalore International Exhibition Centre, Bengaluru",
         "date": "2026-03-10",
+        "end_date": "2026-03-11",
         "time": "09:00",
         "price": 3500.00,
         "currency": "INR",
@@ -71,6 +75,7 @@ EVENTS_DATA = [
         "type": "Cultural Festival",
         "location": "Mehrangarh Fort, Jodhpur",
         "date": "2026-10-15",
+        "end_date": "2026-10-19",
         "time": "17:00",
         "price": 2000.00,
         "currency": "INR",
@@ -82,6 +87,7 @@ EVENTS_DATA = [
         "type": "Arts Festival",
         "location": "Kala Ghoda, Mumbai",
         "date": "2026-02-05",
+        "end_date": "2026-02-13",
         "time": "12:00",
         "price": 0.00,
         "currency": "INR",
@@ -93,6 +99,7 @@ EVENTS_DATA = [
         "type": "Technology Expo",
         "location": "Pragati Maidan, Delhi",
         "date": "2026-09-27",
+        "end_date": "2026-09-30",
         "time": "09:00",
         "price": 500.00,
         "currency": "INR",
@@ -115,6 +122,7 @@ EVENTS_DATA = [
         "type": "Music Festival",
         "location": "Pune",
         "date": "2025-12-15",
+        "end_date": "2025-12-17",
         "time": "17:00",
         "price": 4500.00,
         "currency": "INR",
@@ -126,6 +134,7 @@ EVENTS_DATA = [
         "type": "Film Festival",
         "location": "Panaji, Goa",
         "date": "2026-11-21",
+        "end_date": "2026-11-28",
         "time": "10:00",
         "price": 2000.00,
         "currency": "INR",
@@ -137,6 +146,7 @@ EVENTS_DATA = [
         "type": "Pop Culture Festival",
         "location": "Pragati Maidan, Delhi",
         "date": "2026-12-02",
+        "end_date": "2026-12-04",
         "time": "10:00",
         "price": 999.00,
         "currency": "INR",
@@ -170,6 +180,7 @@ EVENTS_DATA = [
         "type": "Cultural Fair",
         "location": "Pushkar, Rajasthan",
         "date": "2026-11-05",
+        "end_date": "2026-11-12",
         "time": "09:00",
         "price": 100.00,
         "currency": "INR",
@@ -181,6 +192,7 @@ EVENTS_DATA = [
         "type": "Conference",
         "location": "Hyderabad",
         "date": "2026-01-03",
+        "end_date": "2026-01-07",
         "time": "09:00",
         "price": 1500.00,
         "currency": "INR",
@@ -192,6 +204,7 @@ EVENTS_DATA = [
         "type": "Religious Festival",
         "location": "Kolkata",
         "date": "2026-10-12",
+        "end_date": "2026-10-16",
         "time": "17:00",
         "price": 0.00,
         "currency": "INR",
@@ -203,6 +216,7 @@ EVENTS_DATA = [
         "type": "Fashion Show",
         "location": "Delhi",
         "date": "2026-03-20",
+        "end_date": "2026-03-24",
         "time": "18:00",
         "price": 2500.00,
         "currency": "INR",
@@ -214,9 +228,48 @@ EVENTS_DATA = [
         "type": "Wellness Retreat",
         "location": "Parmarth Niketan, Rishikesh",
         "date": "2026-03-01",
+        "end_date": "2026-03-07",
         "time": "06:00",
         "price": 5000.00,
         "currency": "INR",
         "organizer": "Parmarth Niketan Ashram",
     },
+    # Recurring
+    {
+        "id": "evt_221",
+        "name": "Saturday Night Market",
+        "type": "Market",
+        "location": "Arpora, Goa",
+        "date": "2025-11-01",
+        "recurrence": "weekly",
+        "until": "2026-05-30",
+        "time": "18:00",
+        "price": 0.00,
+        "currency": "INR",
+        "organizer": "Saturday Night Market Goa",
+    },
+    {
+        "id": "evt_222",
+        "name": "Ganga Aarti",
+        "type": "Religious Ceremony",
+        "location": "Dashashwamedh Ghat, Varanasi",
+        "date": "2025-01-01",
+        "recurrence": "daily",
+        "time": "18:45",
+        "price": 0.00,
+        "currency": "INR",
+        "organizer": "Ganga Seva Nidhi",
+    },
+    {
+        "id": "evt_223",
+        "name": "Fort Heritage Walk",
+        "type": "Heritage Walk",
+        "location": "Kala Ghoda, Mumbai",
+        "date": "2025-11-02",
+        "recurrence": "weekly",
+        "time": "08:00",
+        "price": 600.00,
+        "currency": "INR",
+        "organizer": "Khaki Tours",
+    },
 ]
@@ -0,0 +1,315 @@
+"""
+Seeded generator for synthetic catalogs in the schema the MCP servers consume:
+hotels (+ destination ids), restaurants, attractions, events, flights, trains,
+public transport and weather, spread across any number of cities. The eight
+hand-written cities come first so the usual queries keep working at any scale.
+
+Run:  uv run -m data.generator --cities 2000 --seed 7 --binary --out cache/catalogs/large
+Then: CATALOG_DIR=cache/catalogs/large uv run main.py
+"""
+
+import argparse
+import datetime
+import json
+import os
+import random
+from typing import Any
+from data.catalog_store import write_catalog
+
+SEED_CITIES = ["Mumbai", "Delhi", "Jaipur", "Goa", "Bengaluru", "Hyderabad", "Kochi", "Varanasi"]
+SEED_CENTERS = {
+    "Mumbai": (19.076, 72.8777), "Delhi": (28.6139, 77.209), "Jaipur": (26.9124, 75.7873),
+    "Goa": (15.4909, 73.8278), "Bengaluru": (12.9716, 77.5946), "Hyderabad": (17.385, 78.4867),
+    "Kochi": (9.9312, 76.2673), "Varanasi": (25.3176, 82.9739),
+}
+# synthetic cities are scattered over roughly India's bounding box
+CITY_BOUNDS = ((8.0, 32.0), (68.5, 88.0))
+
+SYLLABLES = [
+    "an", "bar", "cal", "dor", "el", "fen", "gar", "hal", "is", "jun", "kar", "lin",
+    "mor", "nel", "or", "pra", "quin", "ros", "sal", "tor", "ul", "ven", "wes", "yar", "zan",
+]
+CITY_SUFFIXES = ["", "pur", "abad", "ford", "ton", "ville", "nagar", "haven", "burg", "gate"]
+
+HOTEL_WORDS = ["Grand", "Royal", "Palace", "Residency", "Inn", "Suites", "Retreat", "Plaza", "Heritage", "Bay"]
+HOTEL_BRANDS = ["Taj", "Oberoi", "ITC", "Lemon Tree", "Radisson", "Hyatt", "Marriott", "Novotel", "Ginger", "Leela"]
+FACILITIES = ["WiFi", "Pool", "Spa", "Gym", "Parking", "Restaurant", "Bar", "Airport Shuttle", "Room Service"]
+STREETS = ["MG Road", "Station Road", "Lake View", "Old Town", "Civil Lines", "Market Street", "Hill Road", "Harbour Front"]
+
+CUISINES = ["North Indian", "South Indian", "Mughlai", "Seafood", "Street Food", "Cafe", "Italian",
+            "Chinese", "Rajasthani", "Kerala", "Vegetarian", "Modern Indian", "Bakery", "Barbecue"]
+RESTAURANT_WORDS = ["Spice", "Tandoor", "Leaf", "Curry", "Garden", "Kitchen", "Bistro", "House", "Table", "Dhaba"]
+
+ATTRACTION_TYPES = ["Monument", "Fort", "Palace", "Museum", "Temple", "Park", "Lake", "Beach",
+                    "Market", "Church", "Viewpoint", "UNESCO Heritage Site"]
+ATTRACTION_DESCRIPTIONS = {
+    "Monument": "Historic monument and a landmark of local architecture.",
+    "Fort": "Hilltop fort with ramparts, gateways and views over the old city.",
+    "Palace": "Royal palace with courtyards, galleries and ornate halls.",
+    "Museum": "Collections of art, history and archaeology of the region.",
+    "Temple": "Centuries-old temple known for its carvings and evening rituals.",
+    "Park": "Large green park with walking trails and gardens.",
+    "Lake": "Scenic lake with boating and sunset views.",
+    "Beach": "Sandy beach with water sports and seafood shacks.",
+    "Market": "Bustling bazaar for street food, spices and handicrafts.",
+    "Church": "Colonial-era church with stained glass and quiet cloisters.",
+    "Viewpoint": "Panoramic viewpoint over the city and surrounding hills.",
+    "UNESCO Heritage Site": "UNESCO World Heritage site of outstanding cultural value.",
+}
+
+EVENT_TYPES = ["Concert", "Festival", "Music Festival", "Food Festival", "Cultural Festival",
+               "Exhibition", "Conference", "Sports", "Theatre", "Comedy Show"]
+ORGANIZERS = ["BookMyShow", "Paytm Insider", "Teamwork Arts", "City Council", "Percept Live", "Skillbox"]
+
+AIRLINES = ["Air India", "IndiGo", "Vistara", "SpiceJet", "Akasa Air"]
+TRAINS = ["Rajdhani Express", "Shatabdi Express", "Duronto Express", "Vande Bharat", "Intercity Express"]
+PUBLIC_TYPES = ["Metro", "Bus", "Ferry", "Tram", "Auto Rickshaw"]
+CONDITIONS = ["Sunny", "Cloudy", "Humid", "Rainy", "Clear", "Windy", "Hazy"]
+
+
+def city_names(count: int, rng: random.Random) -> list[str]:
+    names = list(SEED_CITIES[:count])
+    seen = {n.lower() for n in names}
+    while len(names) < count:
+        name = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3)))
+        name = (name + rng.choice(CITY_SUFFIXES)).capitalize()
+        if name.lower() not in seen:
+            seen.add(name.lower())
+            names.append(name)
+    return names
+
+
+def duration(minutes: int) -> str:
+    hours, rest = divmod(minutes, 60)
+    return f"{hours}h {rest}m" if rest else f"{hours}h"
+
+
+def generate_catalogs(
+    cities: int = 1000,
+    seed: int = 7,
+    hotels_per_city: int = 20,
+    restaurants_per_city: int = 15,
+    attractions_per_city: int = 8,
+    events_per_city: int = 6,
+    routes_per_city: int = 3,
+    days: int = 7,
+    start_date: str = "2025-12-01",
+) -> dict[str, Any]:
+    """
+    Returns every catalog as plain lists/dicts. The same seed and sizes always give
+    the same catalogs; per-city counts vary around the given averages.
+    """
+    rng = random.Random(seed)
+    names = city_names(cities, rng)
+    start = datetime.date.fromisoformat(start_date)
+    # coordinates draw from their own stream so the other fields stay the same per seed
+    geo_rng = random.Random(f"{seed}-geo")
+    calendar_rng = random.Random(f"{seed}-calendar")
+
+    def around(mean: int) -> int:
+        return max(1, int(rng.gauss(mean, mean / 4)))
+
+    def spot(center: tuple[float, float], spread: float = 0.08) -> tuple[float, float]:
+        return (
+            round(center[0] + geo_rng.uniform(-spread, spread), 5),
+            round(center[1] + geo_rng.uniform(-spread, spread), 5),
+        )
+
+    hotels, destinations, restaurants, attractions, events = [], {}, [], [], []
+    public_transport, weather = [], {}
+    for c, city in enumerate(names):
+        destinations[city.lower()] = {"dest_id": f"SYN{c:06d}", "dest_type": "city", "name": city}
+        tier = rng.choice([0.6, 1.0, 1.5])
+        center = SEED_CENTERS.get(city) or (
+            round(geo_rng.uniform(*CITY_BOUNDS[0]), 4),
+            round(geo_rng.uniform(*CITY_BOUNDS[1]), 4),
+        )
+
+        for _ in range(around(hotels_per_city)):
+            stars = rng.randint(2, 5)
+            latitude, longitude = spot(center)
+            hotels.append({
+                "hotel_id": f"SH{len(hotels):07d}",
+                "latitude": latitude,
+                "longitude": longitude,
+                "hotel_name": f"{rng.choice(HOTEL_BRANDS)} {rng.choice(HOTEL_WORDS)} {city}",
+                "min_total_price": round(tier * stars * rng.uniform(900, 2400), 2),
+                "currency_code": "INR",
+                "review_score": round(min(10.0, rng.uniform(5.5, 7.5) + stars * 0.5), 1),
+                "address": f"{rng.randint(1, 400)} {rng.choice(STREETS)}, {city}",
+                "distance_to_cc": f"{rng.uniform(0.2, 15):.1f} km",
+                "description": f"{stars}-star hotel in {city}.",
+                "facilities": [{"name": f} for f in rng.sample(FACILITIES, rng.randint(2, 6))],
+            })
+
+        for _ in range(around(restaurants_per_city)):
+            cuisine = rng.choice(CUISINES)
+            latitude, longitude = spot(center)
+            restaurants.append({
+                "id": f"sres_{len(restaurants):07d}",
+                "coordinates": {"latitude": latitude, "longitude": longitude},
+                "name": f"{rng.choice(RESTAURANT_WORDS)} {rng.choice(RESTAURANT_WORDS)}",
+                "rating": round(rng.uniform(3.2, 4.9), 1),
+                "price": "$" * rng.randint(1, 4),
+                "location": {"address1": rng.choice(STREETS), "city": city},
+                "categories": [{"title": cuisine}],
+                "phone": f"+91-{rng.randint(20, 99)}-{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}",
+            })
+
+        for _ in range(around(attractions_per_city)):
+            kind = rng.choice(ATTRACTION_TYPES)
+            opens = rng.choice([6, 8, 9, 10])
+            latitude, longitude = spot(center)
+            attractions.append({
+                "id": f"splc_{len(attractions):07d}",
+                "latitude": latitude,
+                "longitude": longitude,
+                "name": f"{city} {kind}" if rng.random() < 0.5 else f"{rng.choice(HOTEL_WORDS)} {kind}",
+                "type": kind,
+                "location": f"{rng.choice(STREETS)}, {city}",
+                "city": city,
+                "rating": round(rng.uniform(3.5, 4.9), 1),
+                "entry_fee": float(rng.choice([0, 0, 20, 50, 100, 250, 500])),
+                "currency": "INR",
+                "timings": f"{opens:02d}:00 - {opens + rng.randint(7, 11):02d}:00",
+                "description": ATTRACTION_DESCRIPTIONS[kind],
+            })
+
+        for _ in range(around(events_per_city)):
+            kind = rng.choice(EVENT_TYPES)
+            event = {
+                "id": f"sevt_{len(events):07d}",
+                "name": f"{city} {kind} {rng.randint(1, 20)}",
+                "type": kind,
+                "location": f"{rng.choice(STREETS)}, {city}",
+                "date": str(start + datetime.timedelta(days=rng.randrange(365))),
+                "time": f"{rng.choice([10, 12, 17, 18, 19, 20])}:00",
+                "price": float(rng.choice([0, 250, 500, 1000, 2500, 5000])),
+                "currency": "INR",
+                "organizer": rng.choice(ORGANIZERS),
+            }
+            # about a fifth of events run several days and a tenth repeat
+            shape = calendar_rng.random()
+            if shape < 0.2:
+                first = datetime.date.fromisoformat(event["date"])
+                event["end_date"] = str(first + datetime.timedelta(days=calendar_rng.randint(1, 9)))
+            elif shape < 0.3:
+                event["recurrence"] = calendar_rng.choice(["weekly", "weekly", "monthly"])
+                event["until"] = str(start + datetime.timedelta(days=365 + calendar_rng.randrange(365)))
+            events.append(event)
+
+        for kind in rng.sample(PUBLIC_TYPES, 2):
+            latitude, longitude = spot(center, spread=0.05)
+            public_transport.append({
+                "id": f"spub_{len(public_transport):07d}",
+                "latitude": latitude,
+                "longitude": longitude,
+                "type": kind,
+                "route": f"{city} {kind} Line {rng.randint(1, 9)}",
+                "location": f"{rng.choice(STREETS)} to {rng.choice(STREETS)}",
+                "frequency": f"Every {rng.choice([5, 8, 10, 15, 20, 30])} min",
+                "price": float(rng.choice([10, 20, 30, 50, 60])),
+                "currency": "INR",
+            })
+
+        temp = rng.randint(12, 38)
+        weather[city.lower()] = {
+            "city": city,
+            "temp": temp,
+            "feels_like": temp + rng.randint(-2, 4),
+            "condition": rng.choice(CONDITIONS),
+            "humidity": rng.randint(20, 95),
+            "wind": rng.randint(2, 30),
+            "date": str(start),
+        }
+
+    flights, trains = [], []
+    for c, origin in enumerate(names):
+        others = [d for d in range(len(names)) if d != c]
+        for d in rng.sample(others, min(routes_per_city, len(others))):
+            destination = names[d]
+            flight_minutes = rng.randint(60, 200)
+            train_minutes = flight_minutes * rng.randint(4, 7)
+            for day in range(days):
+                date = start + datetime.timedelta(days=day)
+                for _ in range(rng.randint(1, 2)):
+                    departs = datetime.datetime.combine(date, datetime.time(rng.randint(5, 21), rng.choice([0, 15, 30, 45])))
+                    flights.append({
+                        "id": f"sflt_{len(flights):07d}",
+                        "airline": rng.choice(AIRLINES),
+                        "from": origin,
+                        "to": destination,
+                        "departure": departs.strftime("%Y-%m-%dT%H:%M"),
+                        "arrival": (departs + datetime.timedelta(minutes=flight_minutes)).strftime("%Y-%m-%dT%H:%M"),
+                        "price": round(flight_minutes * rng.uniform(35, 70), 2),
+                        "currency": "INR",
+                        "duration": duration(flight_minutes),
+                    })
+                if rng.random() < 0.6:
+                    departs = datetime.datetime.combine(date, datetime.time(rng.randint(5, 22), rng.choice([0, 30])))
+                    trains.append({
+                        "id": f"strn_{len(trains):07d}",
+                        "train": rng.choice(TRAINS),
+                        "from": origin,
+                        "to": destination,
+                        "departure": departs.strftime("%Y-%m-%dT%H:%M"),
+                        "arrival": (departs + datetime.timedelta(minutes=train_minutes)).strftime("%Y-%m-%dT%H:%M"),
+                        "price": round(train_minutes * rng.uniform(1.5, 4), 2),
+                        "currency": "INR",
+                        "duration": duration(train_minutes),
+                    })
+
+    return {
+        "hotels": hotels,
+        "hotel_destinations": destinations,
+        "restaurants": restaurants,
+        "attractions": attractions,
+        "events": events,
+        "flights": flights,
+        "trains": trains,
+        "public_transport": public_transport,
+        "weather": weather,
+    }
+
+
+def write_catalogs(
+    catalogs: dict[str, Any], out_dir: str, binary: bool = False, **manifest: Any
+) -> dict[str, int]:
+    """
+    Writes one <name>.json per catalog plus manifest.json (generator settings and
+    record counts) and returns the counts. With binary, list catalogs are also
+    written as memory-mappable <name>.odc files, which the servers prefer.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    counts = {name: len(records) for name, records in catalogs.items()}
+    for name, records in catalogs.items():
+        with open(os.path.join(out_dir, f"{name}.json"), "w") as f:
+            json.dump(records, f, separators=(",", ":"))
+        if binary and isinstance(records, list):
+            write_catalog(records, os.path.join(out_dir, f"{name}.odc"))
+    with open(os.path.join(out_dir, "manifest.json"), "w") as f:
+        json.dump({**manifest, "counts": counts}, f, indent=2)
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate synthetic catalogs for load testing.")
+    parser.add_argument("--cities", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--hotels-per-city", type=int, default=20)
+    parser.add_argument("--restaurants-per-city", type=int, default=15)
+    parser.add_argument("--attractions-per-city", type=int, default=8)
+    parser.add_argument("--events-per-city", type=int, default=6)
+    parser.add_argument("--routes-per-city", type=int, default=3)
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--binary", action="store_true", help="also write memory-mappable .odc files")
+    parser.add_argument("--out", default="cache/catalogs/synthetic")
+    args = parser.parse_args()
+
+    settings = {k: v for k, v in vars(args).items() if k not in ("out", "binary")}
+    counts = write_catalogs(generate_catalogs(**settings), args.out, binary=args.binary, **settings)
+    print(f"Wrote catalogs to {args.out}: " + ", ".join(f"{k}={v}" for k, v in counts.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,8 @@ HOTEL_DATA = [
     # --------- Mumbai ---------
     {
         "hotel_id": "INH001",
+        "latitude": 18.9857,
+        "longitude": 72.8553,
         "hotel_name": "Taj Mahal Palace",
         "min_total_price": 15000.00,
         "currency_code": "INR",
@@ -18,6 +20,8 @@ HOTEL_DATA = [
     },
     {
         "hotel_id": "INH002",
+        "latitude": 18.9815,
+        "longitude": 72.8497,
         "hotel_name": "Trident Nariman Point",
         "min_total_price": 12000.00,
         "currency_code": "INR",
@@ -34,6 +38,8 @@ HOTEL_DATA = [
     },
     {
         "hotel_id": "INH003",
+        "latitude": 18.961,
+        "longitude": 72.8137,
         "hotel_name": "Hotel Suba Palace",
         "min_total_price": 6000.00,
         "currency_code": "INR",
@@ -46,6 +52,8 @@ HOTEL_DATA = [
     # --------- Delhi ---------
     {
         "hotel_id": "INH004",
+        "latitude": 28.6305,
+        "longitude": 77.1955,
         "hotel_name": "ITC Maurya",
         "min_total_price": 12000.00,
         "currency_code": "INR",
@@ -62,6 +70,8 @@ HOTEL_DATA = [
     },
     {
         "hotel_id": "INH005",
+        "latitude": 28.6291,
+        "longitude": 77.2366,
         "hotel_name": "The Leela Palace Delhi",
         "min_total_price": 15000.00,
         "currency_code": "INR",
@@ -78,6 +88,8 @@ HOTEL_DATA = [
     },
     {
         "hotel_id": "INH006",
+        "latitude": 28.5924,
+        "longitude": 77.2232,
         "hotel_name": "Bloomrooms @ New Delhi Railway Station",
         "min_total_price": 3500.00,
         "currency_code": "INR",
@@ -90,6 +102,8 @@ HOTEL_DATA = [
     # --------- Jaipur ---------
     {
         "hotel_id": "INH007",
+        "latitude": 26.892,
+        "longitude": 75.7872,
         "hotel_name": "Rambagh Palace",
         "min_total_price": 25000.00,
         "currency_code": "INR",
@@ -106,6 +120,8 @@ HOTEL_DATA = [
     },
     {
         "hotel_id": "INH008",
+        "latitude": 26.9193,
+        "longitude": 75.7959,
         "hotel_name": "Jai Mahal Palace",
         "min_total_price": 14000.00,
         "currency_code": "INR",
@@ -123,6 +139,8 @@ HOTEL_DATA = [
     # --------- Goa ---------
     {
         "hotel_id": "INH009",
+        "latitude": 15.4875,
+        "longitude": 73.8282,
         "hotel_name": "Alila Diwa Goa",
         "min_total_price": 8000.00,
         "currency_code": "INR",
@@ -139,6 +157,8 @@ HOTEL_DATA = [
     },
     {
         "hotel_id": "INH010",
+        "latitude": 15.4691,
+        "longitude": 73.8279,
         "hotel_name": "Taj Exotica Resort & Spa",
         "min_total_price": 16000.00,
         "currency_code": "INR",
@@ -156,6 +176,8 @@ HOTEL_DATA = [
     # --------- Bengaluru ---------
     {
         "hotel_id": "INH011",
+        "latitude": 12.9522,
+        "longitude": 77.5893,
         "hotel_name": "The Leela Palace Bengaluru",
         "min_total_price": 14000.00,
         "currency_code": "INR",
@@ -172,6 +194,8 @@ HOTEL_DATA = [
     },
     {
         "hotel_id": "INH012",
+        "latitude": 12.9534,
+        "longitude": 77.6128,
         "hotel_name": "ITC Gardenia",
         "min_total_price": 11000.00,
         "currency_code": "INR",
@@ -189,6 +213,8 @@ HOTEL_DATA = [
     # --------- Hyderabad ---------
     {
         "hotel_id": "INH013",
+        "latitude": 17.3665,
+        "longitude": 78.4972,
         "hotel_name": "Hyatt Hyderabad Gachibowli",
         "min_total_price": 7500.00,
         "currency_code": "INR",
@@ -205,6 +231,8 @@ HOTEL_DATA = [
     },
     {
         "hotel_id": "INH014",
+        "latitude": 17.3729,
+        "longitude": 78.5111,
         "hotel_name": "Taj Falaknuma Palace",
         "min_total_price": 24000.00,
         "currency_code": "INR",
@@ -222,6 +250,8 @@ HOTEL_DATA = [
     # --------- Kochi ---------
     {
         "hotel_id": "INH015",
+        "latitude": 9.9565,
+        "longitude": 76.2187,
         "hotel_name": "Brunton Boatyard",
         "min_total_price": 9500.00,
         "currency_code": "INR",
@@ -238,6 +268,8 @@ HOTEL_DATA = [
     },
     {
         "hotel_id": "INH016",
+        "latitude": 9.9951,
+        "longitude": 76.2265,
         "hotel_name": "Taj Malabar Resort & Spa",
         "min_total_price": 12500.00,
         "currency_code": "INR",
@@ -255,6 +287,8 @@ HOTEL_DATA = [
     # --------- Varanasi ---------
     {
         "hotel_id": "INH017",
+        "latitude": 25.3109,
+        "longitude": 82.947,
         "hotel_name": "Taj Nadesar Palace",
         "min_total_price": 11000.00,
         "currency_code": "INR",
@@ -271,6 +305,8 @@ HOTEL_DATA = [
     },
     {
         "hotel_id": "INH018",
+        "latitude": 25.2937,
+        "longitude": 82.9493,
         "hotel_name": "BrijRama Palace",
         "min_total_price": 13000.00,
         "currency_code": "INR",
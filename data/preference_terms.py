@@ -0,0 +1,21 @@
+# ----------- Preference vocabulary -----------
+# Trip preferences are short words ("history", "nightlife") that rarely appear in
+# catalog text verbatim; each expands to terms the catalogs do use.
+PREFERENCE_TERMS = {
+    "history": "heritage historic monument fort palace memorial museum unesco mughal ancient",
+    "heritage": "history historic monument fort palace unesco",
+    "culture": "cultural heritage temple museum art festival fair",
+    "art": "arts gallery exhibition museum craft",
+    "music": "concert festival live",
+    "food": "cuisine restaurant cafe",
+    "nature": "park lake garden beach hill wildlife",
+    "beach": "sea coast promenade",
+    "spiritual": "temple church mosque religious shrine",
+    "religion": "temple church mosque religious shrine",
+    "nightlife": "bar pub brewpub club",
+    "shopping": "market bazaar mall",
+    "adventure": "trek hill fort",
+    "wellness": "yoga spa retreat",
+    "tech": "technology expo conference",
+    "family": "park museum fair",
+}
@@ -2,6 +2,7 @@ RESTAURANT_DATA = [
     # --------- Mumbai ---------
     {
         "id": "res_201",
+        "coordinates": {"latitude": 18.9986, "longitude": 72.8102},
         "name": "Trishna",
         "rating": 4.6,
         "price": "$$$",
@@ -11,6 +12,7 @@ RESTAURANT_DATA = [
     },
     {
         "id": "res_202",
+        "coordinates": {"latitude": 18.9457, "longitude": 72.8544},
         "name": "The Table",
         "rating": 4.5,
         "price": "$$$",
@@ -20,6 +22,7 @@ RESTAURANT_DATA = [
     },
     {
         "id": "res_203",
+        "coordinates": {"latitude": 18.9523, "longitude": 72.8287},
         "name": "Bademiya",
         "rating": 4.3,
         "price": "$$",
@@ -30,6 +33,7 @@ RESTAURANT_DATA = [
     # --------- Delhi ---------
     {
         "id": "res_204",
+        "coordinates": {"latitude": 28.5917, "longitude": 77.2324},
         "name": "Indian Accent",
         "rating": 4.8,
         "price": "$$$$",
@@ -39,6 +43,7 @@ RESTAURANT_DATA = [
     },
     {
         "id": "res_205",
+        "coordinates": {"latitude": 28.6425, "longitude": 77.1851},
         "name": "Karim's",
         "rating": 4.4,
         "price": "$$",
@@ -48,6 +53,7 @@ RESTAURANT_DATA = [
     },
     {
         "id": "res_206",
+        "coordinates": {"latitude": 28.6175, "longitude": 77.1936},
         "name": "Saravana Bhavan",
         "rating": 4.2,
         "price": "$",
@@ -58,6 +64,7 @@ RESTAURANT_DATA = [
     # --------- Jaipur ---------
     {
         "id": "res_207",
+        "coordinates": {"latitude": 26.9031, "longitude": 75.7874},
         "name": "1135 AD",
         "rating": 4.6,
         "price": "$$$",
@@ -67,6 +74,7 @@ RESTAURANT_DATA = [
     },
     {
         "id": "res_208",
+        "coordinates": {"latitude": 26.9012, "longitude": 75.8008},
         "name": "LMB (Laxmi Mishthan Bhandar)",
         "rating": 4.3,
         "price": "$",
@@ -77,6 +85,7 @@ RESTAURANT_DATA = [
     # --------- Goa ---------
     {
         "id": "res_209",
+        "coordinates": {"latitude": 15.5047, "longitude": 73.8465},
         "name": "Gunpowder",
         "rating": 4.5,
         "price": "$$",
@@ -86,6 +95,7 @@ RESTAURANT_DATA = [
     },
     {
         "id": "res_210",
+        "coordinates": {"latitude": 15.4971, "longitude": 73.8089},
         "name": "Thalassa",
         "rating": 4.7,
         "price": "$$$",
@@ -96,6 +106,7 @@ RESTAURANT_DATA = [
     # --------- Bengaluru ---------
     {
         "id": "res_211",
+        "coordinates": {"latitude": 12.9691, "longitude": 77.607},
         "name": "Mavalli Tiffin Room (MTR)",
         "rating": 4.6,
         "price": "$",
@@ -105,6 +116,7 @@ RESTAURANT_DATA = [
     },
     {
         "id": "res_212",
+        "coordinates": {"latitude": 12.9515, "longitude": 77.5886},
         "name": "Toit",
         "rating": 4.5,
         "price": "$$",
@@ -115,6 +127,7 @@ RESTAURANT_DATA = [
     # --------- Hyderabad ---------
     {
         "id": "res_213",
+        "coordinates": {"latitude": 17.4082, "longitude": 78.4913},
         "name": "Paradise Biryani",
         "rating": 4.4,
         "price": "$",
@@ -124,6 +137,7 @@ RESTAURANT_DATA = [
     },
     {
         "id": "res_214",
+        "coordinates": {"latitude": 17.4063, "longitude": 78.4922},
         "name": "Jewel of Nizam",
         "rating": 4.7,
         "price": "$$$$",
@@ -134,6 +148,7 @@ RESTAURANT_DATA = [
     # --------- Kochi ---------
     {
         "id": "res_215",
+        "coordinates": {"latitude": 9.948, "longitude": 76.2199},
         "name": "Dhe Puttu",
         "rating": 4.5,
         "price": "$",
@@ -143,6 +158,7 @@ RESTAURANT_DATA = [
     },
     {
         "id": "res_216",
+        "coordinates": {"latitude": 9.9398, "longitude": 76.2276},
         "name": "Kashi Art Café",
         "rating": 4.6,
         "price": "$$",
@@ -153,6 +169,7 @@ RESTAURANT_DATA = [
     # --------- Varanasi ---------
     {
         "id": "res_217",
+        "coordinates": {"latitude": 25.3191, "longitude": 82.9651},
         "name": "Kashi Chat Bhandar",
         "rating": 4.3,
         "price": "$",
@@ -162,6 +179,7 @@ RESTAURANT_DATA = [
     },
     {
         "id": "res_218",
+        "coordinates": {"latitude": 25.2904, "longitude": 82.982},
         "name": "Pizzeria Vaatika Café",
         "rating": 4.4,
         "price": "$$",
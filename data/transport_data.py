@@ -209,6 +209,8 @@ bus_data = [
 PUBLIC_TRANSPORT_DATA = [
     {
         "id": "metro_601",
+        "latitude": 28.5562,
+        "longitude": 77.1,
         "type": "Metro",
         "route": "Delhi Metro Airport Line",
         "location": "IGI Airport to New Delhi Station",
@@ -218,6 +220,8 @@ PUBLIC_TRANSPORT_DATA = [
     },
     {
         "id": "metro_602",
+        "latitude": 19.1318,
+        "longitude": 72.8193,
         "type": "Metro",
         "route": "Mumbai Metro Line 1",
         "location": "Versova to Ghatkopar",
@@ -227,6 +231,8 @@ PUBLIC_TRANSPORT_DATA = [
     },
     {
         "id": "metro_603",
+        "latitude": 12.9784,
+        "longitude": 77.5695,
         "type": "Metro",
         "route": "Bengaluru Namma Metro Purple Line",
         "location": "KSR Bengaluru to Whitefield",
@@ -236,6 +242,8 @@ PUBLIC_TRANSPORT_DATA = [
     },
     {
         "id": "metro_604",
+        "latitude": 17.4968,
+        "longitude": 78.3614,
         "type": "Metro",
         "route": "Hyderabad Metro Red Line",
         "location": "Miyapur to LB Nagar",
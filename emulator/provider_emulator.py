@@ -0,0 +1,162 @@
+"""
+Local stand-in for the Booking, Yelp, OpenWeather, events, attractions and transport
+APIs, serving the data/ catalogs over real HTTP so the live-mode code paths
+(make_*_request -> async_get) can be exercised and load-tested offline.
+
+Run:  uv run -m emulator.provider_emulator --latency-ms 80 --error-rate 0.02
+Then point the servers at it (see .env.example), e.g.
+      BOOKING_API_BASE=http://127.0.0.1:9100/booking/v1 HOTEL_MOCK=False
+"""
+
+import argparse
+import asyncio
+import copy
+import hashlib
+import json
+import random
+from typing import Any, Callable
+from fastapi import FastAPI, Request, Response
+from config import (
+    EMULATOR_HOST,
+    EMULATOR_PORT,
+    EMULATOR_LATENCY_MS,
+    EMULATOR_JITTER_MS,
+    EMULATOR_ERROR_RATE,
+    EMULATOR_PAYLOAD_SCALE,
+    EMULATOR_MAX_AGE,
+)
+from servers.hotel_mcp_server import HotelMCPServer
+from servers.restaurant_mcp_server import RestaurantMCPServer
+from servers.weather_mcp_server import WeatherMCPServer
+from servers.event_mcp_server import EventMCPServer
+from servers.attraction_mcp_server import AttractionMCPServer
+from servers.transport_mcp_server import TransportMCPServer
+from utils.logger import get_logger
+
+logger = get_logger("ProviderEmulator")
+
+
+class EmulatorSettings:
+    def __init__(
+        self,
+        latency_ms: float = EMULATOR_LATENCY_MS,
+        jitter_ms: float = EMULATOR_JITTER_MS,
+        error_rate: float = EMULATOR_ERROR_RATE,
+        payload_scale: int = EMULATOR_PAYLOAD_SCALE,
+        max_age: int = EMULATOR_MAX_AGE,
+    ):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.payload_scale = payload_scale
+        self.max_age = max_age
+
+
+def scale_payload(payload: Any, factor: int) -> Any:
+    """
+    Multiplies every top-level result list by factor, suffixing ids of the copies,
+    to emulate providers returning larger pages.
+    """
+    if factor <= 1:
+        return payload
+
+    def grow(items: list) -> list:
+        grown = list(items)
+        for n in range(1, factor):
+            for item in items:
+                item = copy.deepcopy(item)
+                for id_field in ("id", "hotel_id", "dest_id"):
+                    if isinstance(item, dict) and id_field in item:
+                        item[id_field] = f"{item[id_field]}-{n}"
+                grown.append(item)
+        return grown
+
+    if isinstance(payload, list):
+        return grow(payload)
+    if isinstance(payload, dict):
+        return {k: grow(v) if isinstance(v, list) else v for k, v in payload.items()}
+    return payload
+
+
+def create_app(settings: EmulatorSettings | None = None) -> FastAPI:
+    settings = settings or EmulatorSettings()
+    app = FastAPI(title="Odysya provider emulator")
+    app.state.settings = settings
+    app.state.requests = 0
+
+    hotel = HotelMCPServer()
+    restaurant = RestaurantMCPServer()
+    weather = WeatherMCPServer()
+    event = EventMCPServer()
+    attraction = AttractionMCPServer()
+    transport = TransportMCPServer()
+
+    # provider prefix -> builds the response from the same mock catalogs the servers use
+    providers: dict[str, Callable[[str, dict], Any]] = {
+        "booking/v1": hotel.get_mock_response,
+        "yelp/v3": restaurant.get_mock_response,
+        "openweather/data/2.5": lambda path, params: weather.get_mock_response(
+            path.strip("/"), params
+        ),
+        "events/v1": event.get_mock_response,
+        "attractions/v1": attraction.get_mock_response,
+        "transport/v1": transport.get_mock_response,
+    }
+
+    async def serve(prefix: str, path: str, request: Request) -> Response:
+        app.state.requests += 1
+        delay = settings.latency_ms + random.uniform(0, settings.jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+        if random.random() < settings.error_rate:
+            return Response(status_code=503, headers={"Retry-After": "1"})
+
+        payload = providers[prefix](f"/{path}", dict(request.query_params))
+        if payload is None:
+            return Response(status_code=404)
+        body = json.dumps(scale_payload(copy.deepcopy(payload), settings.payload_scale))
+
+        headers = {}
+        if settings.max_age > 0:
+            etag = '"' + hashlib.md5(body.encode()).hexdigest() + '"'
+            headers = {"Cache-Control": f"max-age={settings.max_age}", "ETag": etag}
+            if request.headers.get("if-none-match") == etag:
+                return Response(status_code=304, headers=headers)
+        return Response(body, media_type="application/json", headers=headers)
+
+    for prefix in providers:
+
+        async def route(path: str, request: Request, prefix: str = prefix) -> Response:
+            return await serve(prefix, path, request)
+
+        app.add_api_route(f"/{prefix}/{{path:path}}", route, methods=["GET"])
+
+    @app.get("/_emulator/stats")
+    async def stats():
+        return {"requests": app.state.requests, **vars(settings)}
+
+    return app
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Local provider API emulator")
+    parser.add_argument("--host", default=EMULATOR_HOST)
+    parser.add_argument("--port", type=int, default=EMULATOR_PORT)
+    parser.add_argument("--latency-ms", type=float, default=EMULATOR_LATENCY_MS)
+    parser.add_argument("--jitter-ms", type=float, default=EMULATOR_JITTER_MS)
+    parser.add_argument("--error-rate", type=float, default=EMULATOR_ERROR_RATE)
+    parser.add_argument("--payload-scale", type=int, default=EMULATOR_PAYLOAD_SCALE)
+    parser.add_argument("--max-age", type=int, default=EMULATOR_MAX_AGE)
+    args = parser.parse_args()
+
+    settings = EmulatorSettings(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        payload_scale=args.payload_scale,
+        max_age=args.max_age,
+    )
+    logger.info(f"Provider emulator starting | {vars(settings)}")
+    uvicorn.run(create_app(settings), host=args.host, port=args.port, log_level="warning")
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import os
 from typing import Optional, List
@@ -5,9 +6,11 @@ from contextlib import AsyncExitStack
 
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
-from config import llm_model
+from mcp.types import CancelledNotification, CancelledNotificationParams, ClientNotification
+from config import llm_model, HEDGE_MCP_CALLS
 from utils.logger import get_logger
 from utils.error_handler import ClientError
+from utils.hedging import get_hedger
 
 from dotenv import load_dotenv
 
@@ -23,6 +26,8 @@ class MCPClient:
         self.groq = llm_model
         self.tools: List = []
         self.client_name = "Generic"
+        # set by MCPSessionPool; hedged calls need a session in another server process
+        self.pool = None
 
     async def connect(self, server_script_path: str):
         logger.info(f"[{self.client_name}] Connecting to server: {server_script_path}")
@@ -59,7 +64,7 @@ class MCPClient:
             f"Only use tools that are listed above. Do not invent tool names or parameters."
         )
 
-    def _select_best_tool(self, query: str) -> tuple[str, dict]:
+    async def _select_best_tool(self, query: str) -> tuple[str, dict]:
         """Deterministically select the best tool and extract params from the query
         using the LLM, bypassing Groq's unreliable tool_choice mechanism."""
         tool_descriptions = []
@@ -83,7 +88,7 @@ class MCPClient:
             "- For optional parameters, only include them if the query mentions them"
         )
 
-        response = self.groq.invoke([{"role": "user", "content": selection_prompt}])
+        response = await self.groq.ainvoke([{"role": "user", "content": selection_prompt}])
 
         raw = response.content.strip()
         # Strip markdown code fences if present
@@ -96,11 +101,52 @@ class MCPClient:
         parsed = json.loads(raw)
         return parsed["tool"], parsed.get("args", {})
 
+    async def _call_tool(self, tool_name: str, tool_args: dict):
+        # a duplicate on this session would queue behind the original in the same
+        # server process, so only a pooled client with another session hedges
+        if not (HEDGE_MCP_CALLS and self.pool and self.pool.pick(exclude=self)):
+            return await self.session.call_tool(tool_name, tool_args)
+        targets = iter([self])
+
+        def call():
+            client = next(targets, None) or self.pool.pick(exclude=self) or self
+            return self._call_on(client, tool_name, tool_args)
+
+        hedger = get_hedger(f"mcp:{self.client_name.lower()}")
+        return await hedger.run(call)
+
+    async def _call_on(self, client: "MCPClient", tool_name: str, tool_args: dict):
+        """
+        Calls a tool on client's session. If the call is cancelled (a hedge lost),
+        the server is told to cancel it too; ClientSession alone would leave it
+        running in the server process.
+        """
+        session = client.session
+        # call_tool sends the request without yielding first, so this is its id
+        request_id = session._request_id
+        counted = client is not self and client in self.pool.in_flight
+        if counted:
+            self.pool.in_flight[client] += 1
+        try:
+            return await session.call_tool(tool_name, tool_args)
+        except asyncio.CancelledError:
+            notification = CancelledNotification(
+                params=CancelledNotificationParams(requestId=request_id, reason="hedged call lost")
+            )
+            try:
+                await asyncio.shield(session.send_notification(ClientNotification(notification)))
+            except Exception as e:
+                logger.debug(f"[{self.client_name}] Cancel notification failed: {e}")
+            raise
+        finally:
+            if counted and client in self.pool.in_flight:
+                self.pool.in_flight[client] -= 1
+
     async def process_query(self, query: str) -> str:
         logger.info(f"[{self.client_name}] Processing query: {query[:100]}...")
         try:
             # Step 1: Use LLM to select tool and extract params deterministically
-            tool_name, tool_args = self._select_best_tool(query)
+            tool_name, tool_args = await self._select_best_tool(query)
 
             valid_tool_names = {tool.name for tool in self.tools}
             if tool_name not in valid_tool_names:
@@ -115,7 +161,7 @@ class MCPClient:
             )
 
             # Step 2: Call the MCP tool directly
-            result = await self.session.call_tool(tool_name, tool_args)
+            result = await self._call_tool(tool_name, tool_args)
             tool_result = result.content[0].text if result.content else str(result)
             logger.info(
                 f"[{self.client_name}] Tool {tool_name} returned {len(tool_result)} chars"
@@ -137,7 +183,7 @@ class MCPClient:
                 },
             ]
 
-            followup = self.groq.invoke(messages)
+            followup = await self.groq.ainvoke(messages)
 
             summary = followup.content
             logger.info(f"[{self.client_name}] Query processed successfully")
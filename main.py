@@ -1,10 +1,40 @@
+import asyncio
+import time
+import uuid
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, HTTPException
+from typing import Any, Awaitable, Callable
+from fastapi import FastAPI, HTTPException, Header, Request
+from fastapi.responses import JSONResponse
 from models.trip_request import TripRequest
 from models.planner_state import PlannerState
+from models.batch import BatchPlanRequest
 from utils.validator import validate_trip_request
 from utils.logger import get_logger
-from agents.planner_agent import travel_planner
+from utils.checkpointer import open_checkpointer, compact_plan, plan_config
+from utils.error_handler import CapacityError, handle_error
+from utils.job_queue import PlanJobQueue
+from utils.admission import AdmissionController
+from utils.hedging import hedging_stats
+from utils.http_client import http_client_lifespan
+from clients.session_pool import mcp_sessions_lifespan
+from config import (
+    PLAN_WORKERS,
+    PLAN_QUEUE_SIZE,
+    PLAN_JOB_HISTORY,
+    BATCH_MAX_TRIPS,
+    BATCH_CONCURRENCY,
+    MAX_CONCURRENT_PLANS,
+    ADMISSION_QUEUE_SIZE,
+    ADMISSION_TIMEOUT,
+)
+from agents.planner_agent import (
+    get_travel_planner,
+    PLANNER_TIERS,
+    itinerary_failed,
+    affected_domains,
+    domain_cache,
+    domain_bulkheads,
+)
 
 logger = get_logger("Main")
 
@@ -12,7 +42,26 @@ logger = get_logger("Main")
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Odysya starting up")
-    yield
+    async with (
+        http_client_lifespan(app),
+        mcp_sessions_lifespan(app),
+        open_checkpointer() as checkpointer,
+    ):
+        app.state.checkpointer = checkpointer
+        app.state.admission = AdmissionController(
+            max_concurrent=MAX_CONCURRENT_PLANS,
+            max_waiting=ADMISSION_QUEUE_SIZE,
+            wait_timeout=ADMISSION_TIMEOUT,
+        )
+        app.state.plan_jobs = PlanJobQueue(
+            run_plan_job,
+            workers=PLAN_WORKERS,
+            max_queue=PLAN_QUEUE_SIZE,
+            history_limit=PLAN_JOB_HISTORY,
+        )
+        await app.state.plan_jobs.start()
+        yield
+        await app.state.plan_jobs.stop()
     logger.info("Odysya shutting down")
 
 
@@ -24,15 +73,104 @@ app = FastAPI(
 )
 
 
+def planner_for(tier: str = "full"):
+    return get_travel_planner(tier, checkpointer=app.state.checkpointer)
+
+
+def check_tier(tier: str) -> None:
+    if tier not in PLANNER_TIERS:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Unknown tier '{tier}'. Expected one of: {list(PLANNER_TIERS)}",
+        )
+
+
+async def run_planner(
+    plan_id: str,
+    planner_input: PlannerState | None,
+    tier: str = "full",
+    bounded: bool = True,
+    prepare: Callable[[], Awaitable[Any]] | None = None,
+) -> dict[str, Any]:
+    """
+    Runs (or resumes, when planner_input is None) the plan's graph thread once the
+    admission controller grants a slot. prepare runs inside the slot, so state
+    edits are not applied when the request is shed. Checkpoints are compacted
+    afterwards whether the run succeeded or not.
+    """
+    async with app.state.admission.admit(bounded):
+        try:
+            if prepare:
+                await prepare()
+            return await planner_for(tier).ainvoke(
+                planner_input, plan_config(plan_id)
+            )
+        finally:
+            await compact_plan(app.state.checkpointer, plan_id)
+
+
+async def run_plan_job(plan_id: str, initial_state: PlannerState) -> dict[str, Any]:
+    result = await run_planner(
+        plan_id, initial_state, tier=initial_state["tier"], bounded=False
+    )
+    return build_plan_response(plan_id, result)
+
+
+def build_plan_response(plan_id: str, result: dict[str, Any]) -> dict[str, Any]:
+    final_itinerary = result.get("final_itinerary", {})
+    detailed = None
+    recommendations = []
+
+    if isinstance(final_itinerary, dict):
+        detailed = final_itinerary.get("detailed_itinerary")
+        recommendations = final_itinerary.get("key_recommendations", [])
+    elif final_itinerary:
+        detailed = str(final_itinerary)
+
+    return {
+        "success": True,
+        "plan_id": plan_id,
+        "destination": result["trip"].destination,
+        "tier": result.get("tier", "full"),
+        "detailed_itinerary": detailed,
+        "key_recommendations": recommendations,
+        "retry_count": result.get("retry_count", 0),
+        "notes": result.get("notes", ""),
+    }
+
+
+@app.exception_handler(CapacityError)
+async def capacity_error_handler(request: Request, exc: CapacityError):
+    return JSONResponse(
+        status_code=exc.code,
+        content=handle_error(exc),
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
 @app.get("/health")
 async def health_check():
     logger.info("GET /health")
     return {"status": "ok"}
 
 
+@app.get("/metrics")
+async def metrics():
+    return {
+        "domain_cache": domain_cache.stats(),
+        "bulkheads": {
+            domain: bulkhead.stats() for domain, bulkhead in domain_bulkheads.items()
+        },
+        "hedging": hedging_stats(),
+        "plan_jobs": app.state.plan_jobs.stats(),
+        "admission": app.state.admission.stats(),
+    }
+
+
 @app.post("/plan")
-async def plan_trip(request: TripRequest):
-    logger.info(f"POST /plan | destination={request.destination}")
+async def plan_trip(request: TripRequest, tier: str = "full"):
+    logger.info(f"POST /plan | destination={request.destination} | tier={tier}")
+    check_tier(tier)
 
     try:
         trip: TripRequest = validate_trip_request(request.model_dump())
@@ -40,39 +178,268 @@ async def plan_trip(request: TripRequest):
         logger.error(f"Validation failed | error={e}")
         raise HTTPException(status_code=422, detail=str(e))
 
-    initial_state = PlannerState.create(trip)
+    plan_id = uuid.uuid4().hex
+    initial_state = PlannerState.create(trip, tier)
 
     try:
-        logger.info("Invoking travel planner graph...")
-        result = await travel_planner.ainvoke(initial_state, {"recursion_limit": 50})
+        logger.info(f"Invoking travel planner graph | plan_id={plan_id}")
+        result = await run_planner(plan_id, initial_state, tier=tier)
+    except CapacityError:
+        raise
     except Exception as e:
-        logger.error(f"Planner failed | error={e}")
-        raise HTTPException(status_code=500, detail=f"Planning failed: {e}")
+        logger.error(f"Planner failed | plan_id={plan_id} | error={e}")
+        raise HTTPException(
+            status_code=500,
+            detail={"plan_id": plan_id, "error": f"Planning failed: {e}"},
+        )
 
-    final_itinerary = result.get("final_itinerary", {})
-    detailed = None
-    recommendations = []
+    logger.info(
+        f"Plan complete | plan_id={plan_id} | destination={request.destination} | retries={result.get('retry_count', 0)}"
+    )
 
-    if isinstance(final_itinerary, dict):
-        detailed = final_itinerary.get("detailed_itinerary")
-        recommendations = final_itinerary.get("key_recommendations", [])
-    elif final_itinerary:
-        detailed = str(final_itinerary)
+    return build_plan_response(plan_id, result)
+
+
+@app.post("/plan/batch")
+async def plan_batch(request: BatchPlanRequest, tier: str = "full"):
+    logger.info(f"POST /plan/batch | trips={len(request.trips)} | tier={tier}")
+    check_tier(tier)
+
+    if len(request.trips) > BATCH_MAX_TRIPS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch of {len(request.trips)} trips exceeds the limit of {BATCH_MAX_TRIPS}",
+        )
+
+    # schedule trips sharing destination/dates next to each other so their domain
+    # lookups overlap in time and get coalesced or served from the cache
+    order = sorted(
+        range(len(request.trips)),
+        key=lambda i: (
+            request.trips[i].destination.strip().lower(),
+            request.trips[i].start_date,
+            request.trips[i].end_date,
+        ),
+    )
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+    before = domain_cache.stats()
+    batch_start = time.perf_counter()
+
+    async def plan_one(index: int) -> dict[str, Any]:
+        plan_id = uuid.uuid4().hex
+        try:
+            trip: TripRequest = validate_trip_request(request.trips[index].model_dump())
+        except ValueError as e:
+            return {"index": index, "plan_id": None, "success": False, "error": str(e)}
+
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                result = await run_planner(
+                    plan_id, PlannerState.create(trip, tier), tier=tier, bounded=False
+                )
+                outcome = {"success": True, "result": build_plan_response(plan_id, result)}
+            except Exception as e:
+                logger.error(f"Batch trip failed | plan_id={plan_id} | error={e}")
+                outcome = {"success": False, "error": f"Planning failed: {e}"}
+            elapsed = round(time.perf_counter() - start, 3)
+
+        return {"index": index, "plan_id": plan_id, **outcome, "elapsed_seconds": elapsed}
+
+    results = await asyncio.gather(*(plan_one(i) for i in order))
+    results.sort(key=lambda r: r["index"])
+    total = round(time.perf_counter() - batch_start, 3)
+
+    after = domain_cache.stats()
+    shared = {
+        domain: {
+            "cache_hits": after[domain]["hits"] - before[domain]["hits"],
+            "coalesced": after[domain]["coalesced"] - before[domain]["coalesced"],
+        }
+        for domain in after
+    }
+    elapsed = [r["elapsed_seconds"] for r in results if "elapsed_seconds" in r]
+    succeeded = sum(1 for r in results if r["success"])
 
     logger.info(
-        f"Plan complete | destination={request.destination} | retries={result.get('retry_count', 0)}"
+        f"Batch complete | trips={len(results)} | succeeded={succeeded} | total={total}s"
+    )
+    return {
+        "success": succeeded == len(results),
+        "count": len(results),
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "results": results,
+        "timing": {
+            "total_seconds": total,
+            "avg_trip_seconds": round(sum(elapsed) / len(elapsed), 3) if elapsed else 0.0,
+            "max_trip_seconds": max(elapsed, default=0.0),
+            "concurrency": BATCH_CONCURRENCY,
+        },
+        "shared_lookups": shared,
+    }
+
+
+@app.post("/plans", status_code=202)
+async def submit_plan(
+    request: TripRequest,
+    tier: str = "full",
+    idempotency_key: str | None = Header(default=None),
+):
+    logger.info(f"POST /plans | destination={request.destination} | tier={tier}")
+    check_tier(tier)
+
+    try:
+        trip: TripRequest = validate_trip_request(request.model_dump())
+    except ValueError as e:
+        logger.error(f"Validation failed | error={e}")
+        raise HTTPException(status_code=422, detail=str(e))
+
+    job = app.state.plan_jobs.submit(
+        uuid.uuid4().hex, PlannerState.create(trip, tier), idempotency_key
     )
+    return job.model_dump(exclude={"result"})
+
+
+@app.get("/plans/{plan_id}")
+async def get_plan(plan_id: str):
+    logger.info(f"GET /plans/{plan_id}")
+
+    job = app.state.plan_jobs.get(plan_id)
+    if job:
+        return job.model_dump()
 
+    # jobs age out of the in-memory registry; fall back to the checkpointed thread
+    snapshot = await planner_for().aget_state(plan_config(plan_id))
+    if not snapshot.values:
+        raise HTTPException(status_code=404, detail=f"Plan not found: {plan_id}")
+    if snapshot.next:
+        return {"plan_id": plan_id, "status": "interrupted", "pending_nodes": list(snapshot.next)}
+    final_itinerary = snapshot.values.get("final_itinerary")
+    if itinerary_failed(final_itinerary):
+        # same check resume uses to re-run the itinerary
+        error = final_itinerary.get("error") if isinstance(final_itinerary, dict) else None
+        return {
+            "plan_id": plan_id,
+            "status": "failed",
+            "error": error or "Itinerary generation failed",
+            "result": build_plan_response(plan_id, snapshot.values),
+        }
     return {
-        "success": True,
-        "destination": request.destination,
-        "detailed_itinerary": detailed,
-        "key_recommendations": recommendations,
-        "retry_count": result.get("retry_count", 0),
-        "notes": result.get("notes", ""),
+        "plan_id": plan_id,
+        "status": "succeeded",
+        "result": build_plan_response(plan_id, snapshot.values),
     }
 
 
+@app.post("/plans/{plan_id}/resume")
+async def resume_plan(plan_id: str):
+    logger.info(f"POST /plans/{plan_id}/resume")
+
+    config = plan_config(plan_id)
+    snapshot = await planner_for().aget_state(config)
+    if not snapshot.values:
+        raise HTTPException(status_code=404, detail=f"Plan not found: {plan_id}")
+    tier = snapshot.values.get("tier", "full")
+    planner = planner_for(tier)
+
+    if snapshot.next:
+        logger.info(f"Resuming plan {plan_id} | pending_nodes={list(snapshot.next)}")
+        prepare = None
+    elif itinerary_failed(snapshot.values.get("final_itinerary")):
+        logger.info(f"Resuming plan {plan_id} | re-running itinerary only")
+
+        async def prepare():
+            await planner.aupdate_state(
+                config, {"final_itinerary": None}, as_node="aggregator"
+            )
+
+    else:
+        logger.info(f"Plan {plan_id} already complete — returning stored result")
+        return build_plan_response(plan_id, snapshot.values)
+
+    try:
+        result = await run_planner(plan_id, None, tier=tier, prepare=prepare)
+    except CapacityError:
+        raise
+    except Exception as e:
+        logger.error(f"Resume failed | plan_id={plan_id} | error={e}")
+        raise HTTPException(
+            status_code=500,
+            detail={"plan_id": plan_id, "error": f"Resume failed: {e}"},
+        )
+
+    logger.info(
+        f"Resumed plan complete | plan_id={plan_id} | retries={result.get('retry_count', 0)}"
+    )
+    return build_plan_response(plan_id, result)
+
+
+@app.patch("/plans/{plan_id}")
+async def modify_plan(plan_id: str, request: TripRequest):
+    logger.info(f"PATCH /plans/{plan_id} | destination={request.destination}")
+
+    try:
+        trip: TripRequest = validate_trip_request(request.model_dump())
+    except ValueError as e:
+        logger.error(f"Validation failed | error={e}")
+        raise HTTPException(status_code=422, detail=str(e))
+
+    config = plan_config(plan_id)
+    snapshot = await planner_for().aget_state(config)
+    if not snapshot.values:
+        raise HTTPException(status_code=404, detail=f"Plan not found: {plan_id}")
+    tier = snapshot.values.get("tier", "full")
+    planner = planner_for(tier)
+    if snapshot.next:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Plan {plan_id} has not finished — resume it before modifying",
+        )
+
+    domains = [
+        d
+        for d in affected_domains(snapshot.values["trip"], trip)
+        if d in PLANNER_TIERS[tier]
+    ]
+    if not domains:
+        logger.info(f"Plan {plan_id} unchanged — returning stored result")
+        return {**build_plan_response(plan_id, snapshot.values), "rerun_domains": []}
+
+    # replay from the coordinator: unaffected domain nodes keep their results and
+    # skip; cleared ones run again through the domain cache, since a changed trip
+    # field changes their cache key (retries would bypass the cache)
+    async def prepare():
+        await planner.aupdate_state(
+            config,
+            {
+                "trip": trip,
+                **{f"{domain}_result": None for domain in domains},
+                "retries": [],
+                "retry_count": 0,
+                "done": False,
+                "notes": "",
+                "aggregated_plan": None,
+                "final_itinerary": None,
+            },
+            as_node="coordinator",
+        )
+
+    try:
+        result = await run_planner(plan_id, None, tier=tier, prepare=prepare)
+    except CapacityError:
+        raise
+    except Exception as e:
+        logger.error(f"Modify failed | plan_id={plan_id} | error={e}")
+        raise HTTPException(
+            status_code=500,
+            detail={"plan_id": plan_id, "error": f"Modify failed: {e}"},
+        )
+
+    logger.info(f"Plan modified | plan_id={plan_id} | rerun_domains={domains}")
+    return {**build_plan_response(plan_id, result), "rerun_domains": domains}
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -8,6 +8,8 @@ from .event import Events
 from .attraction import Attractions
 from .agent_response import AgentResponse
 from .planner_state import PlannerState
+from .plan_job import PlanJob
+from .batch import BatchPlanRequest
 
 __all__ = [
     "TripRequest",
@@ -20,4 +22,6 @@ __all__ = [
     "Events",
     "AgentResponse",
     "PlannerState",
+    "PlanJob",
+    "BatchPlanRequest",
 ]
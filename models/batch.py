@@ -0,0 +1,9 @@
+from pydantic import BaseModel, Field
+from typing import List
+from models.trip_request import TripRequest
+
+
+class BatchPlanRequest(BaseModel):
+    trips: List[TripRequest] = Field(
+        ..., min_length=1, description="Trip requests to plan together"
+    )
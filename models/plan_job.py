@@ -0,0 +1,12 @@
+from pydantic import BaseModel, Field
+from typing import Any, Literal, Optional
+
+
+class PlanJob(BaseModel):
+    plan_id: str = Field(..., description="Job id, also the planner thread id")
+    status: Literal["queued", "running", "succeeded", "failed"] = "queued"
+    submitted_at: float = Field(..., description="Unix time the job was enqueued")
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Optional[dict[str, Any]] = None
+    error: Optional[str] = None
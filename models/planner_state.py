@@ -7,6 +7,7 @@ from models.itinerary import Itinerary
 
 class PlannerState(TypedDict):
     trip: TripRequest
+    tier: str
     hotel_result: AgentResponse | None
     transport_result: AgentResponse | None
     restaurant_result: AgentResponse | None
@@ -21,9 +22,10 @@ class PlannerState(TypedDict):
     final_itinerary: Dict[str, Any] | None
 
     @staticmethod
-    def create(trip: TripRequest) -> "PlannerState":
+    def create(trip: TripRequest, tier: str = "full") -> "PlannerState":
         return PlannerState(
             trip=trip,
+            tier=tier,
             retries=[],
             retry_count=0,
             done=False,
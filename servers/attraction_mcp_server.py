@@ -2,41 +2,62 @@ import asyncio
 from typing import Any
 from mcp.server.fastmcp import FastMCP
 from data.attractions_data import ATTRACTIONS_DATA
+from data.catalogs import load_catalog
 from interfaces.mcp_server_interface import MCPServer
 from utils.logger import get_logger
-from utils.http_client import async_get
-from config import ATTRACTION_MOCK_BOOL, ATTRACTION_API_BASE, ATTRACTION_API_KEY
+from utils.catalog import CatalogIndex, place_keys
+from utils.text_index import split_terms
+from utils.ranking import ranker
+from utils.http_client import async_get, http_client_lifespan
+from config import (
+    ATTRACTION_MOCK_BOOL,
+    ATTRACTION_API_BASE,
+    ATTRACTION_API_KEY,
+    DOMAIN_HTTP_TIMEOUTS,
+    PREFERENCE_MATCH_LIMIT,
+    DETAILS_MANY_LIMIT,
+)
 
 logger = get_logger("AttractionMCPServer")
 
 
 class AttractionMCPServer(MCPServer):
     def __init__(self):
-        self.mcp = FastMCP("attractions")
+        self.mcp = FastMCP("attractions", lifespan=http_client_lifespan)
         self.ATTRACTION_API_BASE = ATTRACTION_API_BASE
         self.API_KEY = ATTRACTION_API_KEY
         self.USER_AGENT = "attractions-app/1.0"
-        self.MOCK_ATTRACTIONS = ATTRACTIONS_DATA
+        self.MOCK_ATTRACTIONS = load_catalog("attractions", ATTRACTIONS_DATA)
+        self.catalog = CatalogIndex(
+            self.MOCK_ATTRACTIONS,
+            places={"city": place_keys, "location": place_keys},
+            numeric={"rating": "rating", "entry_fee": "entry_fee"},
+            categorical={"type": "type"},
+            coordinates=("latitude", "longitude"),
+            text={"name": 2.0, "type": 2.0, "description": 1.0},
+        )
         self.USE_MOCK_DATA = ATTRACTION_MOCK_BOOL
         logger.info(f"AttractionMCPServer initialized | mock_mode={self.USE_MOCK_DATA}")
 
     async def register_tools(self) -> None:
         @self.mcp.tool()
         async def search_attractions(
-            city: str, category: str = None
+            city: str, category: str = None, preferences: list[str] = None
         ) -> str:
             logger.info(
-                f"search_attractions | city={city} | category={category}"
+                f"search_attractions | city={city} | category={category} | preferences={preferences}"
             )
             mock_indicator = " (MOCK DATA)" if self.USE_MOCK_DATA else ""
+            params = {"city": city, "category": category}
+            if preferences:
+                params["preferences"] = ",".join(preferences)
             data = await self.make_attraction_request(
-                f"{self.ATTRACTION_API_BASE}/attractions/search",
-                {"city": city, "category": category},
+                f"{self.ATTRACTION_API_BASE}/attractions/search", params
             )
             if not data or "attractions" not in data or len(data["attractions"]) == 0:
                 logger.warning(f"No tourist attractions found in {city}")
                 return f"No tourist attractions found in {city}.{mock_indicator}"
-            attractions = data["attractions"]
+            attractions = ranker.rank(data["attractions"], rating=("rating", 5), preference="match_score")
             logger.info(f"search_attractions returned {len(attractions)} attractions for {city}")
             return f"Tourist attractions in {city}{mock_indicator}:\n" + "\n---\n".join(
                 [self.format_attraction(a) for a in attractions]
@@ -53,6 +74,24 @@ class AttractionMCPServer(MCPServer):
                 return f"No details for attraction {attraction_id}.{mock_indicator}"
             return self.format_attraction(data)
 
+        @self.mcp.tool()
+        async def get_attraction_details_many(attraction_ids: list[str]) -> str:
+            ids = list(dict.fromkeys(attraction_ids))[:DETAILS_MANY_LIMIT]
+            logger.info(f"get_attraction_details_many | attraction_ids={len(ids)}")
+            mock_indicator = " (MOCK DATA)" if self.USE_MOCK_DATA else ""
+            found = await asyncio.gather(
+                *(
+                    self.make_attraction_request(f"{self.ATTRACTION_API_BASE}/attractions/details", {"id": i})
+                    for i in ids
+                )
+            )
+            return "\n---\n".join(
+                self.format_attraction(data)
+                if data
+                else f"No details for attraction {attraction_id}.{mock_indicator}"
+                for attraction_id, data in zip(ids, found)
+            )
+
     def start(self) -> None:
         logger.info("Starting Attraction MCP Server")
         asyncio.run(self.register_tools())
@@ -63,11 +102,12 @@ class AttractionMCPServer(MCPServer):
     ) -> dict[str, Any] | None:
         if self.USE_MOCK_DATA:
             return self.get_mock_response(url, params)
-        headers = {
-            "Authorization": f"Bearer {self.API_KEY}",
-            "User-Agent": self.USER_AGENT,
-        }
-        data = await async_get(url, params=params, headers=headers)
+        headers = {"User-Agent": self.USER_AGENT}
+        if self.API_KEY:
+            headers["Authorization"] = f"Bearer {self.API_KEY}"
+        data = await async_get(
+            url, params=params, headers=headers, timeout=DOMAIN_HTTP_TIMEOUTS["attraction"]
+        )
         if "error" in data:
             logger.error(f"Attraction API failed | url={url} | error={data['error']}")
             return None
@@ -75,31 +115,38 @@ class AttractionMCPServer(MCPServer):
 
     def get_mock_response(self, url: str, params: dict = None) -> dict[str, Any] | None:
         if "/attractions/search" in url:
-            city = params.get("city", "")
-            category = params.get("category")
-            filtered = [
-                a for a in self.MOCK_ATTRACTIONS if city.lower() in a["city"].lower()
-            ]
-            if category:
-                filtered = [
-                    a for a in filtered if category.lower() in a["type"].lower()
-                ]
-            return {"attractions": filtered}
+            category = (params.get("category") or "").lower()
+            rows = self.catalog.select(
+                params.get("city") or "",
+                categories={"type": lambda t: category in t} if category else None,
+            )
+            preferences = split_terms(params.get("preferences"))
+            if preferences:
+                matched, scores = self.catalog.match(preferences, rows, k=PREFERENCE_MATCH_LIMIT)
+                if len(matched):
+                    return {
+                        "attractions": [
+                            {**a, "match_score": round(float(score), 2)}
+                            for a, score in zip(self.catalog.materialize(matched), scores)
+                        ]
+                    }
+                logger.info(f"No attractions match preferences={preferences}; returning all")
+            return {"attractions": self.catalog.materialize(rows)}
         elif "/attractions/details" in url:
-            for a in self.MOCK_ATTRACTIONS:
-                if a["id"] == params.get("id"):
-                    return a
+            return self.catalog.get(params.get("id"))
         return None
 
     def format_attraction(self, a: dict) -> str:
         fee = f"{a['entry_fee']} {a['currency']}" if a.get("entry_fee") else "Free"
+        match = f" | Match: {a['match_score']}" if a.get("match_score") is not None else ""
+        match += f" | Score: {a['score']}" if a.get("score") is not None else ""
         if a.get("entry_fee") == 0:
             fee = "Free"
         return (
             f"Attraction {a['id']} | {a['name']} | Type: {a['type']} | "
             f"Location: {a['location']} | Rating: {a.get('rating', 'N/A')}/5 | "
             f"Entry Fee: {fee} | Timings: {a.get('timings', 'N/A')} | "
-            f"Description: {a.get('description', '')}"
+            f"Description: {a.get('description', '')}{match}"
         )
 
 
@@ -2,36 +2,58 @@ import asyncio
 from typing import Any
 from mcp.server.fastmcp import FastMCP
 from data.events_data import EVENTS_DATA
+from data.catalogs import load_catalog
 from interfaces.mcp_server_interface import MCPServer
 from utils.logger import get_logger
-from utils.http_client import async_get
-from config import EVENT_MOCK_BOOL, EVENTS_API_BASE, EVENTS_API_KEY
+from utils.catalog import CatalogIndex, place_keys
+from utils.intervals import EventCalendar
+from utils.text_index import split_terms
+from utils.http_client import async_get, http_client_lifespan
+from config import (
+    EVENT_MOCK_BOOL,
+    EVENTS_API_BASE,
+    EVENTS_API_KEY,
+    DOMAIN_HTTP_TIMEOUTS,
+    PREFERENCE_MATCH_LIMIT,
+    EVENT_RECURRENCE_HORIZON_DAYS,
+    DETAILS_MANY_LIMIT,
+)
 
 logger = get_logger("EventMCPServer")
 
 
 class EventMCPServer(MCPServer):
     def __init__(self):
-        self.mcp = FastMCP("events")
+        self.mcp = FastMCP("events", lifespan=http_client_lifespan)
         self.EVENTS_API_BASE = EVENTS_API_BASE
         self.API_KEY = EVENTS_API_KEY
         self.USER_AGENT = "events-app/1.0"
-        self.MOCK_EVENTS = EVENTS_DATA
+        self.MOCK_EVENTS = load_catalog("events", EVENTS_DATA)
+        self.catalog = CatalogIndex(
+            self.MOCK_EVENTS,
+            places={"location": place_keys},
+            numeric={"price": "price"},
+            categorical={"type": "type"},
+            text={"name": 2.0, "type": 2.0, "organizer": 0.5},
+        )
+        self.calendar = EventCalendar(self.catalog, EVENT_RECURRENCE_HORIZON_DAYS)
         self.USE_MOCK_DATA = EVENT_MOCK_BOOL
         logger.info(f"EventMCPServer initialized | mock_mode={self.USE_MOCK_DATA}")
 
     async def register_tools(self) -> None:
         @self.mcp.tool()
         async def search_events(
-            city: str, start_date: str = None, end_date: str = None
+            city: str, start_date: str = None, end_date: str = None, preferences: list[str] = None
         ) -> str:
             logger.info(
-                f"search_events | city={city} | dates={start_date} to {end_date}"
+                f"search_events | city={city} | dates={start_date} to {end_date} | preferences={preferences}"
             )
             mock_indicator = " (MOCK DATA)" if self.USE_MOCK_DATA else ""
+            params = {"city": city, "start_date": start_date, "end_date": end_date}
+            if preferences:
+                params["preferences"] = ",".join(preferences)
             data = await self.make_events_request(
-                f"{self.EVENTS_API_BASE}/events/search",
-                {"city": city, "start_date": start_date, "end_date": end_date},
+                f"{self.EVENTS_API_BASE}/events/search", params
             )
             if not data or "events" not in data or len(data["events"]) == 0:
                 logger.warning(f"No events found in {city}")
@@ -53,6 +75,22 @@ class EventMCPServer(MCPServer):
                 return f"No details for event {event_id}.{mock_indicator}"
             return self.format_event(data)
 
+        @self.mcp.tool()
+        async def get_event_details_many(event_ids: list[str]) -> str:
+            ids = list(dict.fromkeys(event_ids))[:DETAILS_MANY_LIMIT]
+            logger.info(f"get_event_details_many | event_ids={len(ids)}")
+            mock_indicator = " (MOCK DATA)" if self.USE_MOCK_DATA else ""
+            found = await asyncio.gather(
+                *(
+                    self.make_events_request(f"{self.EVENTS_API_BASE}/events/details", {"id": i})
+                    for i in ids
+                )
+            )
+            return "\n---\n".join(
+                self.format_event(data) if data else f"No details for event {event_id}.{mock_indicator}"
+                for event_id, data in zip(ids, found)
+            )
+
     def start(self) -> None:
         logger.info("Starting Event MCP Server")
         asyncio.run(self.register_tools())
@@ -63,11 +101,12 @@ class EventMCPServer(MCPServer):
     ) -> dict[str, Any] | None:
         if self.USE_MOCK_DATA:
             return self.get_mock_response(url, params)
-        headers = {
-            "Authorization": f"Bearer {self.API_KEY}",
-            "User-Agent": self.USER_AGENT,
-        }
-        data = await async_get(url, params=params, headers=headers)
+        headers = {"User-Agent": self.USER_AGENT}
+        if self.API_KEY:
+            headers["Authorization"] = f"Bearer {self.API_KEY}"
+        data = await async_get(
+            url, params=params, headers=headers, timeout=DOMAIN_HTTP_TIMEOUTS["event"]
+        )
         if "error" in data:
             logger.error(f"Events API failed | url={url} | error={data['error']}")
             return None
@@ -75,20 +114,43 @@ class EventMCPServer(MCPServer):
 
     def get_mock_response(self, url: str, params: dict = None) -> dict[str, Any] | None:
         if "/events/search" in url:
-            city = params.get("city", "")
-            return {
-                "events": [
-                    e for e in self.MOCK_EVENTS if city.lower() in e["location"].lower()
-                ]
+            # one entry per event, dated by its first occurrence in the trip window
+            dates = {
+                row: (start, end)
+                for row, start, end in self.calendar.between(
+                    params.get("city") or "", params.get("start_date"), params.get("end_date")
+                )
             }
+            rows = list(dates)
+            preferences = split_terms(params.get("preferences"))
+            if preferences:
+                matched, scores = self.catalog.match(preferences, rows, k=PREFERENCE_MATCH_LIMIT)
+                if len(matched):
+                    return {
+                        "events": [
+                            {**self.occurrence(row, *dates[row]), "match_score": round(float(score), 2)}
+                            for row, score in zip(matched.tolist(), scores)
+                        ]
+                    }
+                logger.info(f"No events match preferences={preferences}; returning all")
+            return {"events": [self.occurrence(row, *dates[row]) for row in rows]}
         elif "/events/details" in url:
-            for e in self.MOCK_EVENTS:
-                if e["id"] == params.get("id"):
-                    return e
+            return self.catalog.get(params.get("id"))
         return None
 
+    def occurrence(self, row: int, start: str, end: str) -> dict[str, Any]:
+        event = {**self.catalog.records[row], "date": start}
+        if end != start:
+            event["end_date"] = end
+        else:
+            event.pop("end_date", None)
+        return event
+
     def format_event(self, e: dict) -> str:
-        return f"Event {e['id']} | {e['name']} | Type: {e['type']} | Location: {e['location']} | Date: {e['date']} {e['time']} | Organizer: {e['organizer']} | Price: {e['price']} {e['currency']}"
+        dates = f"{e['date']} to {e['end_date']}" if e.get("end_date") else e["date"]
+        repeats = f" | Repeats: {e['recurrence']}" if e.get("recurrence") else ""
+        match = f" | Match: {e['match_score']}" if e.get("match_score") is not None else ""
+        return f"Event {e['id']} | {e['name']} | Type: {e['type']} | Location: {e['location']} | Date: {dates} {e['time']}{repeats} | Organizer: {e['organizer']} | Price: {e['price']} {e['currency']}{match}"
 
 
 if __name__ == "__main__":
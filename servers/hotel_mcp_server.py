@@ -1,25 +1,56 @@
 import asyncio
+import json
 from typing import Any
 from mcp.server.fastmcp import FastMCP
 import random
 from data.hotel_data import HOTEL_DATA, HOTEL_DESTINATIONS
+from data.catalogs import load_catalog
 from interfaces.mcp_server_interface import MCPServer
 from utils.logger import get_logger
-from utils.http_client import async_get
-from config import HOTEL_MOCK_BOOL, BOOKING_API_BASE, RAPIDAPI_KEY
+from utils.http_client import async_get, http_client_lifespan
+from utils.cache import DestinationCache, report_stats
+from utils.catalog import CatalogIndex, place_keys
+from utils.ranking import ranker
+from config import (
+    HOTEL_MOCK_BOOL,
+    BOOKING_API_BASE,
+    RAPIDAPI_KEY,
+    DOMAIN_HTTP_TIMEOUTS,
+    HOTEL_DEST_CACHE_PATH,
+    HOTEL_DEST_CACHE_TTL,
+    HOTEL_DEST_NEGATIVE_TTL,
+    HOTEL_DEST_SEED_PATH,
+    HOTEL_MAX_PAGES,
+    HOTEL_PAGE_CONCURRENCY,
+    HOTEL_RESULTS_TARGET,
+    GEO_SEARCH_RADIUS_KM,
+    DETAILS_MANY_LIMIT,
+)
 
 logger = get_logger("HotelMCPServer")
 
+MOCK_PAGE_SIZE = 20
+
 
 class HotelMCPServer(MCPServer):
     def __init__(self):
-        self.mcp = FastMCP("hotel")
+        self.mcp = FastMCP("hotel", lifespan=http_client_lifespan)
         self.BOOKING_API_BASE = BOOKING_API_BASE
         self.RAPIDAPI_KEY = RAPIDAPI_KEY
         self.USER_AGENT = "hotel-app/1.0"
-        self.MOCK_LOCATIONS = HOTEL_DESTINATIONS
-        self.MOCK_HOTELS = HOTEL_DATA
+        self.MOCK_HOTELS = load_catalog("hotels", HOTEL_DATA)
+        self.MOCK_LOCATIONS = load_catalog("hotel_destinations", HOTEL_DESTINATIONS)
+        self.catalog = CatalogIndex(
+            self.MOCK_HOTELS,
+            id_field="hotel_id",
+            places={"address": place_keys},
+            numeric={"price": "min_total_price", "rating": "review_score"},
+            coordinates=("latitude", "longitude"),
+        )
+        self.mock_dest_names = {d["dest_id"]: d["name"] for d in self.MOCK_LOCATIONS.values()}
         self.USE_MOCK_DATA = HOTEL_MOCK_BOOL
+        self.destinations = self.build_destination_cache()
+        report_stats("hotel_destinations", self.destinations)
         logger.info(f"HotelMCPServer initialized | mock_mode={self.USE_MOCK_DATA}")
 
     async def register_tools(self) -> None:
@@ -56,22 +87,16 @@ class HotelMCPServer(MCPServer):
                 "units": "metric",
                 "include_adjacency": "true",
             }
-            data = await self.make_booking_request(url, params)
-            if not data or "result" not in data:
+            search = await self.search_hotel_pages(url, params, min_price, max_price)
+            if search is None:
                 logger.warning(f"No hotel data returned for {location}")
                 return f"Unable to fetch hotel data for this location.{mock_indicator}"
-            hotels = data["result"]
+            hotels, filtered_hotels = search
             if not hotels:
                 return f"No hotels found in {location}.{mock_indicator}"
-            filtered_hotels = [
-                h
-                for h in hotels
-                if h.get("min_total_price", 0)
-                and min_price <= float(h["min_total_price"]) <= max_price
-            ]
             if not filtered_hotels:
                 return f"No hotels found in {location} within price range ${min_price}-${max_price}.{mock_indicator}"
-            hotel_list = [self.format_hotel(hotel) for hotel in filtered_hotels[:10]]
+            hotel_list = [self.format_hotel(hotel) for hotel in self.rank_hotels(filtered_hotels, max_price, "distance_to_cc")]
             result = f"Hotels in {location} (${min_price}-${max_price} price range){mock_indicator}:\n"
             result += "\n---\n".join(hotel_list)
             result += f"\n\nShowing {len(hotel_list)} hotels out of {len(filtered_hotels)} matching results."
@@ -89,14 +114,24 @@ class HotelMCPServer(MCPServer):
             data = await self.make_booking_request(url, params)
             if not data:
                 return f"Unable to fetch hotel details.{mock_indicator}"
-            name = data.get("hotel_name", "Unknown Hotel")
-            description = data.get("description", "No description available")
-            facilities = data.get("facilities", [])
-            address = data.get("address", "Address not available")
-            rating = data.get("review_score", "N/A")
-            details = f"Hotel: {name}{mock_indicator}\nRating: {rating}/10\nAddress: {address}\nDescription: {description}\nFacilities: {', '.join([f.get('name', '') for f in facilities]) if facilities else 'No facilities listed'}"
-            logger.info(f"get_hotel_details returned details for {name}")
-            return details
+            logger.info(f"get_hotel_details returned details for {data.get('hotel_name')}")
+            return self.format_hotel_details(data, mock_indicator)
+
+        @self.mcp.tool()
+        async def get_hotel_details_many(hotel_ids: list[str]) -> str:
+            ids = list(dict.fromkeys(hotel_ids))[:DETAILS_MANY_LIMIT]
+            logger.info(f"get_hotel_details_many called | hotel_ids={len(ids)}")
+            mock_indicator = " (MOCK DATA)" if self.USE_MOCK_DATA else ""
+            url = f"{self.BOOKING_API_BASE}/hotels/details"
+            found = await asyncio.gather(
+                *(self.make_booking_request(url, {"hotel_id": i, "locale": "en-gb"}) for i in ids)
+            )
+            return "\n---\n".join(
+                self.format_hotel_details(data, mock_indicator)
+                if data
+                else f"Unable to fetch details for hotel {hotel_id}.{mock_indicator}"
+                for hotel_id, data in zip(ids, found)
+            )
 
         @self.mcp.tool()
         async def search_hotels_by_coordinates(
@@ -123,23 +158,17 @@ class HotelMCPServer(MCPServer):
                 "order_by": "distance",
                 "units": "metric",
             }
-            data = await self.make_booking_request(url, params)
-            if not data or "result" not in data:
+            search = await self.search_hotel_pages(url, params, min_price, max_price)
+            if search is None:
                 return f"Unable to fetch hotel data for this location.{mock_indicator}"
-            hotels = data["result"]
+            hotels, filtered_hotels = search
             if not hotels:
                 return (
                     f"No hotels found near ({latitude}, {longitude}).{mock_indicator}"
                 )
-            filtered_hotels = [
-                h
-                for h in hotels
-                if h.get("min_total_price", 0)
-                and min_price <= float(h["min_total_price"]) <= max_price
-            ]
             if not filtered_hotels:
                 return f"No hotels found near coordinates within ${min_price}-${max_price}.{mock_indicator}"
-            hotel_list = [self.format_hotel(h) for h in filtered_hotels[:10]]
+            hotel_list = [self.format_hotel(h) for h in self.rank_hotels(filtered_hotels, max_price, "distance")]
             result = f"Hotels near ({latitude}, {longitude}) (${min_price}-${max_price}){mock_indicator}:\n"
             result += "\n---\n".join(hotel_list)
             return result
@@ -159,7 +188,9 @@ class HotelMCPServer(MCPServer):
             "X-RapidAPI-Host": "booking-com.p.rapidapi.com",
             "User-Agent": self.USER_AGENT,
         }
-        data = await async_get(url, params=params, headers=headers)
+        data = await async_get(
+            url, params=params, headers=headers, timeout=DOMAIN_HTTP_TIMEOUTS["hotel"]
+        )
         if "error" in data:
             logger.error(
                 f"Booking API request failed | url={url} | error={data['error']}"
@@ -167,16 +198,98 @@ class HotelMCPServer(MCPServer):
             return None
         return data
 
-    def get_mock_response(self, url: str, params: dict = None) -> dict[str, Any] | None:
-        if "/stays/search" in url:
-            location_name = params.get("name", "").lower() if params else ""
-            if location_name in self.MOCK_LOCATIONS:
-                return [self.MOCK_LOCATIONS[location_name]]
+    async def search_hotel_pages(
+        self, url: str, params: dict, min_price: float, max_price: float
+    ) -> tuple[list[dict], list[dict]] | None:
+        """
+        Fetches result pages until HOTEL_RESULTS_TARGET hotels fall inside the price
+        range. The first page is fetched alone since it usually suffices; the rest go
+        out HOTEL_PAGE_CONCURRENCY at a time up to HOTEL_MAX_PAGES, and pages still in
+        flight are cancelled once enough matches are in. Returns (all hotels seen,
+        in-budget hotels) in provider order, or None if the first page failed.
+        """
+
+        def in_budget(hotels: list[dict]) -> list[dict]:
             return [
-                {"dest_id": "99999", "dest_type": "city", "name": location_name.title()}
+                h
+                for h in hotels
+                if h.get("min_total_price", 0)
+                and min_price <= float(h["min_total_price"]) <= max_price
             ]
+
+        async def fetch(page: int) -> tuple[int, list[dict] | None]:
+            data = await self.make_booking_request(url, {**params, "page_number": page})
+            if not data or "result" not in data:
+                return page, None
+            return page, data["result"]
+
+        _, first = await fetch(0)
+        if first is None:
+            return None
+        pages = {0: first}
+        matched = len(in_budget(first))
+        next_page = 1
+        # first page the provider returned empty; failed or cancelled pages are
+        # only gaps, not the end of the listing
+        end = 0 if not first else None
+
+        while matched < HOTEL_RESULTS_TARGET and end is None and next_page < HOTEL_MAX_PAGES:
+            wave = range(next_page, min(next_page + HOTEL_PAGE_CONCURRENCY, HOTEL_MAX_PAGES))
+            next_page = wave.stop
+            tasks = [asyncio.ensure_future(fetch(page)) for page in wave]
+            try:
+                for future in asyncio.as_completed(tasks):
+                    page, hotels = await future
+                    if hotels is None:
+                        continue
+                    if not hotels:
+                        end = page if end is None else min(end, page)
+                        continue
+                    pages[page] = hotels
+                    matched += len(in_budget(hotels))
+                    if matched >= HOTEL_RESULTS_TARGET:
+                        break
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+        # every completed page in page order, minus any that raced past the end
+        ordered = []
+        for page in sorted(pages):
+            if end is not None and page > end:
+                break
+            ordered.extend(pages[page])
+        logger.info(
+            f"search_hotel_pages | pages={len(pages)} | hotels={len(ordered)} | matched={len(in_budget(ordered))}"
+        )
+        return ordered, in_budget(ordered)
+
+    def get_mock_response(self, url: str, params: dict = None) -> dict[str, Any] | None:
+        if "/stays/search" in url:
+            location_name = params.get("name", "") if params else ""
+            # same resolver as the other servers ("Mumbai, India" -> "mumbai");
+            # an unknown name gets no destination, which is cached as not found
+            key = self.catalog.resolve_place(location_name) if location_name else None
+            if key in self.MOCK_LOCATIONS:
+                return [self.MOCK_LOCATIONS[key]]
+            return []
         elif "/hotels/search" in url:
-            hotels = self.MOCK_HOTELS.copy()
+            page = int(params.get("page_number", 0)) if params else 0
+            distances = None
+            if params and "dest_id" in params:
+                city = self.mock_dest_names.get(params["dest_id"])
+                rows = self.catalog.rows(city) if city else self.catalog.rows()[:0]
+            elif params and "latitude" in params:
+                rows, distances = self.catalog.near(
+                    float(params["latitude"]), float(params["longitude"]), radius_km=GEO_SEARCH_RADIUS_KM
+                )
+            else:
+                rows = self.catalog.rows()
+            start = page * MOCK_PAGE_SIZE
+            hotels = [h.copy() for h in self.catalog.materialize(rows[start : start + MOCK_PAGE_SIZE])]
+            if distances is not None:
+                for hotel, distance in zip(hotels, distances[start : start + MOCK_PAGE_SIZE]):
+                    hotel["distance"] = round(float(distance), 2)
             for hotel in hotels:
                 hotel["min_total_price"] = round(
                     hotel["min_total_price"] * random.uniform(0.8, 1.3), 2
@@ -184,9 +297,9 @@ class HotelMCPServer(MCPServer):
             return {"result": hotels}
         elif "/hotels/details" in url:
             hotel_id = params.get("hotel_id") if params else None
-            for hotel in self.MOCK_HOTELS:
-                if hotel["hotel_id"] == hotel_id:
-                    return hotel
+            hotel = self.catalog.get(hotel_id)
+            if hotel:
+                return hotel
             return {
                 "hotel_id": hotel_id,
                 "hotel_name": "Mock Hotel",
@@ -197,15 +310,75 @@ class HotelMCPServer(MCPServer):
             }
         return None
 
+    def rank_hotels(self, hotels: list[dict], max_price: float, distance_field: str) -> list[dict]:
+        # distance_field is km to the searched point, or to the city centre
+        return ranker.rank(
+            hotels,
+            rating=("review_score", 10),
+            price=("min_total_price", max_price),
+            distance=(distance_field, 1.0),
+        )
+
+    def format_hotel_details(self, data: dict, mock_indicator: str = "") -> str:
+        facilities = data.get("facilities", [])
+        facility_names = ", ".join([f.get("name", "") for f in facilities]) if facilities else "No facilities listed"
+        return (
+            f"Hotel: {data.get('hotel_name', 'Unknown Hotel')}{mock_indicator}\n"
+            f"Rating: {data.get('review_score', 'N/A')}/10\n"
+            f"Address: {data.get('address', 'Address not available')}\n"
+            f"Description: {data.get('description', 'No description available')}\n"
+            f"Facilities: {facility_names}"
+        )
+
     def format_hotel(self, hotel: dict) -> str:
-        return f"Hotel: {hotel.get('hotel_name', 'Unknown')} | Price: {hotel.get('min_total_price', 'N/A')} {hotel.get('currency_code', 'USD')} | Rating: {hotel.get('review_score', 'N/A')}/10 | Address: {hotel.get('address', 'N/A')} | Distance: {hotel.get('distance_to_cc', 'N/A')} | ID: {hotel.get('hotel_id', 'N/A')}"
+        distance = (
+            f"{hotel['distance']} km away"
+            if hotel.get("distance") is not None
+            else hotel.get("distance_to_cc", "N/A")
+        )
+        score = f" | Score: {hotel['score']}" if hotel.get("score") is not None else ""
+        return f"Hotel: {hotel.get('hotel_name', 'Unknown')} | Price: {hotel.get('min_total_price', 'N/A')} {hotel.get('currency_code', 'USD')} | Rating: {hotel.get('review_score', 'N/A')}/10 | Address: {hotel.get('address', 'N/A')} | Distance: {distance}{score} | ID: {hotel.get('hotel_id', 'N/A')}"
+
+    def build_destination_cache(self) -> DestinationCache:
+        # mock ids are only meaningful to the mock data, so mock mode never persists
+        if self.USE_MOCK_DATA:
+            return DestinationCache(seed=self.MOCK_LOCATIONS)
+        seed = {}
+        if HOTEL_DEST_SEED_PATH:
+            with open(HOTEL_DEST_SEED_PATH) as f:
+                seed = json.load(f)
+        return DestinationCache(
+            db_path=HOTEL_DEST_CACHE_PATH or None,
+            ttl=HOTEL_DEST_CACHE_TTL,
+            negative_ttl=HOTEL_DEST_NEGATIVE_TTL,
+            seed=seed,
+            namespace=self.BOOKING_API_BASE,
+        )
 
     async def search_location(self, location: str) -> dict | None:
+        cached = self.destinations.get(location)
+        if cached == DestinationCache.NOT_FOUND:
+            logger.info(f"search_location | {location} cached as unknown")
+            return None
+        if cached:
+            logger.info(f"search_location | {location} -> {cached.get('dest_id')} (cached)")
+            return cached
+
         url = f"{self.BOOKING_API_BASE}/stays/search"
         params = {"name": location, "locale": "en-gb"}
         data = await self.make_booking_request(url, params)
         if data and len(data) > 0:
-            return data[0]
+            destination = {
+                "dest_id": data[0].get("dest_id"),
+                "dest_type": data[0].get("dest_type", "city"),
+                "name": data[0].get("name", location),
+            }
+            if destination["dest_id"]:
+                self.destinations.set(location, destination)
+            return destination
+        # an empty answer means the provider does not know the name; a failed call proves nothing
+        if data is not None:
+            self.destinations.set_not_found(location)
         return None
 
 
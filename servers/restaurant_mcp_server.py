@@ -4,30 +4,57 @@ import random
 import asyncio
 from interfaces.mcp_server_interface import MCPServer
 from data.restaurant_data import RESTAURANT_DATA
+from data.catalogs import load_catalog
 from utils.logger import get_logger
-from utils.http_client import async_get
-from config import RESTAURANT_MOCK_BOOL, YELP_API_BASE, YELP_API_KEY
+from utils.catalog import CatalogIndex, place_keys
+from utils.text_index import tokenize
+from utils.ranking import ranker
+from utils.http_client import async_get, http_client_lifespan
+from config import (
+    RESTAURANT_MOCK_BOOL,
+    YELP_API_BASE,
+    YELP_API_KEY,
+    DOMAIN_HTTP_TIMEOUTS,
+    GEO_SEARCH_RADIUS_KM,
+    DETAILS_MANY_LIMIT,
+)
 
 logger = get_logger("RestaurantMCPServer")
 
+# words that describe every restaurant, so they do not narrow a search
+GENERIC_TERMS = {"food", "restaurant", "dining", "eat", "eatery", "meal", "place", "cuisine"}
+
 
 class RestaurantMCPServer(MCPServer):
     def __init__(self):
-        self.mcp = FastMCP("restaurant")
+        self.mcp = FastMCP("restaurant", lifespan=http_client_lifespan)
         self.USE_MOCK_DATA = RESTAURANT_MOCK_BOOL
         self.YELP_API_BASE = YELP_API_BASE
         self.YELP_API_KEY = YELP_API_KEY
         self.USER_AGENT = "restaurant-app/1.0"
-        self.MOCK_RESTAURANTS = RESTAURANT_DATA
+        self.MOCK_RESTAURANTS = load_catalog("restaurants", RESTAURANT_DATA)
+        self.catalog = CatalogIndex(
+            self.MOCK_RESTAURANTS,
+            places={"location.city": place_keys},
+            numeric={"rating": "rating"},
+            categorical={"category": "categories.0.title"},
+            coordinates=("coordinates.latitude", "coordinates.longitude"),
+            text={"name": 1.0, "categories": 2.0},
+        )
         logger.info(f"RestaurantMCPServer initialized | mock_mode={self.USE_MOCK_DATA}")
 
     async def register_tools(self) -> None:
         @self.mcp.tool()
         async def search_restaurants(
-            location: str, term: str = "food", limit: int = 5
+            location: str, term: str = "food", limit: int = 5, preferences: list[str] = None
         ) -> str:
-            logger.info(f"search_restaurants | location={location} | term={term}")
+            logger.info(
+                f"search_restaurants | location={location} | term={term} | preferences={preferences}"
+            )
             mock_indicator = " (MOCK DATA)" if self.USE_MOCK_DATA else ""
+            # Yelp's term is a keyword search, so preferences ride along in it
+            if preferences:
+                term = " ".join([term or "", *preferences]).strip()
             data = await self.make_yelp_request(
                 f"{self.YELP_API_BASE}/businesses/search",
                 {"location": location, "term": term, "limit": limit},
@@ -35,7 +62,7 @@ class RestaurantMCPServer(MCPServer):
             if not data or "businesses" not in data:
                 logger.warning(f"No restaurants found for {location}")
                 return f"No restaurants found for {location}.{mock_indicator}"
-            restaurants = data["businesses"]
+            restaurants = self.rank_restaurants(data["businesses"], limit)
             logger.info(
                 f"search_restaurants returned {len(restaurants)} results for {location}"
             )
@@ -54,6 +81,21 @@ class RestaurantMCPServer(MCPServer):
                 return f"Unable to fetch details for {rest_id}.{mock_indicator}"
             return self.format_restaurant(data)
 
+        @self.mcp.tool()
+        async def get_restaurant_details_many(rest_ids: list[str]) -> str:
+            ids = list(dict.fromkeys(rest_ids))[:DETAILS_MANY_LIMIT]
+            logger.info(f"get_restaurant_details_many | rest_ids={len(ids)}")
+            mock_indicator = " (MOCK DATA)" if self.USE_MOCK_DATA else ""
+            found = await asyncio.gather(
+                *(self.make_yelp_request(f"{self.YELP_API_BASE}/businesses/{i}") for i in ids)
+            )
+            return "\n---\n".join(
+                self.format_restaurant(data)
+                if data
+                else f"Unable to fetch details for {rest_id}.{mock_indicator}"
+                for rest_id, data in zip(ids, found)
+            )
+
         @self.mcp.tool()
         async def search_restaurants_by_coordinates(
             latitude: float, longitude: float, term: str = "food", limit: int = 5
@@ -76,7 +118,7 @@ class RestaurantMCPServer(MCPServer):
             return (
                 f"Restaurants near ({latitude}, {longitude}){mock_indicator}:\n"
                 + "\n---\n".join(
-                    [self.format_restaurant(r) for r in data["businesses"]]
+                    [self.format_restaurant(r) for r in self.rank_restaurants(data["businesses"], limit)]
                 )
             )
 
@@ -90,11 +132,12 @@ class RestaurantMCPServer(MCPServer):
     ) -> dict[str, Any] | None:
         if self.USE_MOCK_DATA:
             return self.get_mock_response(url, params)
-        headers = {
-            "Authorization": f"Bearer {self.YELP_API_KEY}",
-            "User-Agent": self.USER_AGENT,
-        }
-        data = await async_get(url, params=params, headers=headers)
+        headers = {"User-Agent": self.USER_AGENT}
+        if self.YELP_API_KEY:
+            headers["Authorization"] = f"Bearer {self.YELP_API_KEY}"
+        data = await async_get(
+            url, params=params, headers=headers, timeout=DOMAIN_HTTP_TIMEOUTS["restaurant"]
+        )
         if "error" in data:
             logger.error(f"Yelp API failed | error={data['error']}")
             return None
@@ -102,17 +145,44 @@ class RestaurantMCPServer(MCPServer):
 
     def get_mock_response(self, url: str, params: dict = None) -> dict[str, Any] | None:
         if "/businesses/search" in url:
+            params = params or {}
+            limit = int(params.get("limit") or 5)
+            if "latitude" in params:
+                # Yelp orders coordinate searches by distance and reports it in meters
+                rows, distances = self.catalog.near(
+                    float(params["latitude"]),
+                    float(params["longitude"]),
+                    radius_km=GEO_SEARCH_RADIUS_KM,
+                    k=limit,
+                )
+                matches = self.catalog.materialize(rows)
+                meters = [round(float(d) * 1000, 1) for d in distances]
+            else:
+                rows = self.catalog.rows(params.get("location"))
+                query = [t for t in tokenize(params.get("term") or "") if t not in GENERIC_TERMS]
+                matched, scores = self.catalog.match(query, rows, k=limit) if query else (rows[:0], [])
+                if len(matched):
+                    matches = [
+                        {**r, "match_score": round(float(score), 2)}
+                        for r, score in zip(self.catalog.materialize(matched), scores)
+                    ]
+                else:
+                    # best rated first, as the live search ranks them
+                    matches = self.catalog.materialize(self.catalog.top_k(rows, "rating", limit))
+                meters = [None] * len(matches)
             results = []
-            for res in self.MOCK_RESTAURANTS:
+            for res, distance in zip(matches, meters):
                 r = res.copy()
+                if distance is not None:
+                    r["distance"] = distance
                 r["rating"] = round(r["rating"] + random.uniform(-0.2, 0.2), 1)
                 results.append(r)
             return {"businesses": results}
         elif "/businesses/" in url:
             rest_id = url.split("/")[-1]
-            for res in self.MOCK_RESTAURANTS:
-                if res["id"] == rest_id:
-                    return res
+            res = self.catalog.get(rest_id)
+            if res:
+                return res
             return {
                 "id": rest_id,
                 "name": "Mock Restaurant",
@@ -121,8 +191,21 @@ class RestaurantMCPServer(MCPServer):
             }
         return None
 
+    def rank_restaurants(self, restaurants: list[dict], limit: int) -> list[dict]:
+        # Yelp reports distance in meters
+        return ranker.rank(
+            restaurants,
+            k=int(limit),
+            rating=("rating", 5),
+            distance=("distance", 0.001),
+            preference="match_score",
+        )
+
     def format_restaurant(self, res: dict) -> str:
-        return f"Restaurant: {res.get('name', 'Unknown')} | {res.get('categories', [{}])[0].get('title', 'General')} | Rating: {res.get('rating', 'N/A')} | Price: {res.get('price', 'N/A')} | {res.get('location', {}).get('address1', 'N/A')}, {res.get('location', {}).get('city', '')} | Phone: {res.get('phone', 'N/A')} | ID: {res.get('id', 'N/A')}"
+        distance = f" | Distance: {res['distance'] / 1000:.1f} km" if res.get("distance") is not None else ""
+        match = f" | Match: {res['match_score']}" if res.get("match_score") is not None else ""
+        match += f" | Score: {res['score']}" if res.get("score") is not None else ""
+        return f"Restaurant: {res.get('name', 'Unknown')} | {res.get('categories', [{}])[0].get('title', 'General')} | Rating: {res.get('rating', 'N/A')} | Price: {res.get('price', 'N/A')} | {res.get('location', {}).get('address1', 'N/A')}, {res.get('location', {}).get('city', '')} | Phone: {res.get('phone', 'N/A')}{distance}{match} | ID: {res.get('id', 'N/A')}"
 
 
 if __name__ == "__main__":
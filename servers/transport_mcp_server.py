@@ -4,23 +4,43 @@ import datetime
 import asyncio
 from interfaces.mcp_server_interface import MCPServer
 from data.transport_data import FLIGHT_DATA, TRAIN_DATA, PUBLIC_TRANSPORT_DATA
+from data.catalogs import load_catalog
 from utils.logger import get_logger
-from utils.http_client import async_get
-from config import TRANSPORT_MOCK_BOOL, TRANSPORT_API_BASE, TRANSPORT_API_KEY
+from utils.catalog import CatalogIndex
+from utils.routes import RouteIndex
+from utils.http_client import async_get, http_client_lifespan
+from config import (
+    TRANSPORT_MOCK_BOOL,
+    TRANSPORT_API_BASE,
+    TRANSPORT_API_KEY,
+    DOMAIN_HTTP_TIMEOUTS,
+    GEO_SEARCH_RADIUS_KM,
+    TRANSPORT_MIN_LAYOVER_MINUTES,
+    TRANSPORT_MAX_LAYOVER_HOURS,
+    TRANSPORT_MAX_LEGS,
+    TRANSPORT_MAX_CONNECTIONS,
+    DETAILS_MANY_LIMIT,
+)
 
 logger = get_logger("TransportMCPServer")
 
 
 class TransportMCPServer(MCPServer):
     def __init__(self):
-        self.mcp = FastMCP("transport")
+        self.mcp = FastMCP("transport", lifespan=http_client_lifespan)
         self.USE_MOCK_DATA = TRANSPORT_MOCK_BOOL
         self.API_BASE = TRANSPORT_API_BASE
         self.API_KEY = TRANSPORT_API_KEY
         self.USER_AGENT = "transport-app/1.0"
-        self.MOCK_FLIGHTS = FLIGHT_DATA
-        self.MOCK_TRAINS = TRAIN_DATA
-        self.MOCK_PUBLIC_TRANSPORT = PUBLIC_TRANSPORT_DATA
+        self.MOCK_FLIGHTS = load_catalog("flights", FLIGHT_DATA)
+        self.MOCK_TRAINS = load_catalog("trains", TRAIN_DATA)
+        self.MOCK_PUBLIC_TRANSPORT = load_catalog("public_transport", PUBLIC_TRANSPORT_DATA)
+        self.catalogs = [
+            CatalogIndex(self.MOCK_FLIGHTS),
+            CatalogIndex(self.MOCK_TRAINS),
+            CatalogIndex(self.MOCK_PUBLIC_TRANSPORT, coordinates=("latitude", "longitude")),
+        ]
+        self.routes = RouteIndex({"flight": self.MOCK_FLIGHTS, "train": self.MOCK_TRAINS})
         logger.info(f"TransportMCPServer initialized | mock_mode={self.USE_MOCK_DATA}")
 
     async def register_tools(self) -> None:
@@ -38,7 +58,7 @@ class TransportMCPServer(MCPServer):
             data = await self.make_transport_request(
                 f"{self.API_BASE}/flights/search", params
             )
-            if not data or "flights" not in data:
+            if not data or not data.get("flights"):
                 logger.warning(f"No flights found for {origin} -> {destination}")
                 return f"No flights found.{mock_indicator}"
             result = "\n---\n".join([self.format_flight(f) for f in data["flights"]])
@@ -57,10 +77,43 @@ class TransportMCPServer(MCPServer):
             data = await self.make_transport_request(
                 f"{self.API_BASE}/trains/search", params
             )
-            if not data or "trains" not in data:
+            if not data or not data.get("trains"):
                 return f"No trains found.{mock_indicator}"
             return "\n---\n".join([self.format_train(t) for t in data["trains"]])
 
+        @self.mcp.tool()
+        async def search_connections(
+            origin: str,
+            destination: str,
+            date: str = None,
+            optimize: str = "earliest",
+            min_layover_minutes: int = None,
+            max_legs: int = None,
+        ) -> str:
+            """Flight/train itineraries with changes; optimize is "earliest" or "cheapest"."""
+            logger.info(
+                f"search_connections | {origin} -> {destination} | date={date} | optimize={optimize}"
+            )
+            mock_indicator = " (MOCK DATA)" if self.USE_MOCK_DATA else ""
+            params = {
+                "origin": origin,
+                "destination": destination,
+                "date": date or str(datetime.date.today()),
+                "optimize": optimize,
+                "min_layover_minutes": min_layover_minutes or TRANSPORT_MIN_LAYOVER_MINUTES,
+                "max_legs": max_legs or TRANSPORT_MAX_LEGS,
+            }
+            data = await self.make_transport_request(
+                f"{self.API_BASE}/connections/search", params
+            )
+            if not data or not data.get("connections"):
+                logger.warning(f"No connections found for {origin} -> {destination}")
+                return f"No connections found from {origin} to {destination}.{mock_indicator}"
+            logger.info(f"search_connections returned {len(data['connections'])} itineraries")
+            return f"Connections from {origin} to {destination}{mock_indicator}:\n" + "\n---\n".join(
+                [self.format_connection(c) for c in data["connections"]]
+            )
+
         @self.mcp.tool()
         async def search_public_transport(latitude: float, longitude: float) -> str:
             logger.info(f"search_public_transport | lat={latitude}, lon={longitude}")
@@ -84,13 +137,22 @@ class TransportMCPServer(MCPServer):
             )
             if not data:
                 return f"No details for {option_id}.{mock_indicator}"
-            if "airline" in data:
-                return self.format_flight(data)
-            if "train" in data:
-                return self.format_train(data)
-            if "type" in data:
-                return self.format_public(data)
-            return f"Unknown transport type.{mock_indicator}"
+            return self.format_option(data, mock_indicator)
+
+        @self.mcp.tool()
+        async def get_transport_details_many(option_ids: list[str]) -> str:
+            ids = list(dict.fromkeys(option_ids))[:DETAILS_MANY_LIMIT]
+            logger.info(f"get_transport_details_many | ids={len(ids)}")
+            mock_indicator = " (MOCK DATA)" if self.USE_MOCK_DATA else ""
+            found = await asyncio.gather(
+                *(self.make_transport_request(f"{self.API_BASE}/details", {"id": i}) for i in ids)
+            )
+            return "\n---\n".join(
+                self.format_option(data, mock_indicator)
+                if data
+                else f"No details for {option_id}.{mock_indicator}"
+                for option_id, data in zip(ids, found)
+            )
 
     def start(self) -> None:
         logger.info("Starting Transport MCP Server")
@@ -102,11 +164,12 @@ class TransportMCPServer(MCPServer):
     ) -> dict[str, Any] | None:
         if self.USE_MOCK_DATA:
             return self.get_mock_response(url, params)
-        headers = {
-            "Authorization": f"Bearer {self.API_KEY}",
-            "User-Agent": self.USER_AGENT,
-        }
-        data = await async_get(url, params=params, headers=headers)
+        headers = {"User-Agent": self.USER_AGENT}
+        if self.API_KEY:
+            headers["Authorization"] = f"Bearer {self.API_KEY}"
+        data = await async_get(
+            url, params=params, headers=headers, timeout=DOMAIN_HTTP_TIMEOUTS["transport"]
+        )
         if "error" in data:
             logger.error(f"Transport API failed | error={data['error']}")
             return None
@@ -114,27 +177,77 @@ class TransportMCPServer(MCPServer):
 
     def get_mock_response(self, url: str, params: dict = None) -> dict[str, Any] | None:
         if "/flights/search" in url:
-            return {"flights": self.MOCK_FLIGHTS}
+            return {"flights": self.mock_direct(params, "flight")}
         elif "/trains/search" in url:
-            return {"trains": self.MOCK_TRAINS}
+            return {"trains": self.mock_direct(params, "train")}
+        elif "/connections/search" in url:
+            search = {
+                "optimize": params.get("optimize") or "earliest",
+                "min_layover": int(params.get("min_layover_minutes") or TRANSPORT_MIN_LAYOVER_MINUTES),
+                "max_layover": TRANSPORT_MAX_LAYOVER_HOURS * 60,
+                "max_legs": int(params.get("max_legs") or TRANSPORT_MAX_LEGS),
+                "limit": TRANSPORT_MAX_CONNECTIONS,
+            }
+            if search["optimize"] not in ("earliest", "cheapest"):
+                return None
+            origin, destination = params.get("origin") or "", params.get("destination") or ""
+            connections = self.routes.connections(origin, destination, params.get("date"), **search)
+            if not connections and params.get("date"):
+                # the bundled timetable covers a few fixed days; fall back to any day
+                connections = self.routes.connections(origin, destination, None, **search)
+            return {"connections": connections}
         elif "/public/search" in url:
-            return {"public_transport": self.MOCK_PUBLIC_TRANSPORT}
+            public = self.catalogs[2]
+            rows, distances = public.near(
+                float(params["latitude"]), float(params["longitude"]), radius_km=GEO_SEARCH_RADIUS_KM
+            )
+            options = []
+            for option, distance in zip(public.materialize(rows), distances):
+                options.append({**option, "distance": round(float(distance), 2)})
+            return {"public_transport": options}
         elif "/details" in url:
-            for opt in (
-                self.MOCK_FLIGHTS + self.MOCK_TRAINS + self.MOCK_PUBLIC_TRANSPORT
-            ):
-                if opt["id"] == params.get("id"):
-                    return opt
+            for catalog in self.catalogs:
+                option = catalog.get(params.get("id"))
+                if option:
+                    return option
         return None
 
+    def mock_direct(self, params: dict, mode: str) -> list[dict]:
+        origin, destination = params.get("origin") or "", params.get("destination") or ""
+        options = self.routes.direct(origin, destination, params.get("date"), mode)
+        if not options and params.get("date"):
+            # the bundled timetable covers a few fixed days; fall back to any day
+            options = self.routes.direct(origin, destination, None, mode)
+        return options
+
+    def format_option(self, data: dict, mock_indicator: str = "") -> str:
+        if "airline" in data:
+            return self.format_flight(data)
+        if "train" in data:
+            return self.format_train(data)
+        if "type" in data:
+            return self.format_public(data)
+        return f"Unknown transport type.{mock_indicator}"
+
     def format_flight(self, f: dict) -> str:
         return f"Flight {f['id']} | {f['airline']} | {f['from']} -> {f['to']} | Dep: {f['departure']} | Arr: {f['arrival']} | {f['duration']} | {f['price']} {f['currency']}"
 
     def format_train(self, t: dict) -> str:
         return f"Train {t['id']} | {t['train']} | {t['from']} -> {t['to']} | Dep: {t['departure']} | Arr: {t['arrival']} | {t['duration']} | {t['price']} {t['currency']}"
 
+    def format_connection(self, c: dict) -> str:
+        legs = "\n".join(
+            "  " + (self.format_flight(leg) if leg["mode"] == "flight" else self.format_train(leg))
+            for leg in c["legs"]
+        )
+        return (
+            f"Connection {c['from']} -> {c['to']} | Dep: {c['departure']} | Arr: {c['arrival']} | "
+            f"{c['duration']} | {c['transfers']} change(s) | {c['price']} {c['currency']}\n{legs}"
+        )
+
     def format_public(self, p: dict) -> str:
-        return f"Public {p['id']} | {p['type']} | Route: {p['route']} | {p['location']} | {p['frequency']} | {p['price']} {p['currency']}"
+        distance = f" | {p['distance']} km away" if p.get("distance") is not None else ""
+        return f"Public {p['id']} | {p['type']} | Route: {p['route']} | {p['location']} | {p['frequency']} | {p['price']} {p['currency']}{distance}"
 
 
 if __name__ == "__main__":
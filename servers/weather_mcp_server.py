@@ -3,21 +3,22 @@ from mcp.server.fastmcp import FastMCP
 import asyncio
 from interfaces.mcp_server_interface import MCPServer
 from data.weather_data import WEATHER_DATA
+from data.catalogs import load_catalog
 from utils.logger import get_logger
-from utils.http_client import async_get
-from config import WEATHER_MOCK_BOOL, OPENWEATHER_API_BASE, OPENWEATHER_API_KEY
+from utils.http_client import async_get, http_client_lifespan
+from config import WEATHER_MOCK_BOOL, OPENWEATHER_API_BASE, OPENWEATHER_API_KEY, DOMAIN_HTTP_TIMEOUTS
 
 logger = get_logger("WeatherMCPServer")
 
 
 class WeatherMCPServer(MCPServer):
     def __init__(self):
-        self.mcp = FastMCP("weather")
+        self.mcp = FastMCP("weather", lifespan=http_client_lifespan)
         self.USE_MOCK_DATA = WEATHER_MOCK_BOOL
         self.API_BASE = OPENWEATHER_API_BASE
         self.API_KEY = OPENWEATHER_API_KEY
         self.USER_AGENT = "weather-app/1.0"
-        self.MOCK_WEATHER = WEATHER_DATA
+        self.MOCK_WEATHER = load_catalog("weather", WEATHER_DATA)
         logger.info(f"WeatherMCPServer initialized | mock_mode={self.USE_MOCK_DATA}")
 
     async def register_tools(self) -> None:
@@ -59,7 +60,9 @@ class WeatherMCPServer(MCPServer):
         params["appid"] = self.API_KEY
         params["units"] = "metric"
         headers = {"User-Agent": self.USER_AGENT}
-        data = await async_get(url, params=params, headers=headers)
+        data = await async_get(
+            url, params=params, headers=headers, timeout=DOMAIN_HTTP_TIMEOUTS["weather"]
+        )
         if "error" in data:
             logger.error(
                 f"Weather API failed | endpoint={endpoint} | error={data['error']}"
@@ -2,7 +2,7 @@ import asyncio
 from models.trip_request import TripRequest
 from utils.validator import validate_trip_request
 from utils.logger import get_logger
-from agents.planner_agent import travel_planner
+from agents.planner_agent import get_travel_planner
 
 logger = get_logger("TestWorkflow")
 
@@ -21,6 +21,7 @@ async def run_planner():
 
     initial_state = {
         "trip": trip,
+        "tier": "full",
         "retries": [],
         "retry_count": 0,
         "done": False,
@@ -35,7 +36,7 @@ async def run_planner():
     }
 
     logger.info("Invoking travel planner graph...")
-    result = await travel_planner.ainvoke(initial_state, {"recursion_limit": 50})
+    result = await get_travel_planner().ainvoke(initial_state, {"recursion_limit": 50})
 
     logger.info("Trip planning completed")
 
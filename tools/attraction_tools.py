@@ -1,5 +1,6 @@
 import asyncio
 from clients.attraction_mcp_client import AttractionMCPClient
+from clients.session_pool import get_session_pool
 from interfaces.tool_interface import AgentToolInterface
 from utils.logger import get_logger
 from utils.error_handler import ToolError
@@ -15,13 +16,18 @@ class AttractionTools(AgentToolInterface):
 
     async def run(self, query: str) -> str:
         logger.info(f"AttractionTools.run | query={query[:80]}...")
+        pool = get_session_pool(self.server_path)
         try:
-            await self.client.connect(self.server_path)
-            result = await self.client.process_query(query)
+            if pool is not None:
+                result = await pool.process_query(query)
+            else:
+                try:
+                    await self.client.connect(self.server_path)
+                    result = await self.client.process_query(query)
+                finally:
+                    await self.client.cleanup()
             logger.info(f"AttractionTools.run completed | result_len={len(result)}")
             return result
         except Exception as e:
             logger.error(f"AttractionTools.run failed | error={e}")
             raise ToolError(str(e), tool_name="AttractionTools")
-        finally:
-            await self.client.cleanup()
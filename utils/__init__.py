@@ -4,6 +4,7 @@ from .error_handler import (
     ToolError,
     ClientError,
     ServerError,
+    CapacityError,
     handle_error,
 )
 from .http_client import async_get
@@ -16,6 +17,7 @@ __all__ = [
     "ToolError",
     "ClientError",
     "ServerError",
+    "CapacityError",
     "handle_error",
     "get",
     "async_get",
@@ -0,0 +1,110 @@
+import asyncio
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+from utils.error_handler import CapacityError
+from utils.logger import get_logger
+from utils.metrics import summarize
+
+logger = get_logger("AdmissionController")
+
+
+class AdmissionController:
+    """
+    Caps how many planner graphs run at once. Requests beyond the cap wait in a
+    bounded queue; a full queue is rejected with 429 and a wait that outlives
+    wait_timeout with 503, both carrying a Retry-After estimate.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int,
+        max_waiting: int,
+        wait_timeout: float,
+        name: str = "Planner",
+    ):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_waiting = max_waiting
+        self.wait_timeout = wait_timeout
+        self.semaphore = asyncio.Semaphore(max_concurrent)
+        self.active = 0
+        self.waiting = 0
+        self.counters = {"admitted": 0, "rejected_queue_full": 0, "rejected_timeout": 0}
+        self.wait_times: deque[float] = deque(maxlen=1000)
+        self.run_times: deque[float] = deque(maxlen=100)
+        logger.info(
+            f"AdmissionController initialized | name={name} | max_concurrent={max_concurrent} "
+            f"| max_waiting={max_waiting} | wait_timeout={wait_timeout}s"
+        )
+
+    @asynccontextmanager
+    async def admit(self, bounded: bool = True) -> AsyncIterator[None]:
+        """
+        Holds one plan slot for the duration of the block. Internal callers that are
+        already bounded (job workers, batches) pass bounded=False to wait without
+        a queue limit or timeout.
+        """
+        if self.semaphore.locked() and bounded and self.waiting >= self.max_waiting:
+            self.counters["rejected_queue_full"] += 1
+            logger.warning(
+                f"Admission rejected — queue full | name={self.name} | active={self.active} | waiting={self.waiting}"
+            )
+            raise CapacityError(
+                f"{self.name} at capacity ({self.active} running, {self.waiting} waiting)",
+                retry_after=self.retry_after(),
+                code=429,
+            )
+
+        self.waiting += 1
+        start = time.perf_counter()
+        try:
+            if not self.semaphore.locked():
+                # free slot: take it now so it is held before the next request is checked
+                await self.semaphore.acquire()
+            elif bounded:
+                await asyncio.wait_for(self.semaphore.acquire(), self.wait_timeout)
+            else:
+                await self.semaphore.acquire()
+        except asyncio.TimeoutError:
+            self.counters["rejected_timeout"] += 1
+            logger.warning(
+                f"Admission rejected — waited {self.wait_timeout}s | name={self.name} | active={self.active} | waiting={self.waiting - 1}"
+            )
+            raise CapacityError(
+                f"Timed out after {self.wait_timeout}s waiting for a {self.name.lower()} slot",
+                retry_after=self.retry_after(),
+                code=503,
+            )
+        finally:
+            self.waiting -= 1
+
+        self.wait_times.append(time.perf_counter() - start)
+        self.counters["admitted"] += 1
+        self.active += 1
+        run_start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.run_times.append(time.perf_counter() - run_start)
+            self.active -= 1
+            self.semaphore.release()
+
+    def retry_after(self) -> int:
+        # time for the current backlog to drain at the recent average plan duration
+        if not self.run_times:
+            return 1
+        avg_run = sum(self.run_times) / len(self.run_times)
+        return max(1, math.ceil(avg_run * (self.waiting + 1) / self.max_concurrent))
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "max_concurrent": self.max_concurrent,
+            "max_waiting": self.max_waiting,
+            "active": self.active,
+            "queue_depth": self.waiting,
+            **self.counters,
+            "wait_seconds": summarize(self.wait_times),
+        }
@@ -0,0 +1,67 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable
+from utils.admission import AdmissionController
+from utils.error_handler import AgentError
+from utils.logger import get_logger
+from utils.metrics import summarize
+
+logger = get_logger("Bulkhead")
+
+
+class Bulkhead:
+    """
+    Isolates one domain's lookups: its own concurrency cap and waiting queue, and a
+    timeout covering both the wait for a slot and the call itself. A slow provider
+    fills only its own bulkhead, so other domains keep their usual latency.
+    """
+
+    def __init__(self, domain: str, max_concurrent: int, max_waiting: int, timeout: float):
+        self.domain = domain
+        self.timeout = timeout
+        self.admission = AdmissionController(
+            max_concurrent, max_waiting, wait_timeout=timeout, name=domain.capitalize()
+        )
+        self.timeouts = 0
+        self.call_times: deque[float] = deque(maxlen=1000)
+
+    async def run(self, call: Callable[[], Awaitable[Any]]) -> Any:
+        start = time.perf_counter()
+        async with self.admission.admit():
+            remaining = max(self.timeout - (time.perf_counter() - start), 0.001)
+            call_start = time.perf_counter()
+            try:
+                return await asyncio.wait_for(call(), remaining)
+            except asyncio.TimeoutError:
+                self.timeouts += 1
+                logger.warning(
+                    f"Bulkhead timeout | domain={self.domain} | timeout={self.timeout}s"
+                )
+                raise AgentError(
+                    f"{self.domain} lookup timed out after {self.timeout}s",
+                    agent_name=self.domain,
+                    code=504,
+                )
+            finally:
+                self.call_times.append(time.perf_counter() - call_start)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            **self.admission.stats(),
+            "timeout_seconds": self.timeout,
+            "timeouts": self.timeouts,
+            "call_seconds": summarize(self.call_times),
+        }
+
+
+def build_bulkheads(limits: dict[str, dict[str, Any]]) -> dict[str, Bulkhead]:
+    return {
+        domain: Bulkhead(
+            domain,
+            max_concurrent=limit["max_concurrent"],
+            max_waiting=limit["max_waiting"],
+            timeout=limit["timeout"],
+        )
+        for domain, limit in limits.items()
+    }
@@ -0,0 +1,419 @@
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import weakref
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Mapping
+from utils.logger import get_logger
+
+logger = get_logger("Cache")
+
+# disk tiers opened in this process and caches whose stats are logged, both
+# walked by maintain_caches()
+_stores: "weakref.WeakSet[SQLiteStore]" = weakref.WeakSet()
+_reported: dict[str, Any] = {}
+
+
+class LRUCache:
+    """
+    In-memory LRU with a per-entry expiry. Expired entries are dropped on read.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+
+    def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, expires_at: float) -> None:
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteStore:
+    """
+    Persistent key -> JSON value table with expiry, used as the disk tier behind LRUCache.
+    """
+
+    def __init__(self, db_path: str, table: str = "cache"):
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        self.table = table
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self.conn.commit()
+        _stores.add(self)
+        purged = self.purge_expired()
+        logger.info(f"SQLiteStore ready | db={db_path} | table={table} | purged={purged}")
+
+    def get(self, key: str) -> tuple[Any, float] | None:
+        row = self.conn.execute(
+            f"SELECT value, expires_at FROM {self.table} WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        value, expires_at = row
+        if expires_at <= time.time():
+            self.delete(key)
+            return None
+        return json.loads(value), expires_at
+
+    def set(self, key: str, value: Any, expires_at: float) -> None:
+        self.conn.execute(
+            f"INSERT OR REPLACE INTO {self.table} (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, json.dumps(value), expires_at),
+        )
+        self.conn.commit()
+
+    def delete(self, key: str) -> None:
+        self.conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+        self.conn.commit()
+
+    def purge_expired(self) -> int:
+        cur = self.conn.execute(
+            f"DELETE FROM {self.table} WHERE expires_at <= ?", (time.time(),)
+        )
+        self.conn.commit()
+        return cur.rowcount
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key into one underlying call.
+    """
+
+    def __init__(self):
+        self._calls: dict[str, asyncio.Future] = {}
+
+    def in_flight(self, key: str) -> bool:
+        return key in self._calls
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        call = self._calls.get(key)
+        if call is None:
+            call = asyncio.ensure_future(fn())
+            self._calls[key] = call
+            call.add_done_callback(lambda _: self._calls.pop(key, None))
+        # shield so one cancelled waiter does not cancel the call for the others
+        return await asyncio.shield(call)
+
+
+class DomainCache:
+    """
+    Result cache in front of the domain nodes: one TTL per domain, an in-memory LRU
+    and an optional SQLite tier, plus hit/miss counters per domain.
+    """
+
+    def __init__(
+        self,
+        ttls: dict[str, int],
+        max_entries: int = 1024,
+        db_path: str | None = None,
+    ):
+        self.ttls = ttls
+        self.memory = LRUCache(max_entries)
+        self.store = SQLiteStore(db_path, table="domain_cache") if db_path else None
+        self.flights = SingleFlight()
+        self.hits = {domain: 0 for domain in ttls}
+        self.misses = {domain: 0 for domain in ttls}
+        self.coalesced = {domain: 0 for domain in ttls}
+        logger.info(
+            f"DomainCache initialized | ttls={ttls} | max_entries={max_entries} | persistent={bool(db_path)}"
+        )
+
+    def get(self, domain: str, key: str) -> Any | None:
+        full_key = f"{domain}:{key}"
+        value = self.memory.get(full_key)
+        if value is None and self.store:
+            stored = self.store.get(full_key)
+            if stored is not None:
+                value, expires_at = stored
+                self.memory.set(full_key, value, expires_at)
+
+        if value is None:
+            self.misses[domain] = self.misses.get(domain, 0) + 1
+            logger.debug(f"DomainCache miss | {full_key}")
+            return None
+        self.hits[domain] = self.hits.get(domain, 0) + 1
+        logger.info(f"DomainCache hit | {full_key}")
+        return value
+
+    def set(self, domain: str, key: str, value: Any) -> None:
+        ttl = self.ttls.get(domain, 0)
+        if ttl <= 0:
+            return
+        full_key = f"{domain}:{key}"
+        expires_at = time.time() + ttl
+        self.memory.set(full_key, value, expires_at)
+        if self.store:
+            self.store.set(full_key, value, expires_at)
+
+    async def coalesce(
+        self, domain: str, key: str, compute: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Runs compute once for all concurrent callers asking for the same domain key.
+        """
+        full_key = f"{domain}:{key}"
+        if self.flights.in_flight(full_key):
+            self.coalesced[domain] = self.coalesced.get(domain, 0) + 1
+            logger.info(f"DomainCache coalesced | {full_key}")
+        return await self.flights.do(full_key, compute)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        stats = {}
+        for domain in self.ttls:
+            hits, misses = self.hits.get(domain, 0), self.misses.get(domain, 0)
+            lookups = hits + misses
+            stats[domain] = {
+                "ttl_seconds": self.ttls[domain],
+                "hits": hits,
+                "misses": misses,
+                "coalesced": self.coalesced.get(domain, 0),
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            }
+        return stats
+
+
+def freshness_lifetime(headers: Mapping[str, str]) -> float | None:
+    """
+    Seconds a response stays fresh per Cache-Control (s-maxage/max-age) or Expires.
+    Returns None when the response must not be stored and 0 when it must be
+    revalidated before every use.
+    """
+    directives = {}
+    for part in headers.get("cache-control", "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"')
+
+    if "no-store" in directives:
+        return None
+    if "no-cache" in directives:
+        return 0.0
+    for name in ("s-maxage", "max-age"):
+        if directives.get(name, "").isdigit():
+            return float(directives[name])
+
+    if "expires" in headers:
+        try:
+            expires = parsedate_to_datetime(headers["expires"]).timestamp()
+            date = (
+                parsedate_to_datetime(headers["date"]).timestamp()
+                if "date" in headers
+                else time.time()
+            )
+        except (TypeError, ValueError):
+            return 0.0
+        return max(expires - date, 0.0)
+    return None
+
+
+class HTTPResponseCache:
+    """
+    Response cache for provider GETs keyed on URL + params. Freshness comes from
+    Cache-Control/Expires unless a per-endpoint override matches the URL. Entries
+    with an ETag are kept past their freshness (for stale_ttl seconds) so they can
+    be revalidated with If-None-Match instead of refetched.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        db_path: str | None = None,
+        ttl_overrides: dict[str, int] | None = None,
+        stale_ttl: int = 86400,
+    ):
+        self.memory = LRUCache(max_entries)
+        self.store = SQLiteStore(db_path, table="http_cache") if db_path else None
+        self.ttl_overrides = ttl_overrides or {}
+        self.stale_ttl = stale_ttl
+        self.counters = {"hits": 0, "misses": 0, "revalidated": 0, "stored": 0}
+
+    def stats(self) -> dict[str, Any]:
+        return {**self.counters, "entries": len(self.memory)}
+
+    @staticmethod
+    def key(url: str, params: dict | None) -> str:
+        # hashed so API keys passed as query params are not written to disk
+        raw = json.dumps([url, sorted((params or {}).items())], default=str)
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def lookup(self, url: str, params: dict | None) -> dict[str, Any] | None:
+        key = self.key(url, params)
+        entry = self.memory.get(key)
+        if entry is None and self.store:
+            stored = self.store.get(key)
+            if stored is not None:
+                entry, expires_at = stored
+                self.memory.set(key, entry, expires_at)
+        if entry is None:
+            self.counters["misses"] += 1
+        return entry
+
+    def is_fresh(self, entry: dict[str, Any]) -> bool:
+        fresh = entry["fresh_until"] > time.time()
+        self.counters["hits" if fresh else "misses"] += 1
+        return fresh
+
+    def store_response(
+        self, url: str, params: dict | None, headers: Mapping[str, str], body: Any
+    ) -> None:
+        ttl = self._ttl(url, headers)
+        etag = headers.get("etag")
+        if ttl is None or (ttl <= 0 and not etag):
+            return
+        fresh_until = time.time() + ttl
+        entry = {"body": body, "etag": etag, "fresh_until": fresh_until}
+        expires_at = fresh_until + (self.stale_ttl if etag else 0)
+        key = self.key(url, params)
+        self.memory.set(key, entry, expires_at)
+        if self.store:
+            self.store.set(key, entry, expires_at)
+        self.counters["stored"] += 1
+
+    def revalidated(
+        self, url: str, params: dict | None, headers: Mapping[str, str], entry: dict[str, Any]
+    ) -> Any:
+        """
+        Handles a 304: the stored body is still valid, refresh its lifetime.
+        """
+        self.counters["revalidated"] += 1
+        merged = {"etag": entry.get("etag") or "", **dict(headers)}
+        self.store_response(url, params, merged, entry["body"])
+        return entry["body"]
+
+    def _ttl(self, url: str, headers: Mapping[str, str]) -> float | None:
+        for fragment, ttl in self.ttl_overrides.items():
+            if fragment in url:
+                return float(ttl)
+        return freshness_lifetime(headers)
+
+
+class DestinationCache:
+    """
+    Persistent name -> destination id map for provider location lookups. Ids are
+    effectively permanent, so entries live for ttl (default 30 days); names the
+    provider does not know are remembered for negative_ttl so they are not looked
+    up again on every search. Seed entries are always served from memory; stored
+    entries are namespaced (e.g. by API base URL) so ids from one provider are never
+    sent to another.
+    """
+
+    NOT_FOUND = {"not_found": True}
+
+    def __init__(
+        self,
+        db_path: str | None = None,
+        ttl: int = 30 * 86400,
+        negative_ttl: int = 86400,
+        seed: dict[str, dict[str, Any]] | None = None,
+        namespace: str = "",
+    ):
+        self.namespace = namespace
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.seed = {self.normalize(name): value for name, value in (seed or {}).items()}
+        self.store = SQLiteStore(db_path, table="destinations") if db_path else None
+        self.learned: dict[str, tuple[dict[str, Any], float]] = {}
+        self.counters = {"hits": 0, "negative_hits": 0, "misses": 0}
+
+    def stats(self) -> dict[str, Any]:
+        return {**self.counters, "seeded": len(self.seed), "learned": len(self.learned)}
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        return " ".join(name.lower().split())
+
+    def get(self, name: str) -> dict[str, Any] | None:
+        """
+        Returns the destination, NOT_FOUND for a cached unknown name, or None on a miss.
+        """
+        key = self.normalize(name)
+        value = self.seed.get(key)
+        if value is None:
+            entry = self.learned.get(key)
+            if entry and entry[1] > time.time():
+                value = entry[0]
+            elif self.store:
+                stored = self.store.get(f"{self.namespace}|{key}")
+                if stored is not None:
+                    self.learned[key] = stored
+                    value = stored[0]
+
+        if value is None:
+            self.counters["misses"] += 1
+        elif value == self.NOT_FOUND:
+            self.counters["negative_hits"] += 1
+        else:
+            self.counters["hits"] += 1
+        return value
+
+    def set(self, name: str, destination: dict[str, Any]) -> None:
+        self._remember(name, destination, self.ttl)
+
+    def set_not_found(self, name: str) -> None:
+        self._remember(name, self.NOT_FOUND, self.negative_ttl)
+
+    def _remember(self, name: str, value: dict[str, Any], ttl: int) -> None:
+        key = self.normalize(name)
+        expires_at = time.time() + ttl
+        self.learned[key] = (value, expires_at)
+        if self.store:
+            self.store.set(f"{self.namespace}|{key}", value, expires_at)
+
+
+def report_stats(name: str, cache: Any) -> None:
+    """
+    Registers a cache (anything with stats()) for the periodic stats log.
+    """
+    _reported[name] = cache
+
+
+def cache_stats() -> dict[str, dict[str, Any]]:
+    return {name: cache.stats() for name, cache in _reported.items()}
+
+
+def purge_expired_stores() -> int:
+    return sum(store.purge_expired() for store in list(_stores))
+
+
+async def maintain_caches(interval: float) -> None:
+    """
+    Every interval seconds, drops expired rows from every disk tier opened in this
+    process (reads only skip them) and logs the registered caches' stats.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            purged = purge_expired_stores()
+        except sqlite3.Error as e:
+            logger.warning(f"Cache maintenance failed | error={e}")
+            continue
+        logger.info(f"Cache maintenance | purged={purged} | stats={cache_stats()}")
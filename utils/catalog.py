@@ -0,0 +1,247 @@
+from collections import defaultdict
+from collections.abc import Sequence
+from typing import Any, Callable, Iterable
+import numpy as np
+from config import GEO_CELL_DEG
+from data.preference_terms import PREFERENCE_TERMS
+from utils.geo import GeoIndex
+from utils.text_index import TextIndex, flatten_text
+
+Record = dict[str, Any]
+
+
+def normalize_place(name: str) -> str:
+    return " ".join(str(name).lower().split())
+
+
+def place_keys(location: str) -> list[str]:
+    """
+    "Apollo Bunder, Colaba, Mumbai" -> ["apollo bunder", "colaba", "mumbai"], so a
+    record is found by any comma-separated part of its location.
+    """
+    return [key for key in (normalize_place(part) for part in str(location).split(",")) if key]
+
+
+def get_path(value: Any, path: list[str] | str) -> Any:
+    for part in path.split(".") if isinstance(path, str) else path:
+        if isinstance(value, dict):
+            value = value.get(part)
+        elif isinstance(value, list) and part.isdigit() and int(part) < len(value):
+            value = value[int(part)]
+        else:
+            return None
+    return value
+
+
+def field_values(records: Sequence[Record], path: str) -> np.ndarray | list[Any]:
+    if hasattr(records, "field_values"):
+        return records.field_values(path)
+    return [get_path(record, path) for record in records]
+
+
+class CatalogIndex:
+    """
+    Read-only columnar indexes over a list of catalog records, built once when a
+    server starts: id -> record, place -> row array, float64 numeric columns (NaN
+    when missing) and int32-coded categorical columns. Searches evaluate their
+    predicates as vectorized masks, select the best rows with argpartition, and
+    only the selected rows are materialized back into dicts.
+    """
+
+    def __init__(
+        self,
+        records: Sequence[Record],
+        id_field: str = "id",
+        places: dict[str, Callable[[Any], Iterable[str]]] | None = None,
+        numeric: dict[str, str] | None = None,
+        categorical: dict[str, str] | None = None,
+        coordinates: tuple[str, str] | None = None,
+        text: dict[str, float] | None = None,
+    ):
+        """
+        Fields are dotted paths into the records ("location.city",
+        "categories.0.title"): places maps a field to the place keys its value
+        yields, numeric and categorical map a column name to its field,
+        coordinates names the (latitude, longitude) fields for near(), and text
+        maps the fields match() searches to their weight. A MappedCatalog is
+        indexed straight from its columns, without decoding records.
+        """
+        self.records = records if isinstance(records, Sequence) else list(records)
+        self.by_id: dict[str, int] = {
+            str(value): row
+            for row, value in enumerate(field_values(self.records, id_field))
+            if value is not None
+        }
+
+        by_place: dict[str, list[int]] = defaultdict(list)
+        for field, keys_of in (places or {}).items():
+            keys_by_value: dict[Any, list[str]] = {}
+            for row, value in enumerate(field_values(self.records, field)):
+                if value is None:
+                    continue
+                if value not in keys_by_value:
+                    keys_by_value[value] = keys_of(value)
+                for key in keys_by_value[value]:
+                    rows = by_place[key]
+                    if not rows or rows[-1] != row:
+                        rows.append(row)
+        self.by_place = {
+            key: np.unique(np.asarray(rows, dtype=np.int32)) for key, rows in by_place.items()
+        }
+
+        self.numeric: dict[str, np.ndarray] = self._numeric_columns(numeric or {})
+
+        # name -> (codes, vocabulary); code -1 marks a missing value
+        self.categorical: dict[str, tuple[np.ndarray, list[str]]] = {}
+        for name, field in (categorical or {}).items():
+            vocabulary: dict[str, int] = {}
+            codes = np.array(
+                [
+                    -1 if v is None else vocabulary.setdefault(normalize_place(v), len(vocabulary))
+                    for v in field_values(self.records, field)
+                ],
+                dtype=np.int32,
+            )
+            self.categorical[name] = (codes, list(vocabulary))
+
+        self.geo: GeoIndex | None = None
+        if coordinates:
+            latitude, longitude = coordinates
+            self.numeric.update(self._numeric_columns({"latitude": latitude, "longitude": longitude}))
+            self.geo = GeoIndex(self.numeric["latitude"], self.numeric["longitude"], GEO_CELL_DEG)
+
+        self.text: TextIndex | None = None
+        if text:
+            columns = [
+                [(flatten_text(value), weight) for value in field_values(self.records, field)]
+                for field, weight in text.items()
+            ]
+            self.text = TextIndex(zip(*columns), synonyms=PREFERENCE_TERMS)
+
+    def _numeric_columns(self, fields: dict[str, str]) -> dict[str, np.ndarray]:
+        columns = {}
+        for name, field in fields.items():
+            values = field_values(self.records, field)
+            if not isinstance(values, np.ndarray):
+                values = [np.nan if v is None else v for v in values]
+            columns[name] = np.asarray(values, dtype=np.float64)
+        return columns
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def get(self, record_id: str) -> Record | None:
+        row = self.by_id.get(str(record_id))
+        return None if row is None else self.records[row]
+
+    def resolve_place(self, place: str) -> str | None:
+        """
+        Maps a free-form place ("Mumbai", "Mumbai, India") to an indexed key: the whole
+        string first, then its comma-separated parts.
+        """
+        for key in [normalize_place(place), *place_keys(place)]:
+            if key in self.by_place:
+                return key
+        return None
+
+    def rows(self, place: str | None = None) -> np.ndarray:
+        if place is None:
+            return np.arange(len(self.records), dtype=np.int32)
+        key = self.resolve_place(place)
+        if key is None:
+            return np.empty(0, dtype=np.int32)
+        return self.by_place[key]
+
+    def select(
+        self,
+        place: str | None = None,
+        ranges: dict[str, tuple[float | None, float | None]] | None = None,
+        categories: dict[str, Callable[[str], bool]] | None = None,
+    ) -> np.ndarray:
+        """
+        Rows in place whose numeric columns fall within ranges (inclusive, either
+        bound optional) and whose categorical values pass the given predicates. A
+        category predicate runs once per distinct value, not once per row.
+        """
+        rows = self.rows(place)
+        mask = np.ones(len(rows), dtype=bool)
+        for name, (low, high) in (ranges or {}).items():
+            values = self.numeric[name][rows]
+            if low is not None:
+                mask &= values >= low
+            if high is not None:
+                mask &= values <= high
+        for name, accept in (categories or {}).items():
+            codes, vocabulary = self.categorical[name]
+            accepted = [code for code, value in enumerate(vocabulary) if accept(value)]
+            mask &= np.isin(codes[rows], accepted)
+        return rows[mask]
+
+    def top_k(
+        self, rows: np.ndarray, column: str, k: int, descending: bool = True
+    ) -> np.ndarray:
+        """
+        The k rows with the highest (or lowest) column values, in order; rows with a
+        missing value come last.
+        """
+        if k <= 0 or len(rows) == 0:
+            return rows[:0]
+        values = self.numeric[column][rows]
+        keys = np.where(np.isnan(values), np.inf, -values if descending else values)
+        if k < len(rows):
+            picked = np.argpartition(keys, k - 1)[:k]
+        else:
+            picked = np.arange(len(rows))
+        return rows[picked[np.argsort(keys[picked], kind="stable")]]
+
+    def materialize(self, rows: Iterable[int]) -> list[Record]:
+        return [self.records[row] for row in rows]
+
+    def in_place(self, place: str | None) -> list[Record]:
+        return self.materialize(self.rows(place))
+
+    def range(
+        self,
+        column: str,
+        low: float | None = None,
+        high: float | None = None,
+        place: str | None = None,
+    ) -> list[Record]:
+        """
+        Records with low <= column <= high, ascending by column.
+        """
+        rows = self.select(place, ranges={column: (low, high)})
+        return self.materialize(self.top_k(rows, column, len(rows), descending=False))
+
+    def top(
+        self, column: str, n: int, place: str | None = None, descending: bool = True
+    ) -> list[Record]:
+        return self.materialize(self.top_k(self.rows(place), column, n, descending))
+
+    def near(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_km: float | None = None,
+        k: int | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Rows ordered by distance from the point, with their distances in km: the k
+        nearest (optionally within radius_km), or everything within radius_km.
+        """
+        if self.geo is None:
+            raise ValueError("catalog was built without coordinates")
+        if k is not None:
+            return self.geo.nearest(latitude, longitude, k, max_km=radius_km)
+        return self.geo.within(latitude, longitude, radius_km or 0.0)
+
+    def match(
+        self, query: str | list[str], rows: np.ndarray | None = None, k: int | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Rows (of rows, or all) matching the free-text query, by BM25 score, with
+        their scores.
+        """
+        if self.text is None:
+            raise ValueError("catalog was built without text fields")
+        return self.text.search(query, rows, k)
@@ -0,0 +1,57 @@
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+from config import CHECKPOINT_DB_PATH
+from utils.logger import get_logger
+
+logger = get_logger("Checkpointer")
+
+
+def plan_config(plan_id: str, recursion_limit: int = 50) -> dict:
+    return {
+        "configurable": {"thread_id": plan_id},
+        "recursion_limit": recursion_limit,
+    }
+
+
+@asynccontextmanager
+async def open_checkpointer(
+    db_path: str = CHECKPOINT_DB_PATH,
+) -> AsyncIterator[AsyncSqliteSaver]:
+    """
+    Opens the SQLite checkpoint store used to persist planner runs, one thread per plan.
+    """
+    db_dir = os.path.dirname(db_path)
+    if db_dir:
+        os.makedirs(db_dir, exist_ok=True)
+
+    async with AsyncSqliteSaver.from_conn_string(db_path) as saver:
+        await saver.setup()
+        logger.info(f"Checkpointer ready | db={db_path}")
+        yield saver
+    logger.info("Checkpointer closed")
+
+
+async def compact_plan(saver: AsyncSqliteSaver, plan_id: str) -> None:
+    """
+    Drops every checkpoint of a plan except the latest one (and its pending writes).
+    Resuming only ever needs the latest checkpoint, so each plan costs one row.
+    """
+    latest = await saver.aget_tuple({"configurable": {"thread_id": plan_id}})
+    if not latest:
+        return
+
+    checkpoint_id = latest.config["configurable"]["checkpoint_id"]
+    async with saver.lock, saver.conn.cursor() as cur:
+        await cur.execute(
+            "DELETE FROM checkpoints WHERE thread_id = ? AND checkpoint_id != ?",
+            (plan_id, checkpoint_id),
+        )
+        removed = cur.rowcount
+        await cur.execute(
+            "DELETE FROM writes WHERE thread_id = ? AND checkpoint_id != ?",
+            (plan_id, checkpoint_id),
+        )
+        await saver.conn.commit()
+    logger.debug(f"compact_plan | plan_id={plan_id} | removed={removed} checkpoints")
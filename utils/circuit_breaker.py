@@ -0,0 +1,88 @@
+import time
+from typing import Any
+from utils.cache import SQLiteStore
+from utils.logger import get_logger
+
+logger = get_logger("CircuitBreaker")
+
+
+class CircuitBreaker:
+    """
+    Per-host breaker: after failure_threshold consecutive provider failures it opens
+    and calls fail fast for reset_timeout seconds, then a single trial call decides
+    whether it closes again or stays open. With a store, an open breaker is shared
+    with the other server processes until it expires.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        store: SQLiteStore | None = None,
+    ):
+        self.name = name
+        self.store = store
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.changed_at = time.monotonic()
+        self.rejected = 0
+
+    def allow(self) -> bool:
+        if self.state == "closed":
+            if self.store and self.store.get(self.name) is not None:
+                self.rejected += 1
+                return False
+            return True
+        # also re-admits a trial whose caller was cancelled before reporting back
+        if time.monotonic() - self.changed_at >= self.reset_timeout:
+            self._transition("half_open")
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        if self.state != "closed":
+            self._transition("closed")
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.state == "half_open" or self.failures >= self.failure_threshold:
+            self._transition("open")
+
+    def _transition(self, state: str) -> None:
+        if state != self.state:
+            log = logger.warning if state == "open" else logger.info
+            log(f"Circuit {state} | host={self.name} | failures={self.failures}")
+        if self.store and state == "open":
+            self.store.set(
+                self.name, {"failures": self.failures}, time.time() + self.reset_timeout
+            )
+        elif self.store and state == "closed":
+            self.store.delete(self.name)
+        self.state = state
+        self.changed_at = time.monotonic()
+
+    def stats(self) -> dict[str, Any]:
+        return {"state": self.state, "failures": self.failures, "rejected": self.rejected}
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_store: SQLiteStore | None = None
+
+
+def get_breaker(
+    host: str,
+    failure_threshold: int = 5,
+    reset_timeout: float = 30.0,
+    db_path: str | None = None,
+) -> CircuitBreaker:
+    global _store
+    if db_path and _store is None:
+        _store = SQLiteStore(db_path, table="circuit_breakers")
+    if host not in _breakers:
+        _breakers[host] = CircuitBreaker(host, failure_threshold, reset_timeout, _store)
+    return _breakers[host]
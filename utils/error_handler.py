@@ -34,6 +34,12 @@ class ServerError(Error):
         super().__init__(f"ServerError({server_name}): {message}", code)
 
 
+class CapacityError(Error):
+    def __init__(self, message: str, retry_after: int = 1, code: int = 429):
+        self.retry_after = retry_after
+        super().__init__(f"CapacityError: {message}", code)
+
+
 def handle_error(e: Exception) -> dict:
     return {
         "error": str(e),
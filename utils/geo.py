@@ -0,0 +1,107 @@
+import math
+from collections import defaultdict
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+def haversine_km(lat: float, lon: float, latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+    lat1, lon1 = math.radians(lat), math.radians(lon)
+    lat2, lon2 = np.radians(latitudes), np.radians(longitudes)
+    a = np.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+class GeoIndex:
+    """
+    Uniform lat/lon grid over a set of points. Radius queries only compute exact
+    (haversine) distances for the rows in cells overlapping the query's bounding
+    box; k-nearest queries grow a ring of cells until the k-th distance found is
+    closer than anything an unvisited cell could hold.
+    """
+
+    def __init__(self, latitudes: np.ndarray, longitudes: np.ndarray, cell_deg: float = 0.1):
+        self.latitudes = np.asarray(latitudes, dtype=np.float64)
+        self.longitudes = np.asarray(longitudes, dtype=np.float64)
+        self.cell_deg = cell_deg
+
+        located = np.flatnonzero(~(np.isnan(self.latitudes) | np.isnan(self.longitudes)))
+        cells: dict[tuple[int, int], list[int]] = defaultdict(list)
+        for row, i, j in zip(
+            located.tolist(),
+            self._cell(self.latitudes[located]).tolist(),
+            self._cell(self.longitudes[located]).tolist(),
+        ):
+            cells[(i, j)].append(row)
+        self.cells = {cell: np.asarray(rows, dtype=np.int32) for cell, rows in cells.items()}
+        self.located = len(located)
+
+    def _cell(self, degrees):
+        return np.floor(np.asarray(degrees) / self.cell_deg).astype(np.int64)
+
+    def _rows_in(self, cells: list[tuple[int, int]]) -> np.ndarray:
+        found = [self.cells[cell] for cell in cells if cell in self.cells]
+        return np.concatenate(found) if found else np.empty(0, dtype=np.int32)
+
+    def _ranked(self, lat: float, lon: float, rows: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        distances = haversine_km(lat, lon, self.latitudes[rows], self.longitudes[rows])
+        order = np.argsort(distances, kind="stable")
+        return rows[order], distances[order]
+
+    def within(self, lat: float, lon: float, radius_km: float) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Rows within radius_km of (lat, lon) and their distances, nearest first.
+        """
+        lat_span = radius_km / 111.0
+        # a degree of longitude shrinks towards the poles
+        lon_span = radius_km / max(111.0 * math.cos(math.radians(min(abs(lat) + lat_span, 89.9))), 1e-6)
+        i0, i1 = (int(v) for v in self._cell([lat - lat_span, lat + lat_span]))
+        j0, j1 = (int(v) for v in self._cell([lon - lon_span, lon + lon_span]))
+        cells = [(i, j) for i in range(i0, i1 + 1) for j in range(j0, j1 + 1)]
+        if len(cells) > len(self.cells):
+            cells = [cell for cell in self.cells if i0 <= cell[0] <= i1 and j0 <= cell[1] <= j1]
+        rows, distances = self._ranked(lat, lon, self._rows_in(cells))
+        keep = distances <= radius_km
+        return rows[keep], distances[keep]
+
+    def nearest(
+        self, lat: float, lon: float, k: int, max_km: float | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Up to k rows nearest to (lat, lon), optionally no further than max_km.
+        """
+        if k <= 0 or not self.located:
+            return np.empty(0, dtype=np.int32), np.empty(0)
+        ci, cj = int(self._cell(lat)), int(self._cell(lon))
+        visited: list[tuple[int, int]] = []
+        ring = 0
+        while True:
+            visited += [
+                (ci + di, cj + dj)
+                for di in range(-ring, ring + 1)
+                for dj in range(-ring, ring + 1)
+                if max(abs(di), abs(dj)) == ring
+            ]
+            rows = self._rows_in(visited)
+            # anything outside the visited square is at least ring cells away; use the
+            # narrowest longitude degree the square reaches so the bound stays safe
+            reach = min(abs(lat) + (ring + 1) * self.cell_deg, 89.9)
+            covered_km = ring * self.cell_deg * 111.0 * math.cos(math.radians(reach))
+            enough = len(rows) >= k
+            exhausted = len(rows) == self.located or (max_km is not None and covered_km >= max_km)
+            if enough or exhausted:
+                ranked_rows, distances = self._ranked(lat, lon, rows)
+                if exhausted or (len(distances) >= k and distances[k - 1] <= covered_km):
+                    if max_km is not None:
+                        keep = distances <= max_km
+                        ranked_rows, distances = ranked_rows[keep], distances[keep]
+                    return ranked_rows[:k], distances[:k]
+            if len(visited) > 4 * len(self.cells) + 8:
+                # sparse grid: ranking every located row is cheaper than more rings
+                rows = self._rows_in(list(self.cells))
+                ranked_rows, distances = self._ranked(lat, lon, rows)
+                if max_km is not None:
+                    keep = distances <= max_km
+                    ranked_rows, distances = ranked_rows[keep], distances[keep]
+                return ranked_rows[:k], distances[:k]
+            ring += 1
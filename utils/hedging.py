@@ -0,0 +1,125 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, TypeVar
+from config import (
+    HEDGE_PERCENTILE,
+    HEDGE_MAX_RATE,
+    HEDGE_MIN_SAMPLES,
+    HEDGE_INITIAL_DELAY,
+)
+from utils.logger import get_logger
+from utils.metrics import percentile, summarize
+
+logger = get_logger("Hedging")
+
+T = TypeVar("T")
+
+
+class Hedger:
+    """
+    Request hedging for idempotent calls. When a call has not returned after the
+    recent HEDGE_PERCENTILE latency, a duplicate is started; the first successful
+    response wins and the other is cancelled. Hedges are capped at max_rate of the
+    recent calls so a slow provider is not hit with twice the load.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        q: float = HEDGE_PERCENTILE,
+        max_rate: float = HEDGE_MAX_RATE,
+        min_samples: int = HEDGE_MIN_SAMPLES,
+        initial_delay: float = HEDGE_INITIAL_DELAY,
+    ):
+        self.name = name
+        self.q = q
+        self.max_rate = max_rate
+        self.min_samples = min_samples
+        self.initial_delay = initial_delay
+        self.latencies: deque[float] = deque(maxlen=1000)
+        self.recent_hedges: deque[bool] = deque(maxlen=1000)
+        self.counters = {"calls": 0, "hedged": 0, "hedge_wins": 0, "rate_capped": 0}
+
+    def delay(self) -> float:
+        # the initial delay covers short-lived processes that never collect enough samples
+        if len(self.latencies) < self.min_samples:
+            return self.initial_delay
+        return percentile(self.latencies, self.q)
+
+    def hedge_rate(self) -> float:
+        if not self.recent_hedges:
+            return 0.0
+        return sum(self.recent_hedges) / len(self.recent_hedges)
+
+    async def run(self, call: Callable[[], Awaitable[T]]) -> T:
+        self.counters["calls"] += 1
+        start = time.perf_counter()
+        delay = self.delay()
+        primary = asyncio.ensure_future(call())
+        hedged = False
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done:
+                return primary.result()
+
+            if self.hedge_rate() >= self.max_rate:
+                self.counters["rate_capped"] += 1
+                logger.debug(
+                    f"Hedge skipped — rate cap | name={self.name} | rate={self.hedge_rate():.3f}"
+                )
+                return await primary
+
+            hedged = True
+            self.counters["hedged"] += 1
+            logger.info(f"Hedging call | name={self.name} | after={delay:.3f}s")
+            hedge = asyncio.ensure_future(call())
+            result, winner = await self._first_success(primary, hedge)
+            if winner is hedge:
+                self.counters["hedge_wins"] += 1
+            return result
+        finally:
+            self.latencies.append(time.perf_counter() - start)
+            self.recent_hedges.append(hedged)
+            if not primary.done():
+                primary.cancel()
+
+    async def _first_success(
+        self, primary: asyncio.Future, hedge: asyncio.Future
+    ) -> tuple[Any, asyncio.Future]:
+        pending = {primary, hedge}
+        error: BaseException | None = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    if future.exception() is None:
+                        return future.result(), future
+                    error = future.exception()
+            raise error
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            **self.counters,
+            "hedge_rate": round(self.hedge_rate(), 4),
+            "delay_seconds": round(self.delay(), 3),
+            "latency_seconds": summarize(self.latencies),
+        }
+
+
+_hedgers: dict[str, Hedger] = {}
+
+
+def get_hedger(name: str) -> Hedger:
+    if name not in _hedgers:
+        _hedgers[name] = Hedger(name)
+    return _hedgers[name]
+
+
+def hedging_stats() -> dict[str, dict[str, Any]]:
+    return {name: hedger.stats() for name, hedger in _hedgers.items()}
@@ -1,45 +1,231 @@
 import time
 import httpx
 import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+from urllib.parse import urlparse
+from config import (
+    HEDGE_HTTP_CALLS,
+    HTTP2_ENABLED,
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_POOL_TIMEOUT,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE,
+    HTTP_KEEPALIVE_EXPIRY,
+    HTTP_MAX_CONNECTIONS_PER_HOST,
+    HTTP_CACHE_ENABLED,
+    HTTP_CACHE_MAX_ENTRIES,
+    HTTP_CACHE_DB_PATH,
+    HTTP_CACHE_STALE_TTL,
+    HTTP_CACHE_TTL_OVERRIDES,
+    CACHE_MAINTENANCE_INTERVAL,
+    HTTP_MAX_ATTEMPTS,
+    HTTP_BACKOFF_BASE,
+    HTTP_BACKOFF_MAX,
+    HTTP_RETRY_BUDGET,
+    HTTP_BREAKER_THRESHOLD,
+    HTTP_BREAKER_RESET,
+    HTTP_BREAKER_DB_PATH,
+)
+from utils.cache import HTTPResponseCache, cache_stats, maintain_caches, report_stats
+from utils.circuit_breaker import get_breaker
+from utils.retry import RetryPolicy
+from utils.hedging import get_hedger
 from utils.logger import get_logger
 
 logger = get_logger("HTTPClient")
 
 DEFAULT_TIMEOUT = 30
-MAX_RETRIES = 3
-BACKOFF_FACTOR = 1.5
+
+retry_policy = RetryPolicy(
+    max_attempts=HTTP_MAX_ATTEMPTS,
+    base_delay=HTTP_BACKOFF_BASE,
+    max_delay=HTTP_BACKOFF_MAX,
+    budget=HTTP_RETRY_BUDGET,
+)
+
+_client: httpx.AsyncClient | None = None
+_host_slots: dict[str, asyncio.Semaphore] = {}
+_response_cache: HTTPResponseCache | None = None
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Process-wide pooled client: keep-alive connections are reused across calls, so
+    repeat requests to a provider skip DNS, TCP and TLS setup.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        http2 = HTTP2_ENABLED and _http2_available()
+        if HTTP2_ENABLED and not http2:
+            logger.warning("HTTP2_ENABLED is set but 'h2' is not installed — using HTTP/1.1")
+        _client = httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+            ),
+            timeout=httpx.Timeout(
+                DEFAULT_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT, pool=HTTP_POOL_TIMEOUT
+            ),
+        )
+        logger.info(
+            f"HTTP client created | http2={http2} | max_connections={HTTP_MAX_CONNECTIONS} "
+            f"| max_keepalive={HTTP_MAX_KEEPALIVE} | per_host={HTTP_MAX_CONNECTIONS_PER_HOST}"
+        )
+    return _client
+
+
+def get_response_cache() -> HTTPResponseCache | None:
+    global _response_cache
+    if HTTP_CACHE_ENABLED and _response_cache is None:
+        _response_cache = HTTPResponseCache(
+            max_entries=HTTP_CACHE_MAX_ENTRIES,
+            db_path=HTTP_CACHE_DB_PATH or None,
+            ttl_overrides=HTTP_CACHE_TTL_OVERRIDES,
+            stale_ttl=HTTP_CACHE_STALE_TTL,
+        )
+        report_stats("http_cache", _response_cache)
+    return _response_cache
+
+
+async def close_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+        _host_slots.clear()
+        logger.info("HTTP client closed")
+
+
+@asynccontextmanager
+async def http_client_lifespan(_app: Any = None) -> AsyncIterator[None]:
+    """
+    Lifespan hook (FastAPI or FastMCP) that opens the pooled client on startup and
+    closes its connections on shutdown. In between, expired cache rows are purged
+    every CACHE_MAINTENANCE_INTERVAL seconds.
+    """
+    get_client()
+    maintenance = asyncio.create_task(maintain_caches(CACHE_MAINTENANCE_INTERVAL))
+    try:
+        yield
+    finally:
+        maintenance.cancel()
+        stats = cache_stats()
+        if stats:
+            logger.info(f"Cache stats at shutdown | {stats}")
+        await close_client()
+
+
+async def _get(url: str, params: dict, headers: dict, timeout: float) -> httpx.Response:
+    host = urlparse(url).netloc
+    if host not in _host_slots:
+        _host_slots[host] = asyncio.Semaphore(HTTP_MAX_CONNECTIONS_PER_HOST)
+    # a hedged duplicate takes another pooled connection while the first is busy
+    async with _host_slots[host]:
+        return await get_client().get(
+            url,
+            params=params,
+            headers=headers,
+            timeout=httpx.Timeout(
+                timeout, connect=HTTP_CONNECT_TIMEOUT, pool=HTTP_POOL_TIMEOUT
+            ),
+        )
+
+
+def _is_throttled(error: Exception) -> bool:
+    return (
+        isinstance(error, httpx.HTTPStatusError)
+        and error.response.status_code == 429
+    )
 
 
 async def async_get(
     url: str,
     params: dict = None,
     headers: dict = None,
-    timeout: int = DEFAULT_TIMEOUT,
+    timeout: float = DEFAULT_TIMEOUT,
 ) -> dict:
-    for attempt in range(1, MAX_RETRIES + 1):
+    cache = get_response_cache()
+    cached = cache.lookup(url, params) if cache else None
+    if cached is not None:
+        if cache.is_fresh(cached):
+            logger.info(f"ASYNC GET {url} | served from response cache")
+            return cached["body"]
+        if cached.get("etag"):
+            headers = {**(headers or {}), "If-None-Match": cached["etag"]}
+
+    host = urlparse(url).netloc
+    breaker = get_breaker(
+        host, HTTP_BREAKER_THRESHOLD, HTTP_BREAKER_RESET, HTTP_BREAKER_DB_PATH or None
+    )
+    deadline = retry_policy.deadline()
+
+    for attempt in range(1, retry_policy.max_attempts + 1):
+        if not breaker.allow():
+            logger.warning(f"ASYNC GET {url} | circuit open for {host} — failing fast")
+            return {"error": f"Circuit open for {host}"}
+
+        # an attempt never outlives the remaining retry budget
+        attempt_timeout = max(min(timeout, deadline - time.monotonic()), 0.1)
         try:
             start = time.time()
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    url, params=params, headers=headers, timeout=timeout
+            if HEDGE_HTTP_CALLS:
+                hedger = get_hedger(f"http:{host}")
+                response = await hedger.run(
+                    lambda: _get(url, params=params, headers=headers, timeout=attempt_timeout)
+                )
+            else:
+                response = await _get(
+                    url, params=params, headers=headers, timeout=attempt_timeout
                 )
             latency = round(time.time() - start, 3)
 
             logger.info(
                 f"ASYNC GET {url} | status={response.status_code} | latency={latency}s | attempt={attempt}"
             )
+            if response.status_code == 304 and cached is not None:
+                breaker.record_success()
+                return cache.revalidated(url, params, response.headers, cached)
             response.raise_for_status()
-            return response.json()
+            data = response.json()
+            breaker.record_success()
+            if cache:
+                cache.store_response(url, params, response.headers, data)
+            return data
         except Exception as e:
+            retryable = retry_policy.is_retryable(e)
+            # 4xx and bad payloads mean the provider is up; 429 is throttling, not an outage
+            if retryable and not _is_throttled(e):
+                breaker.record_failure()
+            elif not retryable:
+                breaker.record_success()
+
             logger.warning(
-                f"ASYNC GET {url} | attempt {attempt}/{MAX_RETRIES} failed: {e}"
+                f"ASYNC GET {url} | attempt {attempt}/{retry_policy.max_attempts} failed "
+                f"| retryable={retryable} | error={e}"
             )
-            if attempt < MAX_RETRIES:
-                sleep_time = BACKOFF_FACTOR**attempt
-                logger.info(f"Retrying in {sleep_time:.1f}s...")
-                await asyncio.sleep(sleep_time)
-            else:
+            if not retryable:
+                return {"error": str(e)}
+
+            sleep_time = retry_policy.backoff(attempt, retry_policy.retry_after(e))
+            if (
+                attempt == retry_policy.max_attempts
+                or time.monotonic() + sleep_time >= deadline
+            ):
                 logger.error(
-                    f"ASYNC GET {url} | All {MAX_RETRIES} attempts exhausted: {e}"
+                    f"ASYNC GET {url} | giving up after {attempt} attempts "
+                    f"(budget={retry_policy.budget}s): {e}"
                 )
                 return {"error": str(e)}
+            logger.info(f"Retrying in {sleep_time:.2f}s...")
+            await asyncio.sleep(sleep_time)
@@ -0,0 +1,157 @@
+import datetime
+from collections.abc import Sequence
+from typing import Any
+import numpy as np
+from utils.catalog import CatalogIndex, field_values
+
+# recurrence -> numpy unit and step of one repeat
+RECURRENCES = {"daily": ("D", 1), "weekly": ("D", 7), "monthly": ("M", 1), "yearly": ("M", 12)}
+
+
+def to_days(values: Sequence[Any]) -> np.ndarray:
+    """
+    ISO dates ("2026-01-25", or timestamps) -> datetime64[D]; a missing or
+    unparseable date becomes NaT.
+    """
+    days = np.full(len(values), np.datetime64("NaT"), dtype="datetime64[D]")
+    for i, value in enumerate(values):
+        if value:
+            try:
+                days[i] = np.datetime64(str(value)[:10], "D")
+            except ValueError:
+                continue
+    return days
+
+
+def day_number(value: Any) -> int | None:
+    """
+    A date as days since the epoch, or None when missing or unparseable.
+    """
+    day = to_days([value])[0]
+    return None if np.isnat(day) else int(day.astype(np.int64))
+
+
+def occurrences(start: np.datetime64, end: np.datetime64, recurrence: str | None, until: np.datetime64):
+    """
+    (start, end) day pairs of an event: once, or repeated daily/weekly/monthly/
+    yearly from start through until, each lasting as long as the first.
+    """
+    if recurrence not in RECURRENCES:
+        return [(start, end)]
+    unit, step = RECURRENCES[recurrence]
+    length = end - start
+    if unit == "D":
+        starts = np.arange(start, until + 1, step, dtype="datetime64[D]")
+    else:
+        # same day of the month, clamped to the month's last day
+        first = start.astype("datetime64[M]")
+        months = np.arange(first, until.astype("datetime64[M]") + 1, step)
+        last_days = (months + 1).astype("datetime64[D]") - 1
+        starts = np.minimum(months.astype("datetime64[D]") + (start - first.astype("datetime64[D]")), last_days)
+        starts = starts[starts <= until]
+    return [(s, s + length) for s in starts]
+
+
+class IntervalIndex:
+    """
+    Static interval index: intervals sorted by start plus the longest length, so
+    the intervals overlapping [low, high] are those starting in
+    [low - longest, high] (two binary searches) whose end reaches low.
+    """
+
+    def __init__(self, starts: np.ndarray, ends: np.ndarray, rows: np.ndarray):
+        order = np.argsort(starts, kind="stable")
+        self.starts = np.asarray(starts, dtype=np.int64)[order]
+        self.ends = np.asarray(ends, dtype=np.int64)[order]
+        self.rows = np.asarray(rows, dtype=np.int32)[order]
+        self.longest = int((self.ends - self.starts).max()) if len(order) else 0
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def overlapping(self, low: int | None, high: int | None) -> np.ndarray:
+        """
+        Positions of the intervals overlapping [low, high] (inclusive; a missing bound
+        is open), in start order. Index rows, starts and ends with them.
+        """
+        first = 0 if low is None else int(np.searchsorted(self.starts, low - self.longest, side="left"))
+        stop = len(self.starts) if high is None else int(np.searchsorted(self.starts, high, side="right"))
+        positions = np.arange(first, stop)
+        if low is not None:
+            positions = positions[self.ends[first:stop] >= low]
+        return positions
+
+
+class EventCalendar:
+    """
+    Date index over a catalog of events with a date, an optional end_date
+    (multi-day events) and an optional recurrence ("weekly", until a date or for
+    horizon_days past today). Recurring events are expanded into occurrences
+    once, and each place key of the catalog gets an IntervalIndex over its
+    events' occurrences.
+    """
+
+    def __init__(self, catalog: CatalogIndex, horizon_days: int = 730):
+        records = catalog.records
+        starts = to_days(field_values(records, "date"))
+        ends = to_days(field_values(records, "end_date"))
+        ends = np.where(np.isnat(ends) | (ends < starts), starts, ends)
+        untils = to_days(field_values(records, "until"))
+        recurrences = field_values(records, "recurrence")
+
+        horizon = np.datetime64(datetime.date.today(), "D") + horizon_days
+        occurrence_rows, occurrence_starts, occurrence_ends = [], [], []
+        for row in np.flatnonzero(~np.isnat(starts)).tolist():
+            until = horizon if np.isnat(untils[row]) else untils[row]
+            for start, end in occurrences(starts[row], ends[row], recurrences[row], until):
+                occurrence_rows.append(row)
+                occurrence_starts.append(start)
+                occurrence_ends.append(end)
+        self.catalog = catalog
+        self.occurrences = len(occurrence_rows)
+        rows = np.asarray(occurrence_rows, dtype=np.int32)
+        begin = np.asarray(occurrence_starts, dtype="datetime64[D]").astype(np.int64)
+        end = np.asarray(occurrence_ends, dtype="datetime64[D]").astype(np.int64)
+
+        # occurrences grouped by row, so a place's occurrences are gathered by slices
+        order = np.argsort(rows, kind="stable")
+        rows, begin, end = rows[order], begin[order], end[order]
+        counts = np.bincount(rows, minlength=len(records))
+        offsets = np.concatenate([[0], np.cumsum(counts)])
+
+        def gather(place_rows: np.ndarray) -> IntervalIndex:
+            lengths = counts[place_rows]
+            firsts = np.repeat(offsets[place_rows] - np.cumsum(lengths) + lengths, lengths)
+            positions = firsts + np.arange(int(lengths.sum()))
+            return IntervalIndex(begin[positions], end[positions], rows[positions])
+
+        self.everywhere = IntervalIndex(begin, end, rows)
+        self.by_place = {key: gather(place_rows) for key, place_rows in catalog.by_place.items()}
+
+    def between(
+        self, place: str | None, start_date: str | None, end_date: str | None
+    ) -> list[tuple[int, str, str]]:
+        """
+        (row, occurrence start, occurrence end) for each event in place with an
+        occurrence overlapping [start_date, end_date], by date; a recurring event is
+        listed once, at its first overlapping occurrence. A missing (or unparseable)
+        date leaves that side open.
+        """
+        if place is None:
+            index = self.everywhere
+        else:
+            key = self.catalog.resolve_place(place)
+            if key is None:
+                return []
+            index = self.by_place[key]
+        low, high = day_number(start_date), day_number(end_date)
+        found: dict[int, tuple[int, str, str]] = {}
+        for position in index.overlapping(low, high).tolist():
+            row = int(index.rows[position])
+            if row not in found:
+                found[row] = (
+                    row,
+                    str(np.datetime64(int(index.starts[position]), "D")),
+                    str(np.datetime64(int(index.ends[position]), "D")),
+                )
+        return list(found.values())
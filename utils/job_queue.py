@@ -0,0 +1,139 @@
+import asyncio
+import time
+from collections import OrderedDict, deque
+from typing import Any, Awaitable, Callable
+from models.plan_job import PlanJob
+from utils.error_handler import CapacityError
+from utils.logger import get_logger
+from utils.metrics import summarize
+
+logger = get_logger("PlanJobQueue")
+
+
+class PlanJobQueue:
+    """
+    Bounded in-process job queue drained by a fixed pool of workers, so bursts of
+    plan submissions wait in line instead of starting unbounded concurrent graphs.
+    """
+
+    def __init__(
+        self,
+        run: Callable[[str, Any], Awaitable[dict[str, Any]]],
+        workers: int = 4,
+        max_queue: int = 100,
+        history_limit: int = 1000,
+    ):
+        self.run = run
+        self.workers = workers
+        self.max_queue = max_queue
+        self.history_limit = history_limit
+        self.queue: asyncio.Queue[tuple[str, Any]] = asyncio.Queue(maxsize=max_queue)
+        self.jobs: OrderedDict[str, PlanJob] = OrderedDict()
+        self.idempotency_keys: OrderedDict[str, str] = OrderedDict()
+        self._tasks: list[asyncio.Task] = []
+        self.running = 0
+        self.counters = {"submitted": 0, "succeeded": 0, "failed": 0, "rejected": 0}
+        self.wait_times: deque[float] = deque(maxlen=1000)
+
+    async def start(self) -> None:
+        self._tasks = [
+            asyncio.create_task(self._worker(i)) for i in range(self.workers)
+        ]
+        logger.info(
+            f"PlanJobQueue started | workers={self.workers} | max_queue={self.max_queue}"
+        )
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logger.info(f"PlanJobQueue stopped | abandoned={self.queue.qsize()} queued jobs")
+
+    def submit(self, plan_id: str, payload: Any, idempotency_key: str | None = None) -> PlanJob:
+        if idempotency_key and idempotency_key in self.idempotency_keys:
+            existing = self.jobs.get(self.idempotency_keys[idempotency_key])
+            if existing:
+                logger.info(
+                    f"PlanJobQueue duplicate submit | key={idempotency_key} | plan_id={existing.plan_id}"
+                )
+                return existing
+
+        job = PlanJob(plan_id=plan_id, submitted_at=time.time())
+        try:
+            self.queue.put_nowait((plan_id, payload))
+        except asyncio.QueueFull:
+            self.counters["rejected"] += 1
+            logger.warning(f"PlanJobQueue full | depth={self.queue.qsize()} — rejecting")
+            raise CapacityError(
+                f"Plan queue is full ({self.max_queue} jobs)",
+                retry_after=self._retry_after(),
+            )
+
+        self.counters["submitted"] += 1
+        self._remember(job, idempotency_key)
+        logger.info(f"PlanJobQueue submitted | plan_id={plan_id} | depth={self.queue.qsize()}")
+        return job
+
+    def get(self, plan_id: str) -> PlanJob | None:
+        return self.jobs.get(plan_id)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "running": self.running,
+            "queue_depth": self.queue.qsize(),
+            "max_queue": self.max_queue,
+            **self.counters,
+            "wait_seconds": summarize(self.wait_times),
+        }
+
+    def _remember(self, job: PlanJob, idempotency_key: str | None) -> None:
+        self.jobs[job.plan_id] = job
+        if idempotency_key:
+            self.idempotency_keys[idempotency_key] = job.plan_id
+        while len(self.jobs) > self.history_limit:
+            oldest = next(iter(self.jobs.values()))
+            if oldest.status in ("queued", "running"):
+                break
+            self.jobs.popitem(last=False)
+        while len(self.idempotency_keys) > self.history_limit:
+            self.idempotency_keys.popitem(last=False)
+
+    def _retry_after(self) -> int:
+        # rough time for the backlog to drain, from the recent wait times
+        if not self.wait_times:
+            return 1
+        return max(1, int(sum(self.wait_times) / len(self.wait_times)))
+
+    async def _worker(self, worker_id: int) -> None:
+        while True:
+            plan_id, payload = await self.queue.get()
+            job = self.jobs.get(plan_id)
+            if job is None:
+                job = PlanJob(plan_id=plan_id, submitted_at=time.time())
+                self.jobs[plan_id] = job
+            job.status = "running"
+            job.started_at = time.time()
+            self.wait_times.append(job.started_at - job.submitted_at)
+            self.running += 1
+            logger.info(
+                f"PlanJobQueue worker {worker_id} started | plan_id={plan_id} | waited={job.started_at - job.submitted_at:.3f}s"
+            )
+            try:
+                job.result = await self.run(plan_id, payload)
+                job.status = "succeeded"
+                self.counters["succeeded"] += 1
+            except asyncio.CancelledError:
+                job.status = "failed"
+                job.error = "Cancelled during shutdown"
+                raise
+            except Exception as e:
+                logger.error(f"PlanJobQueue job failed | plan_id={plan_id} | error={e}")
+                job.status = "failed"
+                job.error = str(e)
+                self.counters["failed"] += 1
+            finally:
+                job.finished_at = time.time()
+                self.running -= 1
+                self.queue.task_done()
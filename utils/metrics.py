@@ -0,0 +1,20 @@
+from typing import Iterable
+
+
+def percentile(samples: Iterable[float], q: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    return ordered[int(q / 100 * (len(ordered) - 1))]
+
+
+def summarize(samples: Iterable[float]) -> dict[str, float]:
+    ordered = sorted(samples)
+    if not ordered:
+        return {"avg": 0.0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+    return {
+        "avg": round(sum(ordered) / len(ordered), 3),
+        "p50": round(percentile(ordered, 50), 3),
+        "p95": round(percentile(ordered, 95), 3),
+        "max": round(ordered[-1], 3),
+    }
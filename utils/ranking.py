@@ -0,0 +1,98 @@
+from typing import Any
+import numpy as np
+from config import RANK_WEIGHTS, RANK_TOP_K, RANK_DISTANCE_SCALE_KM
+
+
+def column(records: list[dict[str, Any]], field: str) -> np.ndarray:
+    """
+    A record field as float64, NaN where missing or not numeric ("2.5 km" too).
+    """
+    values = np.full(len(records), np.nan)
+    for i, record in enumerate(records):
+        value = record.get(field)
+        if isinstance(value, str):
+            value = value.split()[0] if value.split() else None
+        try:
+            values[i] = float(value)
+        except (TypeError, ValueError):
+            continue
+    return values
+
+
+class Ranker:
+    """
+    Scores search results server-side so prompts only carry the best candidates.
+    Each component is normalized to 0..1 and the score is their weighted mean over
+    the components the results actually have:
+
+    - rating: rating / scale
+    - price: 1 when free, 0.5 at the budget, falling to 0 at 1.5x the budget
+    - distance: 1 / (1 + km / distance_scale_km)
+    - preference: preference match score / best match score in the results
+    """
+
+    def __init__(
+        self,
+        weights: dict[str, float],
+        top_k: int = 10,
+        distance_scale_km: float = 5.0,
+    ):
+        self.weights = weights
+        self.top_k = top_k
+        self.distance_scale_km = distance_scale_km
+
+    def components(
+        self,
+        records: list[dict[str, Any]],
+        rating: tuple[str, float] | None = None,
+        price: tuple[str, float | None] | None = None,
+        distance: tuple[str, float] | None = None,
+        preference: str | None = None,
+    ) -> dict[str, np.ndarray]:
+        components = {}
+        if rating:
+            field, scale = rating
+            components["rating"] = np.clip(column(records, field) / scale, 0, 1)
+        if price and price[1]:
+            field, budget = price
+            share = column(records, field) / budget
+            components["price"] = np.where(share <= 1, 1 - 0.5 * share, np.maximum(0, 0.5 - (share - 1)))
+        if distance:
+            field, km_per_unit = distance
+            components["distance"] = 1 / (1 + column(records, field) * km_per_unit / self.distance_scale_km)
+        if preference:
+            matches = column(records, preference)
+            if np.nanmax(matches, initial=0) > 0:
+                components["preference"] = matches / np.nanmax(matches)
+        # a component no result has says nothing about their order
+        return {name: values for name, values in components.items() if not np.isnan(values).all()}
+
+    def rank(self, records: list[dict[str, Any]], k: int | None = None, **fields) -> list[dict[str, Any]]:
+        """
+        The k best records (top_k by default), best first, each copied with its
+        "score". fields name the record fields behind each component, e.g.
+        rating=("review_score", 10), price=("min_total_price", budget),
+        distance=("distance", 0.001) for meters, preference="match_score".
+        Ties keep the incoming order.
+        """
+        k = self.top_k if k is None else k
+        if not records or k <= 0:
+            return []
+        components = self.components(records, **fields)
+        total = sum(self.weights.get(name, 0.0) for name in components)
+        if not total:
+            return [dict(record) for record in records[:k]]
+        scores = sum(
+            self.weights.get(name, 0.0) * np.nan_to_num(values) for name, values in components.items()
+        ) / total
+        picked = np.arange(len(records))
+        if k < len(records):
+            # partial sort: only the k best are ordered; every record tied with the
+            # k-th score stays a candidate so ties keep the incoming order
+            kth = -np.partition(-scores, k - 1)[k - 1]
+            picked = np.flatnonzero(scores >= kth)
+        picked = picked[np.lexsort((picked, -scores[picked]))][:k]
+        return [{**records[i], "score": round(float(scores[i]), 3)} for i in picked.tolist()]
+
+
+ranker = Ranker(RANK_WEIGHTS, RANK_TOP_K, RANK_DISTANCE_SCALE_KM)
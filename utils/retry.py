@@ -0,0 +1,60 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+import httpx
+
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+class RetryPolicy:
+    """
+    Decides whether a failed provider call is worth retrying and how long to wait.
+    Only transport errors, 5xx and 429 are retried; waits use full jitter so
+    clients hitting the same outage do not retry in lockstep, a Retry-After from
+    the provider wins when given, and all attempts share one time budget.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 10.0,
+        budget: float = 20.0,
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget
+
+    @staticmethod
+    def is_retryable(error: Exception) -> bool:
+        if isinstance(error, httpx.LocalProtocolError):
+            # a malformed request on our side fails the same way every time
+            return False
+        if isinstance(error, httpx.TransportError):
+            return True
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in RETRYABLE_STATUS
+        return False
+
+    @staticmethod
+    def retry_after(error: Exception) -> float | None:
+        if not isinstance(error, httpx.HTTPStatusError):
+            return None
+        value = error.response.headers.get("retry-after")
+        if not value:
+            return None
+        if value.strip().isdigit():
+            return float(value)
+        try:
+            return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+        except (TypeError, ValueError):
+            return None
+
+    def backoff(self, attempt: int, retry_after: float | None = None) -> float:
+        if retry_after is not None:
+            return retry_after + random.uniform(0, self.base_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+    def deadline(self) -> float:
+        return time.monotonic() + self.budget
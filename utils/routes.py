@@ -0,0 +1,218 @@
+import heapq
+from collections import defaultdict
+from collections.abc import Sequence
+from typing import Any
+import numpy as np
+from utils.catalog import Record, field_values, normalize_place
+from utils.intervals import day_number
+
+MINUTES_PER_DAY = 24 * 60
+
+
+def to_minutes(values: Sequence[str | None]) -> np.ndarray:
+    """
+    ISO timestamps ("2025-12-01T09:00") -> int64 minutes since the epoch; a missing
+    or unparseable time becomes -1.
+    """
+    try:
+        times = np.array(values, dtype="datetime64[m]")
+    except (TypeError, ValueError):
+        times = np.array([_parse(value) for value in values], dtype="datetime64[m]")
+    return np.where(np.isnat(times), -1, times.astype(np.int64))
+
+
+def _parse(value: Any) -> np.datetime64:
+    try:
+        return np.datetime64(value, "m")
+    except (TypeError, ValueError):
+        return np.datetime64("NaT")
+
+
+def day_bounds(date: str | None) -> tuple[int, int] | None:
+    """
+    [start, end) of a date in minutes since the epoch, or None when the date is
+    missing or unparseable (no date: every departure).
+    """
+    day = day_number(date)
+    if day is None:
+        return None
+    return day * MINUTES_PER_DAY, (day + 1) * MINUTES_PER_DAY
+
+
+def format_duration(minutes: int) -> str:
+    return f"{minutes // 60}h {minutes % 60:02d}m"
+
+
+class RouteIndex:
+    """
+    Timetable index over scheduled legs (flights, trains) from several catalogs.
+    Legs are grouped per (origin, destination) and per origin, each group sorted by
+    departure, so a route on a date or the legs leaving a city in a time window are
+    two binary searches away. connections() runs a Dijkstra search over legs for
+    trips with no direct service.
+    """
+
+    def __init__(self, sources: dict[str, Sequence[Record]]):
+        """
+        sources maps a mode name ("flight", "train") to records with from, to,
+        departure, arrival and price fields.
+        """
+        self.sources = sources
+        self.modes: list[str] = []
+        self.source_rows: list[int] = []
+        origins: list[str] = []
+        destinations: list[str] = []
+        departures: list[Any] = []
+        arrivals: list[Any] = []
+        prices: list[Any] = []
+        for mode, records in sources.items():
+            self.modes += [mode] * len(records)
+            self.source_rows += range(len(records))
+            origins += [normalize_place(v or "") for v in field_values(records, "from")]
+            destinations += [normalize_place(v or "") for v in field_values(records, "to")]
+            departures += list(field_values(records, "departure"))
+            arrivals += list(field_values(records, "arrival"))
+            prices += [np.nan if v is None else v for v in field_values(records, "price")]
+
+        self.origins = origins
+        self.destinations = destinations
+        self.departure = to_minutes(departures)
+        self.arrival = to_minutes(arrivals)
+        self.price = np.asarray(prices, dtype=np.float64)
+
+        by_route: dict[tuple[str, str], list[int]] = defaultdict(list)
+        by_origin: dict[str, list[int]] = defaultdict(list)
+        for leg in np.flatnonzero((self.departure >= 0) & (self.arrival >= self.departure)).tolist():
+            by_route[(origins[leg], destinations[leg])].append(leg)
+            by_origin[origins[leg]].append(leg)
+        # key -> (legs, their departures), both ordered by departure
+        self.by_route = {key: self._sorted(legs) for key, legs in by_route.items()}
+        self.by_origin = {key: self._sorted(legs) for key, legs in by_origin.items()}
+
+    def _sorted(self, legs: list[int]) -> tuple[np.ndarray, np.ndarray]:
+        legs = np.asarray(legs, dtype=np.int32)
+        legs = legs[np.argsort(self.departure[legs], kind="stable")]
+        return legs, self.departure[legs]
+
+    def __len__(self) -> int:
+        return len(self.modes)
+
+    def record(self, leg: int) -> Record:
+        mode = self.modes[leg]
+        return {**self.sources[mode][self.source_rows[leg]], "mode": mode}
+
+    def _window(
+        self, group: tuple[np.ndarray, np.ndarray] | None, earliest: int, latest: int
+    ) -> np.ndarray:
+        if group is None:
+            return np.empty(0, dtype=np.int32)
+        legs, departures = group
+        start, stop = np.searchsorted(departures, [earliest, latest], side="left")
+        return legs[start:stop]
+
+    def direct(
+        self, origin: str, destination: str, date: str | None = None, mode: str | None = None
+    ) -> list[Record]:
+        """
+        Legs from origin to destination departing on date (any date when missing or
+        unparseable), by departure time, optionally of one mode only.
+        """
+        group = self.by_route.get((normalize_place(origin), normalize_place(destination)))
+        if group is None:
+            return []
+        bounds = day_bounds(date)
+        legs = group[0] if bounds is None else self._window(group, *bounds)
+        return [self.record(leg) for leg in legs.tolist() if mode is None or self.modes[leg] == mode]
+
+    def connections(
+        self,
+        origin: str,
+        destination: str,
+        date: str | None = None,
+        optimize: str = "earliest",
+        min_layover: int = 60,
+        max_layover: int = 36 * 60,
+        max_legs: int = 3,
+        limit: int = 5,
+    ) -> list[dict[str, Any]]:
+        """
+        Up to limit itineraries from origin to destination whose first leg departs on
+        date (any date when missing or unparseable), best first: earliest arrival
+        (then price) or cheapest (then arrival). Each change of leg leaves
+        min_layover to max_layover minutes; no city is visited twice.
+
+        Search states are (leg, legs taken so far). Both objectives only grow along
+        an itinerary, so the first time a leg into the destination is popped its
+        itinerary is final, and popping continues for the next-best ones.
+        """
+        if optimize not in ("earliest", "cheapest"):
+            raise ValueError(f"optimize must be 'earliest' or 'cheapest', not {optimize!r}")
+        origin, destination = normalize_place(origin), normalize_place(destination)
+        group = self.by_origin.get(origin)
+        if group is None or origin == destination:
+            return []
+        bounds = day_bounds(date)
+        first = group[0] if bounds is None else self._window(group, *bounds)
+
+        def key(leg: int, price: float) -> tuple[float, float]:
+            arrival = float(self.arrival[leg])
+            return (arrival, price) if optimize == "earliest" else (price, arrival)
+
+        best: dict[tuple[int, int], tuple[float, float]] = {}
+        parent: dict[tuple[int, int], tuple[int, int] | None] = {}
+        heap: list[tuple[tuple[float, float], int, int]] = []
+        for leg in first.tolist():
+            label = key(leg, float(np.nan_to_num(self.price[leg])))
+            best[(leg, 1)], parent[(leg, 1)] = label, None
+            heapq.heappush(heap, (label, leg, 1))
+
+        found = []
+        while heap and len(found) < limit:
+            label, leg, taken = heapq.heappop(heap)
+            if best[(leg, taken)] < label:
+                continue
+            path = self._path(parent, (leg, taken))
+            if self.destinations[leg] == destination:
+                found.append(self._itinerary(path))
+                continue
+            if taken >= max_legs:
+                continue
+            visited = {origin, *(self.destinations[step] for step in path)}
+            price = label[1] if optimize == "earliest" else label[0]
+            arrival = int(self.arrival[leg])
+            window = self._window(
+                self.by_origin.get(self.destinations[leg]), arrival + min_layover, arrival + max_layover + 1
+            )
+            for nxt in window.tolist():
+                if self.destinations[nxt] in visited:
+                    continue
+                state = (nxt, taken + 1)
+                candidate = key(nxt, price + float(np.nan_to_num(self.price[nxt])))
+                if state not in best or candidate < best[state]:
+                    best[state], parent[state] = candidate, (leg, taken)
+                    heapq.heappush(heap, (candidate, nxt, taken + 1))
+        return found
+
+    def _path(
+        self, parent: dict[tuple[int, int], tuple[int, int] | None], state: tuple[int, int]
+    ) -> list[int]:
+        path = []
+        while state is not None:
+            path.append(state[0])
+            state = parent[state]
+        return path[::-1]
+
+    def _itinerary(self, path: list[int]) -> dict[str, Any]:
+        legs = [self.record(leg) for leg in path]
+        departure, arrival = int(self.departure[path[0]]), int(self.arrival[path[-1]])
+        return {
+            "from": legs[0].get("from"),
+            "to": legs[-1].get("to"),
+            "departure": legs[0].get("departure"),
+            "arrival": legs[-1].get("arrival"),
+            "duration": format_duration(arrival - departure),
+            "price": round(float(np.nansum(self.price[path])), 2),
+            "currency": legs[0].get("currency"),
+            "transfers": len(path) - 1,
+            "legs": legs,
+        }
@@ -0,0 +1,160 @@
+import math
+import re
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from collections.abc import Sequence
+from typing import Any, Iterable
+import numpy as np
+
+TOKEN = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset(
+    "a an and any at by for from in into is it near of on or over some the to with".split()
+)
+
+
+def stem(token: str) -> str:
+    """
+    Light plural folding: "temples" -> "temple", "galleries" -> "gallery".
+    """
+    if len(token) > 4 and token.endswith("ies"):
+        return token[:-3] + "y"
+    if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str) -> list[str]:
+    return [stem(t) for t in TOKEN.findall(str(text).lower()) if t not in STOPWORDS]
+
+
+def split_terms(value: str | Sequence[str] | None) -> list[str]:
+    """
+    Preferences as a list, or as the comma-separated string they travel as in a
+    query string.
+    """
+    if not value:
+        return []
+    items = value.split(",") if isinstance(value, str) else value
+    return [item.strip() for item in items if item and item.strip()]
+
+
+def flatten_text(value: Any) -> str:
+    """
+    Field value -> indexable text; lists and dicts (Yelp categories) are joined.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, dict):
+        return " ".join(flatten_text(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return " ".join(flatten_text(v) for v in value)
+    return str(value)
+
+
+class TextIndex:
+    """
+    Inverted index with BM25 scoring. Each term maps to the rows containing it and
+    their (field-weighted) term frequencies. A query term also matches indexed terms
+    sharing its prefix ("history" -> "historic") and, through synonyms, related
+    terms ("history" -> "fort"), both at a lower weight.
+    """
+
+    def __init__(
+        self,
+        documents: Iterable[Iterable[tuple[str, float]]],
+        k1: float = 1.2,
+        b: float = 0.75,
+        prefix_weight: float = 0.5,
+        synonyms: dict[str, str] | None = None,
+        synonym_weight: float = 0.5,
+    ):
+        """
+        documents yields, per row, its (text, weight) pairs, e.g. the name at 2.0
+        and the description at 1.0.
+        """
+        self.k1, self.b, self.prefix_weight = k1, b, prefix_weight
+        self.synonyms = {stem(word): tokenize(text) for word, text in (synonyms or {}).items()}
+        self.synonym_weight = synonym_weight
+        postings: dict[str, tuple[list[int], list[float]]] = defaultdict(lambda: ([], []))
+        lengths = []
+        for row, fields in enumerate(documents):
+            counts: Counter[str] = Counter()
+            for text, weight in fields:
+                for token in tokenize(text):
+                    counts[token] += weight
+            for term, tf in counts.items():
+                rows, tfs = postings[term]
+                rows.append(row)
+                tfs.append(tf)
+            lengths.append(sum(counts.values()))
+
+        self.rows = len(lengths)
+        self.lengths = np.asarray(lengths, dtype=np.float32)
+        self.average_length = float(self.lengths.mean()) if self.rows else 0.0
+        self.postings = {
+            term: (np.asarray(rows, dtype=np.int32), np.asarray(tfs, dtype=np.float32))
+            for term, (rows, tfs) in postings.items()
+        }
+        self.vocabulary = sorted(self.postings)
+
+    def expand(self, term: str) -> list[tuple[str, float]]:
+        """
+        (indexed term, weight) pairs a query term matches: itself, then terms that
+        start with all but its last two characters (at least four).
+        """
+        matches = [(term, 1.0)] if term in self.postings else []
+        prefix = term[: max(4, len(term) - 2)]
+        if len(prefix) < 4:
+            return matches
+        i = bisect_left(self.vocabulary, prefix)
+        while i < len(self.vocabulary) and self.vocabulary[i].startswith(prefix):
+            if self.vocabulary[i] != term:
+                matches.append((self.vocabulary[i], self.prefix_weight))
+            i += 1
+        return matches
+
+    def query_terms(self, query: str | Sequence[str]) -> dict[str, float]:
+        """
+        Indexed terms the query matches and their weights, the highest weight winning
+        when a term is reached several ways.
+        """
+        text = query if isinstance(query, str) else " ".join(query)
+        words = {token: 1.0 for token in tokenize(text)}
+        for token in list(words):
+            for synonym in self.synonyms.get(token, []):
+                words.setdefault(synonym, self.synonym_weight)
+        terms: dict[str, float] = {}
+        for word, weight in words.items():
+            for term, match in self.expand(word):
+                terms[term] = max(terms.get(term, 0.0), weight * match)
+        return terms
+
+    def scores(self, query: str | Sequence[str]) -> np.ndarray:
+        """
+        BM25 score of every row for the query (one string or several phrases);
+        rows matching no term score 0.
+        """
+        scores = np.zeros(self.rows, dtype=np.float32)
+        if not self.rows:
+            return scores
+        for term, weight in self.query_terms(query).items():
+            rows, tfs = self.postings[term]
+            idf = math.log(1 + (self.rows - len(rows) + 0.5) / (len(rows) + 0.5))
+            norm = self.k1 * (1 - self.b + self.b * self.lengths[rows] / self.average_length)
+            scores[rows] += weight * idf * tfs * (self.k1 + 1) / (tfs + norm)
+        return scores
+
+    def search(
+        self, query: str | Sequence[str], rows: np.ndarray | None = None, k: int | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Rows (of the given candidates, or all) matching the query, best first, with
+        their scores; at most k when given.
+        """
+        scores = self.scores(query)
+        candidates = np.arange(self.rows, dtype=np.int32) if rows is None else np.asarray(rows, dtype=np.int32)
+        candidates = candidates[scores[candidates] > 0]
+        if k is not None and k < len(candidates):
+            candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        ranked = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return ranked, scores[ranked]